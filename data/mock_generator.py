@@ -1,7 +1,8 @@
 import random
 import datetime
 import pandas as pd
-from utils import get_random_ip, get_random_mac
+import numpy as np
+from utils import get_random_ip, get_random_mac, get_random_ips, get_random_macs
 
 def generate_security_events(num_events=10):
     """
@@ -106,7 +107,7 @@ def generate_system_metrics(num_points=60, server_id=None):
     # Generate timestamps
     end_time = datetime.datetime.now()
     start_time = end_time - datetime.timedelta(minutes=num_points)
-    timestamps = [start_time + datetime.timedelta(minutes=i) for i in range(num_points)]
+    timestamps = pd.date_range(start=start_time, periods=num_points, freq='min')
     
     # Base values and trends for realistic data generation
     base_cpu = random.uniform(20, 40)
@@ -197,14 +198,18 @@ def generate_network_traffic(hours=24, count=None):
         timestamps.sort()
     else:
         # Otherwise use 15-minute intervals
-        timestamps = [start_time + datetime.timedelta(minutes=i*15) for i in range(hours*4)]  # 15-minute intervals
+        timestamps = pd.date_range(start=start_time, periods=hours*4, freq='15min')
     
     # Base values for traffic
     base_inbound = random.uniform(50, 200)
     base_outbound = random.uniform(30, 150)
     
+    # Source and destination addresses for every record, drawn in bulk
+    source_ips = get_random_ips(len(timestamps))
+    destination_ips = get_random_ips(len(timestamps))
+    
     # Time-of-day effect (business hours have higher traffic)
-    for timestamp in timestamps:
+    for timestamp, source_ip, destination_ip in zip(timestamps, source_ips, destination_ips):
         hour = timestamp.hour
         
         # Business hours amplifier (9am-5pm)
@@ -227,8 +232,6 @@ def generate_network_traffic(hours=24, count=None):
         # Latency is typically in the range of milliseconds
         latency = random.uniform(5, 50)
         
-        source_ip = get_random_ip()
-        destination_ip = get_random_ip()
         protocol = random.choice(["TCP", "UDP", "ICMP", "HTTP", "HTTPS", "DNS", "SMTP", "SSH"])
         port = random.randint(1, 65535)
         bytes_transferred = int(max(inbound_traffic, outbound_traffic) * 1024 * 1024 / 8)  # Convert Mbps to bytes
@@ -256,7 +259,8 @@ def generate_topology_changes(num_changes=20):
         num_changes: Number of changes to generate
         
     Returns:
-        List of dictionaries containing topology change data
+        Dictionary of equal-length column lists containing topology change data,
+        with the timestamps as a datetime64 Series
     """
     change_types = [
         "Device Added", 
@@ -275,17 +279,22 @@ def generate_topology_changes(num_changes=20):
         "Workstation"
     ]
     
-    changes = []
+    changes = {
+        "change_id": [],
+        "change_type": [],
+        "device_id": [],
+        "device_type": [],
+        "details": []
+    }
+    minute_offsets = []
     
     # Generate changes over the last 30 days
     end_time = datetime.datetime.now()
     start_time = end_time - datetime.timedelta(days=30)
     
     for i in range(num_changes):
-        timestamp = start_time + datetime.timedelta(
-            days=random.randint(0, 29),
-            hours=random.randint(0, 23),
-            minutes=random.randint(0, 59)
+        minute_offsets.append(
+            random.randint(0, 29) * 1440 + random.randint(0, 23) * 60 + random.randint(0, 59)
         )
         
         change_type = random.choice(change_types)
@@ -313,14 +322,16 @@ def generate_topology_changes(num_changes=20):
                 new_status = random.choice(["Online", "Offline", "Degraded"])
             details = f"{device_type} status changed from {old_status} to {new_status}"
         
-        changes.append({
-            "change_id": f"CHG-{random.randint(10000, 99999)}",
-            "timestamp": timestamp,
-            "change_type": change_type,
-            "device_id": device_id,
-            "device_type": device_type,
-            "details": details
-        })
+        changes["change_id"].append(f"CHG-{random.randint(10000, 99999)}")
+        changes["change_type"].append(change_type)
+        changes["device_id"].append(device_id)
+        changes["device_type"].append(device_type)
+        changes["details"].append(details)
+    
+    # Build every timestamp in one vectorized step from the minute offsets
+    changes["timestamp"] = pd.Series(
+        pd.Timestamp(start_time) + pd.to_timedelta(minute_offsets, unit='min')
+    )
     
     return changes
 
@@ -332,7 +343,7 @@ def generate_device_inventory(num_devices=50):
         num_devices: Number of devices to generate
         
     Returns:
-        List of dictionaries containing device inventory data
+        Dictionary of equal-length column arrays containing device inventory data
     """
     device_types = [
         "Router", 
@@ -393,42 +404,50 @@ def generate_device_inventory(num_devices=50):
         "IoT Device": ["ESPHome 1.19.2", "Raspberry Pi OS Buster", "Arduino 1.8.13", "Contiki OS 3.0"]
     }
     
-    devices = []
+    rng = np.random.default_rng()
     
-    for i in range(num_devices):
-        device_type = random.choice(device_types)
-        manufacturer = random.choice(manufacturers)
-        model = random.choice(models.get(device_type, ["Generic Model"]))
-        
-        status = random.choices(statuses, status_weights)[0]
-        network = random.choice(networks)
-        location = random.choice(locations)
-        
-        ip_address = get_random_ip()
-        mac_address = get_random_mac()
-        
-        os_version = random.choice(os_versions.get(device_type, ["Generic OS 1.0"]))
-        
-        # Last updated typically within the last 7 days
-        last_updated = (datetime.datetime.now() - datetime.timedelta(
-            days=random.randint(0, 7),
-            hours=random.randint(0, 23),
-            minutes=random.randint(0, 59)
-        )).strftime("%Y-%m-%d %H:%M:%S")
-        
-        devices.append({
-            "device_id": f"DEV-{i+1:05d}",
-            "device_name": f"{location.lower()}-{device_type.lower()}-{i+1:03d}",
-            "device_type": device_type,
-            "manufacturer": manufacturer,
-            "model": model,
-            "status": status,
-            "ip_address": ip_address,
-            "mac_address": mac_address,
-            "network": network,
-            "location": location,
-            "os_version": os_version,
-            "last_updated": last_updated
-        })
+    # Lookup tables, indexed by the drawn device type
+    type_table = np.array(device_types)
+    model_table = np.array([models[device_type] for device_type in device_types])
+    os_table = np.array([os_versions[device_type] for device_type in device_types])
+    
+    # Draw every column at once
+    type_idx = rng.integers(0, len(device_types), num_devices)
+    types = type_table[type_idx]
+    manufacturer = rng.choice(manufacturers, size=num_devices)
+    model = model_table[type_idx, rng.integers(0, model_table.shape[1], num_devices)]
+    status = rng.choice(statuses, size=num_devices, p=status_weights)
+    network = rng.choice(networks, size=num_devices)
+    location = rng.choice(locations, size=num_devices)
+    os_version = os_table[type_idx, rng.integers(0, os_table.shape[1], num_devices)]
     
-    return devices
+    ip_addresses = get_random_ips(num_devices, rng)
+    mac_addresses = get_random_macs(num_devices, rng)
+    
+    # Last updated typically within the last 7 days
+    minute_offsets = (
+        rng.integers(0, 8, num_devices) * 1440
+        + rng.integers(0, 24, num_devices) * 60
+        + rng.integers(0, 60, num_devices)
+    )
+    last_updated = (pd.Timestamp.now() - pd.to_timedelta(minute_offsets, unit='min')).strftime("%Y-%m-%d %H:%M:%S")
+    
+    numbers = range(1, num_devices + 1)
+    
+    return {
+        "device_id": [f"DEV-{i:05d}" for i in numbers],
+        "device_name": [
+            f"{loc.lower()}-{device_type.lower()}-{i:03d}"
+            for loc, device_type, i in zip(location, types, numbers)
+        ],
+        "device_type": types,
+        "manufacturer": manufacturer,
+        "model": model,
+        "status": status,
+        "ip_address": ip_addresses,
+        "mac_address": mac_addresses,
+        "network": network,
+        "location": location,
+        "os_version": os_version,
+        "last_updated": list(last_updated)
+    }
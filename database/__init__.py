@@ -15,6 +15,8 @@ from .db_utils import (
 from .models import (
     DeviceStatus,
     AlertSeverity,
+    STATUS_BY_VALUE,
+    SEVERITY_BY_VALUE,
     NetworkDevice,
     DevicePerformanceMetric,
     SecurityEvent,
@@ -3,7 +3,7 @@ from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.ext.declarative import declarative_base
 import os
 import datetime
-from .models import Base, NetworkDevice, DevicePerformanceMetric, SecurityEvent, NetworkTraffic, TopologyChange, DeviceStatus, AlertSeverity, NetworkConfiguration
+from .models import Base, NetworkDevice, DevicePerformanceMetric, SecurityEvent, NetworkTraffic, TopologyChange, DeviceStatus, AlertSeverity, STATUS_BY_VALUE, SEVERITY_BY_VALUE, NetworkConfiguration
 
 # Get database URL from environment variables
 DATABASE_URL = os.environ.get('DATABASE_URL')
@@ -52,7 +52,7 @@ def add_network_device(device_data):
     try:
         # Convert string status to enum value
         if isinstance(device_data.get('status'), str):
-            device_data['status'] = DeviceStatus(device_data['status'])
+            device_data['status'] = STATUS_BY_VALUE[device_data['status']]
 
         device = NetworkDevice(**device_data)
         session.add(device)
@@ -75,7 +75,7 @@ def get_network_devices(filters=None):
             if 'device_type' in filters and filters['device_type']:
                 query = query.filter(NetworkDevice.device_type.in_(filters['device_type']))
             if 'status' in filters and filters['status']:
-                status_enums = [DeviceStatus(s) for s in filters['status']]
+                status_enums = [STATUS_BY_VALUE[s] for s in filters['status']]
                 query = query.filter(NetworkDevice.status.in_(status_enums))
             if 'network' in filters and filters['network']:
                 query = query.filter(NetworkDevice.network.in_(filters['network']))
@@ -102,7 +102,7 @@ def add_security_event(event_data):
     try:
         # Convert string severity to enum value
         if isinstance(event_data.get('severity'), str):
-            event_data['severity'] = AlertSeverity(event_data['severity'])
+            event_data['severity'] = SEVERITY_BY_VALUE[event_data['severity']]
 
         event = SecurityEvent(**event_data)
         session.add(event)
@@ -125,7 +125,7 @@ def get_security_events(filters=None):
             if 'event_type' in filters and filters['event_type']:
                 query = query.filter(SecurityEvent.event_type.in_(filters['event_type']))
             if 'severity' in filters and filters['severity']:
-                severity_enums = [AlertSeverity(s) for s in filters['severity']]
+                severity_enums = [SEVERITY_BY_VALUE[s] for s in filters['severity']]
                 query = query.filter(SecurityEvent.severity.in_(severity_enums))
             if 'is_resolved' in filters:
                 query = query.filter(SecurityEvent.is_resolved == filters['is_resolved'])
@@ -1,6 +1,7 @@
 import os
 import datetime
 import random
+import pandas as pd
 from database import (
     init_db,
     add_network_device,
@@ -8,8 +9,8 @@ from database import (
     add_device_performance_metric,
     add_network_traffic,
     add_topology_change,
-    DeviceStatus,
-    AlertSeverity
+    STATUS_BY_VALUE,
+    SEVERITY_BY_VALUE
 )
 from data.mock_generator import (
     generate_device_inventory,
@@ -33,10 +34,10 @@ def initialize_database():
     devices = generate_device_inventory(50)
     device_ids = {}  # Map device_id to database id
     
-    for device in devices:
+    for device in pd.DataFrame(devices).to_dict('records'):
         # Convert status string to enum value
         status_str = device['status']
-        device['status'] = DeviceStatus(status_str)
+        device['status'] = STATUS_BY_VALUE[status_str]
             
         db_id = add_network_device(device)
         device_ids[device['device_id']] = db_id
@@ -53,7 +54,7 @@ def initialize_database():
             
         # Convert severity string to enum value
         severity_str = event['severity']
-        event['severity'] = AlertSeverity(severity_str)
+        event['severity'] = SEVERITY_BY_VALUE[severity_str]
         
         add_security_event(event)
     
@@ -94,13 +95,21 @@ def initialize_database():
     print("Adding topology changes...")
     topology_changes = generate_topology_changes(20)
     
-    for change in topology_changes:
+    rows = zip(
+        topology_changes['timestamp'].dt.to_pydatetime(),
+        topology_changes['change_type'],
+        topology_changes['device_id'],
+        topology_changes['device_type'],
+        topology_changes['details']
+    )
+    
+    for timestamp, change_type, device_id, device_type, details in rows:
         change_record = {
-            'timestamp': datetime.datetime.fromisoformat(change['timestamp'].replace('Z', '+00:00')),
-            'change_type': change['change_type'],
-            'device_id': change['device_id'],
-            'device_type': change['device_type'],
-            'details': change['details']
+            'timestamp': timestamp,
+            'change_type': change_type,
+            'device_id': device_id,
+            'device_type': device_type,
+            'details': details
         }
         add_topology_change(change_record)
     
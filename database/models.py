@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean, Text, Enum, create_engine, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean, Text, Enum, Index, create_engine, JSON
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 import enum
@@ -19,6 +19,10 @@ class AlertSeverity(enum.Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
+# Enum members by stored value, so strings are converted with a dict lookup
+STATUS_BY_VALUE = {status.value: status for status in DeviceStatus}
+SEVERITY_BY_VALUE = {severity.value: severity for severity in AlertSeverity}
+
 class NetworkDevice(Base):
     __tablename__ = 'network_devices'
     
@@ -64,7 +68,7 @@ class SecurityEvent(Base):
     __tablename__ = 'security_events'
     
     id = Column(Integer, primary_key=True)
-    device_id = Column(Integer, ForeignKey('network_devices.id'), nullable=True)
+    device_id = Column(Integer, ForeignKey('network_devices.id'), nullable=True, index=True)
     timestamp = Column(DateTime, default=datetime.datetime.utcnow)
     event_type = Column(String(100), nullable=False)
     source_ip = Column(String(50))
@@ -73,6 +77,11 @@ class SecurityEvent(Base):
     severity = Column(Enum(AlertSeverity), default=AlertSeverity.MEDIUM)
     is_resolved = Column(Boolean, default=False)
     
+    # Newest-first index for the incident response event feed
+    __table_args__ = (
+        Index('ix_security_events_timestamp', timestamp.desc()),
+    )
+    
     # Relationship
     device = relationship("NetworkDevice", back_populates="security_events")
     
@@ -50,6 +50,44 @@ def is_valid_network(network):
     except ValueError:
         return False
 
+# Cache test scan results per network, so repeat scans of the same target return immediately;
+# the Rescan checkbox drops a network's entry to force a live scan
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def cached_ping_scan(network):
+    """
+    Ping-scan a network with nmap and list the hosts that answered.
+    
+    Args:
+        network: Network address or range to scan
+        
+    Returns:
+        tuple: (hosts_data, scanned_at), one dict per host with its IP Address,
+        Hostname and Status, and the datetime the scan ran
+    """
+    nm = nmap.PortScanner()
+    
+    # We'll do a simple ping scan which doesn't require root/admin
+    nm.scan(hosts=network, arguments='-sn')
+    
+    hosts_data = []
+    for host in nm.all_hosts():
+        try:
+            hostname = nm[host].hostname() if 'hostname' in nm[host] else 'Unknown'
+            status = nm[host]['status']['state'] if 'status' in nm[host] else 'Unknown'
+            hosts_data.append({
+                "IP Address": host,
+                "Hostname": hostname,
+                "Status": status
+            })
+        except (KeyError, TypeError):
+            # Handle possible errors in parsing the host data
+            hosts_data.append({
+                "IP Address": host,
+                "Hostname": "Error retrieving hostname",
+                "Status": "Unknown"
+            })
+    return hosts_data, datetime.datetime.now()
+
 # Create main configuration layout
 st.markdown("### General Settings")
 
@@ -256,6 +294,8 @@ if st.session_state.network_config["networks"]:
         key="test_network"
     )
     
+    rescan = st.checkbox("Rescan (ignore cached results)", value=False, key="test_rescan")
+    
     if test_network and st.button("Run Test Scan"):
         selected_network = next(net for net in st.session_state.network_config["networks"] 
                             if f"{net['name']} ({net['address']})" == test_network)
@@ -266,34 +306,16 @@ if st.session_state.network_config["networks"]:
                     # Note: Nmap might require elevated privileges for some scans
                     st.info("Using Python-Nmap module for scanning (limited functionality in a web interface)")
                     
-                    nm = nmap.PortScanner()
-                    
-                    # We'll do a simple ping scan which doesn't require root/admin
-                    results = nm.scan(hosts=selected_network['address'], arguments='-sn')
+                    if rescan:
+                        cached_ping_scan.clear(selected_network['address'])
+                    hosts_data, scanned_at = cached_ping_scan(selected_network['address'])
                     
                     # Show results
-                    hosts_found = len(nm.all_hosts())
+                    hosts_found = len(hosts_data)
                     st.success(f"Scan completed! Found {hosts_found} active hosts.")
+                    st.caption(f"Results from the scan at {scanned_at.strftime('%Y-%m-%d %H:%M:%S')}; tick Rescan for a fresh scan.")
                     
                     if hosts_found > 0:
-                        hosts_data = []
-                        for host in nm.all_hosts():
-                            try:
-                                hostname = nm[host].hostname() if 'hostname' in nm[host] else 'Unknown'
-                                status = nm[host]['status']['state'] if 'status' in nm[host] else 'Unknown'
-                                hosts_data.append({
-                                    "IP Address": host,
-                                    "Hostname": hostname,
-                                    "Status": status
-                                })
-                            except:
-                                # Handle possible errors in parsing the host data
-                                hosts_data.append({
-                                    "IP Address": host,
-                                    "Hostname": "Error retrieving hostname",
-                                    "Status": "Unknown"
-                                })
-                        
                         hosts_df = pd.DataFrame(hosts_data)
                         st.dataframe(hosts_df)
                     else:
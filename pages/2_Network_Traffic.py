@@ -19,6 +19,16 @@ st.set_page_config(
 st.title("🚦 Network Traffic")
 st.subheader("Monitor and analyze network traffic patterns to detect anomalies and potential threats")
 
+# Reference time shared by every timestamp rendered on this page
+now = datetime.datetime.now()
+
+# Static sample data shared across reruns
+SEGMENTS = ('Internal', 'DMZ', 'External', 'Cloud', 'VPN')
+PROTOCOLS = ('HTTP', 'HTTPS', 'DNS', 'SMTP', 'SSH', 'FTP', 'SNMP', 'Other')
+PORTS = (80, 443, 22, 53, 25, 3389, 20, 21, 161, 445)
+PORT_NAMES = ('HTTP', 'HTTPS', 'SSH', 'DNS', 'SMTP', 'RDP', 'FTP-Data', 'FTP', 'SNMP', 'SMB')
+COUNTRIES = ('United States', 'China', 'Russia', 'Germany', 'Brazil', 'India', 'United Kingdom', 'Japan', 'Canada', 'Australia')
+
 # Create tabs for different views
 tab1, tab2, tab3 = st.tabs(["Traffic Overview", "Protocol Analysis", "Flow Monitoring"])
 
@@ -49,9 +59,6 @@ with tab1:
     traffic_data = generate_network_traffic(48)  # 48 hours of data
     traffic_df = pd.DataFrame(traffic_data)
     
-    # Format timestamp for better display
-    traffic_df['datetime'] = pd.to_datetime(traffic_df['timestamp'])
-    
     # Traffic Over Time Chart
     st.subheader("Network Traffic Over Time")
     
@@ -59,7 +66,7 @@ with tab1:
     fig = go.Figure()
     
     fig.add_trace(go.Scatter(
-        x=traffic_df['datetime'],
+        x=traffic_df['timestamp'],
         y=traffic_df['inbound_traffic'],
         mode='lines',
         name='Inbound',
@@ -67,7 +74,7 @@ with tab1:
     ))
     
     fig.add_trace(go.Scatter(
-        x=traffic_df['datetime'],
+        x=traffic_df['timestamp'],
         y=traffic_df['outbound_traffic'],
         mode='lines',
         name='Outbound',
@@ -86,28 +93,21 @@ with tab1:
     # Traffic by Network Segment
     st.subheader("Traffic by Network Segment")
     
-    segments = ['Internal', 'DMZ', 'External', 'Cloud', 'VPN']
-    inbound_values = [random.randint(50, 500) for _ in segments]
-    outbound_values = [random.randint(50, 500) for _ in segments]
-    
-    segment_df = pd.DataFrame({
-        'Network Segment': segments,
-        'Inbound': inbound_values,
-        'Outbound': outbound_values
-    })
+    inbound_values = [random.randint(50, 500) for _ in SEGMENTS]
+    outbound_values = [random.randint(50, 500) for _ in SEGMENTS]
     
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
-        x=segment_df['Network Segment'],
-        y=segment_df['Inbound'],
+        x=SEGMENTS,
+        y=inbound_values,
         name='Inbound',
         marker_color='blue'
     ))
     
     fig.add_trace(go.Bar(
-        x=segment_df['Network Segment'],
-        y=segment_df['Outbound'],
+        x=SEGMENTS,
+        y=outbound_values,
         name='Outbound',
         marker_color='green'
     ))
@@ -151,13 +151,12 @@ with tab2:
     # Protocol Distribution
     st.markdown("### Traffic by Protocol")
     
-    protocols = ['HTTP', 'HTTPS', 'DNS', 'SMTP', 'SSH', 'FTP', 'SNMP', 'Other']
-    protocol_values = [random.randint(50, 500) for _ in protocols]
+    protocol_values = [random.randint(50, 500) for _ in PROTOCOLS]
     total_protocol = sum(protocol_values)
     protocol_percentages = [round((v / total_protocol) * 100, 1) for v in protocol_values]
     
     protocol_df = pd.DataFrame({
-        'Protocol': protocols,
+        'Protocol': PROTOCOLS,
         'Traffic (Mbps)': protocol_values,
         'Percentage': protocol_percentages
     })
@@ -177,13 +176,11 @@ with tab2:
     # Port Activity
     st.markdown("### Top Active Ports")
     
-    ports = [80, 443, 22, 53, 25, 3389, 20, 21, 161, 445]
-    port_names = ['HTTP', 'HTTPS', 'SSH', 'DNS', 'SMTP', 'RDP', 'FTP-Data', 'FTP', 'SNMP', 'SMB']
-    port_traffic = [random.randint(50, 500) for _ in ports]
+    port_traffic = [random.randint(50, 500) for _ in PORTS]
     
     port_df = pd.DataFrame({
-        'Port': ports,
-        'Service': port_names,
+        'Port': PORTS,
+        'Service': PORT_NAMES,
         'Traffic (Mbps)': port_traffic
     }).sort_values('Traffic (Mbps)', ascending=False)
     
@@ -205,9 +202,9 @@ with tab2:
     st.markdown("### Protocol Anomaly Detection")
     
     # Generate some sample anomalies
-    anomaly_protocols = random.sample(protocols, 3)
+    anomaly_protocols = random.sample(PROTOCOLS, 3)
     anomaly_times = [
-        (datetime.datetime.now() - datetime.timedelta(hours=random.randint(1, 24))).strftime("%Y-%m-%d %H:%M:%S")
+        (now - datetime.timedelta(hours=random.randint(1, 24))).strftime("%Y-%m-%d %H:%M:%S")
         for _ in range(3)
     ]
     anomaly_descs = [
@@ -252,8 +249,8 @@ with tab3:
     
     with col1:
         # Flow count over time
-        timestamps = pd.date_range(start=datetime.datetime.now() - datetime.timedelta(hours=24), 
-                                   end=datetime.datetime.now(), 
+        timestamps = pd.date_range(start=now - datetime.timedelta(hours=24), 
+                                   end=now, 
                                    freq='h')
         flow_counts = [random.randint(1000, 5000) for _ in range(len(timestamps))]
         
@@ -294,28 +291,21 @@ with tab3:
     st.markdown("### Geographical Flow Distribution")
     
     # Create some sample country data
-    countries = ['United States', 'China', 'Russia', 'Germany', 'Brazil', 'India', 'United Kingdom', 'Japan', 'Canada', 'Australia']
-    inbound_flows = [random.randint(100, 1000) for _ in countries]
-    outbound_flows = [random.randint(100, 1000) for _ in countries]
-    
-    geo_df = pd.DataFrame({
-        'Country': countries,
-        'Inbound Flows': inbound_flows,
-        'Outbound Flows': outbound_flows
-    })
+    inbound_flows = [random.randint(100, 1000) for _ in COUNTRIES]
+    outbound_flows = [random.randint(100, 1000) for _ in COUNTRIES]
     
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
-        x=geo_df['Country'],
-        y=geo_df['Inbound Flows'],
+        x=COUNTRIES,
+        y=inbound_flows,
         name='Inbound',
         marker_color='blue'
     ))
     
     fig.add_trace(go.Bar(
-        x=geo_df['Country'],
-        y=geo_df['Outbound Flows'],
+        x=COUNTRIES,
+        y=outbound_flows,
         name='Outbound',
         marker_color='green'
     ))
@@ -352,4 +342,4 @@ with tab3:
 
 # Footer
 st.divider()
-st.caption("© 2025 - nSocCSP | Network Traffic Module | Last updated: " + datetime.datetime.now().strftime("%Y-%m-%d %H:%M"))
+st.caption("© 2025 - nSocCSP | Network Traffic Module | Last updated: " + now.strftime("%Y-%m-%d %H:%M"))
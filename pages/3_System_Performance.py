@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 import datetime
@@ -19,102 +20,104 @@ st.set_page_config(
 st.title("💻 System Performance")
 st.subheader("Monitor system resources utilization across your network infrastructure")
 
-# Create tabs for different views
-tab1, tab2, tab3 = st.tabs(["Resource Dashboard", "Server Metrics", "Performance Alerts"])
+# Reference time shared by every timestamp rendered on this page
+now = datetime.datetime.now()
 
-with tab1:
-    # Resource Dashboard
-    st.subheader("Resource Utilization Dashboard")
-    
-    # Select time range
-    time_range = st.selectbox(
-        "Select Time Range",
-        options=["Last Hour", "Last 6 Hours", "Last 24 Hours", "Last 7 Days"],
-        index=1
-    )
-    
-    # Map selection to number of data points
-    time_map = {
-        "Last Hour": 60,
-        "Last 6 Hours": 72,
-        "Last 24 Hours": 144,
-        "Last 7 Days": 168
-    }
-    
-    data_points = time_map[time_range]
-    
-    # Generate system metrics data
-    system_data = generate_system_metrics(data_points)
-    system_df = pd.DataFrame(system_data)
-    
-    # Format timestamp for better display
-    system_df['datetime'] = pd.to_datetime(system_df['timestamp'])
-    
-    # Key metrics row
-    col1, col2, col3, col4 = st.columns(4)
+# Random generator for the vectorized sample tables
+rng = np.random.default_rng()
+
+# Static sample data shared across reruns
+SERVERS = tuple(f"srv-{i:03d}" for i in range(1, 21))
+SERVER_NAMES = SERVERS[:10]
+
+PROCESS_NAMES = ("httpd", "mysqld", "postgres", "nginx", "python", "java", "sshd", "crond", "systemd", "bash")
+PROCESS_CMDS = (
+    "/usr/sbin/httpd -DFOREGROUND",
+    "/usr/sbin/mysqld --daemonize",
+    "/usr/bin/postgres -D /var/lib/postgres/data",
+    "/usr/sbin/nginx -g 'daemon off;'",
+    "/usr/bin/python3 /app/server.py",
+    "/usr/bin/java -jar /app/service.jar",
+    "/usr/sbin/sshd -D",
+    "/usr/sbin/crond -n",
+    "/usr/lib/systemd/systemd --system",
+    "/bin/bash"
+)
+
+# Alert type to the resource it concerns
+ALERT_RESOURCES = {
+    "High CPU Usage": "CPU",
+    "Memory Utilization Threshold Exceeded": "Memory",
+    "Low Disk Space": "Disk",
+    "Disk I/O Bottleneck": "Disk",
+    "Network Interface Saturation": "Network",
+    "Process Not Responding": "CPU",
+    "Service Restart Required": "CPU",
+    "Memory Leak Detected": "Memory",
+    "Abnormal CPU Spikes": "CPU",
+    "Network Packet Loss": "Network"
+}
+ALERT_TYPES = tuple(ALERT_RESOURCES)
+
+# Map time range selection to number of data points
+TIME_MAP = {
+    "Last Hour": 60,
+    "Last 6 Hours": 72,
+    "Last 24 Hours": 144,
+    "Last 7 Days": 168
+}
+
+@st.cache_data(ttl="60s", max_entries=8)
+def build_resource_charts(time_range):
+    """
+    Generate system metrics for a time range and build its utilization charts.
     
-    with col1:
-        avg_cpu = round(system_df['cpu_usage'].mean(), 1)
-        st.metric(label="Avg. CPU Usage (%)", value=avg_cpu, delta=f"{round(random.uniform(-5, 5), 1)}")
-        
-    with col2:
-        avg_memory = round(system_df['memory_usage'].mean(), 1)
-        st.metric(label="Avg. Memory Usage (%)", value=avg_memory, delta=f"{round(random.uniform(-3, 3), 1)}")
+    Args:
+        time_range: Time range selected on the Resource Dashboard
         
-    with col3:
-        avg_disk = round(system_df['disk_io'].mean(), 1)
-        st.metric(label="Avg. Disk I/O (%)", value=avg_disk, delta=f"{round(random.uniform(-4, 4), 1)}")
-        
-    with col4:
-        avg_network = round(system_df['network_throughput'].mean(), 1)
-        st.metric(label="Avg. Network Throughput (Mbps)", value=avg_network, delta=f"{round(random.uniform(-10, 10), 1)}")
-    
-    # CPU, Memory, and Disk Usage Chart
-    st.subheader("System Resource Utilization")
+    Returns:
+        tuple: (system_df, utilization_fig, throughput_fig)
+    """
+    system_df = pd.DataFrame(generate_system_metrics(TIME_MAP[time_range]))
     
     # Create a line chart with CPU, memory, and disk
-    fig = go.Figure()
+    utilization_fig = go.Figure()
     
-    fig.add_trace(go.Scatter(
-        x=system_df['datetime'],
+    utilization_fig.add_trace(go.Scatter(
+        x=system_df['timestamp'],
         y=system_df['cpu_usage'],
         mode='lines',
         name='CPU Usage (%)',
         line=dict(color='blue', width=2)
     ))
     
-    fig.add_trace(go.Scatter(
-        x=system_df['datetime'],
+    utilization_fig.add_trace(go.Scatter(
+        x=system_df['timestamp'],
         y=system_df['memory_usage'],
         mode='lines',
         name='Memory Usage (%)',
         line=dict(color='green', width=2)
     ))
     
-    fig.add_trace(go.Scatter(
-        x=system_df['datetime'],
+    utilization_fig.add_trace(go.Scatter(
+        x=system_df['timestamp'],
         y=system_df['disk_io'],
         mode='lines',
         name='Disk I/O (%)',
         line=dict(color='red', width=2)
     ))
     
-    fig.update_layout(
+    utilization_fig.update_layout(
         title=f'System Resource Utilization ({time_range})',
         xaxis_title='Time',
         yaxis_title='Usage (%)',
         hovermode='x unified'
     )
     
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Network Throughput Chart
-    st.subheader("Network Throughput")
+    throughput_fig = go.Figure()
     
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=system_df['datetime'],
+    throughput_fig.add_trace(go.Scatter(
+        x=system_df['timestamp'],
         y=system_df['network_throughput'],
         mode='lines',
         name='Network Throughput',
@@ -122,41 +125,137 @@ with tab1:
         fill='tozeroy'
     ))
     
-    fig.update_layout(
+    throughput_fig.update_layout(
         title=f'Network Throughput ({time_range})',
         xaxis_title='Time',
         yaxis_title='Throughput (Mbps)',
         hovermode='x unified'
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return system_df, utilization_fig, throughput_fig
+
+@st.cache_data(ttl="60s", max_entries=8)
+def build_server_metrics(server_id):
+    """
+    Generate detailed metrics for a server and build its historical trend chart.
+    
+    Args:
+        server_id: Server selected on the Server Metrics tab
+        
+    Returns:
+        tuple: (server_df, history_fig)
+    """
+    server_df = pd.DataFrame(generate_system_metrics(100, server_id=server_id))
+    
+    # Create historical trend chart
+    history_fig = go.Figure()
+    
+    history_fig.add_trace(go.Scatter(
+        x=server_df['timestamp'],
+        y=server_df['cpu_usage'],
+        mode='lines',
+        name='CPU Usage (%)',
+        line=dict(color='blue', width=2)
+    ))
+    
+    history_fig.add_trace(go.Scatter(
+        x=server_df['timestamp'],
+        y=server_df['memory_usage'],
+        mode='lines',
+        name='Memory Usage (%)',
+        line=dict(color='green', width=2)
+    ))
+    
+    history_fig.add_trace(go.Scatter(
+        x=server_df['timestamp'],
+        y=server_df['disk_io'],
+        mode='lines',
+        name='Disk I/O (%)',
+        line=dict(color='red', width=2)
+    ))
+    
+    history_fig.add_trace(go.Scatter(
+        x=server_df['timestamp'],
+        y=server_df['network_throughput'],
+        mode='lines',
+        name='Network Throughput (Mbps)',
+        line=dict(color='purple', width=2)
+    ))
+    
+    history_fig.update_layout(
+        title=f'Historical Performance Metrics for {server_id}',
+        xaxis_title='Time',
+        yaxis_title='Value',
+        hovermode='x unified'
+    )
+    
+    return server_df, history_fig
+
+# Create tabs for different views
+tab1, tab2, tab3 = st.tabs(["Resource Dashboard", "Server Metrics", "Performance Alerts"])
+
+with tab1:
+    # Resource Dashboard
+    st.subheader("Resource Utilization Dashboard")
+    
+    # Select time range
+    time_range = st.selectbox(
+        "Select Time Range",
+        options=["Last Hour", "Last 6 Hours", "Last 24 Hours", "Last 7 Days"],
+        index=1
+    )
+    
+    # Generate system metrics data and its charts
+    system_df, utilization_fig, throughput_fig = build_resource_charts(time_range)
+    
+    # Key metrics row
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        avg_cpu = round(system_df['cpu_usage'].mean(), 1)
+        st.metric(label="Avg. CPU Usage (%)", value=avg_cpu, delta=f"{round(random.uniform(-5, 5), 1)}")
+        
+    with col2:
+        avg_memory = round(system_df['memory_usage'].mean(), 1)
+        st.metric(label="Avg. Memory Usage (%)", value=avg_memory, delta=f"{round(random.uniform(-3, 3), 1)}")
+        
+    with col3:
+        avg_disk = round(system_df['disk_io'].mean(), 1)
+        st.metric(label="Avg. Disk I/O (%)", value=avg_disk, delta=f"{round(random.uniform(-4, 4), 1)}")
+        
+    with col4:
+        avg_network = round(system_df['network_throughput'].mean(), 1)
+        st.metric(label="Avg. Network Throughput (Mbps)", value=avg_network, delta=f"{round(random.uniform(-10, 10), 1)}")
+    
+    # CPU, Memory, and Disk Usage Chart
+    st.subheader("System Resource Utilization")
+    
+    st.plotly_chart(utilization_fig, use_container_width=True)
+    
+    # Network Throughput Chart
+    st.subheader("Network Throughput")
+    
+    st.plotly_chart(throughput_fig, use_container_width=True)
     
     # System Load Distribution
     st.subheader("System Load Distribution")
     
     # Generate sample load data for multiple servers
-    server_names = [f"srv-{i:03d}" for i in range(1, 11)]
     cpu_loads = [random.uniform(10, 90) for _ in range(10)]
     memory_loads = [random.uniform(20, 85) for _ in range(10)]
     
-    load_df = pd.DataFrame({
-        'Server': server_names,
-        'CPU Load (%)': cpu_loads,
-        'Memory Load (%)': memory_loads
-    })
-    
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
-        x=load_df['Server'],
-        y=load_df['CPU Load (%)'],
+        x=SERVER_NAMES,
+        y=cpu_loads,
         name='CPU Load',
         marker_color='blue'
     ))
     
     fig.add_trace(go.Bar(
-        x=load_df['Server'],
-        y=load_df['Memory Load (%)'],
+        x=SERVER_NAMES,
+        y=memory_loads,
         name='Memory Load',
         marker_color='green'
     ))
@@ -175,13 +274,10 @@ with tab2:
     st.subheader("Server Performance Metrics")
     
     # Server selection
-    servers = [f"srv-{i:03d}" for i in range(1, 21)]
-    selected_server = st.selectbox("Select Server", options=servers)
+    selected_server = st.selectbox("Select Server", options=SERVERS)
     
     # Generate detailed metrics for the selected server
-    server_data = generate_system_metrics(100, server_id=selected_server)
-    server_df = pd.DataFrame(server_data)
-    server_df['datetime'] = pd.to_datetime(server_df['timestamp'])
+    server_df, history_fig = build_server_metrics(selected_server)
     
     # Server info
     col1, col2, col3 = st.columns(3)
@@ -305,80 +401,24 @@ with tab2:
     # Historical trends
     st.subheader("Historical Performance Trends")
     
-    # Create historical trend chart
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=server_df['datetime'],
-        y=server_df['cpu_usage'],
-        mode='lines',
-        name='CPU Usage (%)',
-        line=dict(color='blue', width=2)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=server_df['datetime'],
-        y=server_df['memory_usage'],
-        mode='lines',
-        name='Memory Usage (%)',
-        line=dict(color='green', width=2)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=server_df['datetime'],
-        y=server_df['disk_io'],
-        mode='lines',
-        name='Disk I/O (%)',
-        line=dict(color='red', width=2)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=server_df['datetime'],
-        y=server_df['network_throughput'],
-        mode='lines',
-        name='Network Throughput (Mbps)',
-        line=dict(color='purple', width=2)
-    ))
-    
-    fig.update_layout(
-        title=f'Historical Performance Metrics for {selected_server}',
-        xaxis_title='Time',
-        yaxis_title='Value',
-        hovermode='x unified'
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(history_fig, use_container_width=True)
     
     # Processes Table
     st.subheader("Top Processes")
     
     # Generate sample process data
-    process_names = ["httpd", "mysqld", "postgres", "nginx", "python", "java", "sshd", "crond", "systemd", "bash"]
-    process_cmds = [
-        "/usr/sbin/httpd -DFOREGROUND",
-        "/usr/sbin/mysqld --daemonize",
-        "/usr/bin/postgres -D /var/lib/postgres/data",
-        "/usr/sbin/nginx -g 'daemon off;'",
-        "/usr/bin/python3 /app/server.py",
-        "/usr/bin/java -jar /app/service.jar",
-        "/usr/sbin/sshd -D",
-        "/usr/sbin/crond -n",
-        "/usr/lib/systemd/systemd --system",
-        "/bin/bash"
-    ]
-    
-    process_data = []
-    for i in range(10):
-        process_data.append({
-            "PID": random.randint(1000, 9999),
-            "Process": process_names[i],
-            "Command": process_cmds[i],
-            "CPU (%)": round(random.uniform(0.1, 25.0), 1),
-            "Memory (%)": round(random.uniform(0.2, 15.0), 1),
-            "Running Time": f"{random.randint(1, 24)}h {random.randint(0, 59)}m"
-        })
-    
-    process_df = pd.DataFrame(process_data).sort_values("CPU (%)", ascending=False)
+    num_processes = len(PROCESS_NAMES)
+    run_hours = rng.integers(1, 25, size=num_processes)
+    run_minutes = rng.integers(0, 60, size=num_processes)
+    
+    process_df = pd.DataFrame({
+        "PID": rng.integers(1000, 10000, size=num_processes),
+        "Process": PROCESS_NAMES,
+        "Command": PROCESS_CMDS,
+        "CPU (%)": rng.uniform(0.1, 25.0, size=num_processes).round(1),
+        "Memory (%)": rng.uniform(0.2, 15.0, size=num_processes).round(1),
+        "Running Time": [f"{h}h {m}m" for h, m in zip(run_hours, run_minutes)]
+    }).sort_values("CPU (%)", ascending=False)
     
     st.dataframe(process_df, use_container_width=True)
 
@@ -411,47 +451,21 @@ with tab3:
         )
     
     # Generate sample alerts
-    alert_types = [
-        "High CPU Usage",
-        "Memory Utilization Threshold Exceeded",
-        "Low Disk Space",
-        "Disk I/O Bottleneck",
-        "Network Interface Saturation",
-        "Process Not Responding",
-        "Service Restart Required",
-        "Memory Leak Detected",
-        "Abnormal CPU Spikes",
-        "Network Packet Loss"
-    ]
-    
-    resource_map = {
-        "High CPU Usage": "CPU",
-        "Memory Utilization Threshold Exceeded": "Memory",
-        "Low Disk Space": "Disk",
-        "Disk I/O Bottleneck": "Disk",
-        "Network Interface Saturation": "Network",
-        "Process Not Responding": "CPU",
-        "Service Restart Required": "CPU",
-        "Memory Leak Detected": "Memory",
-        "Abnormal CPU Spikes": "CPU",
-        "Network Packet Loss": "Network"
-    }
-    
     alert_data = []
     for i in range(20):
-        alert_type = random.choice(alert_types)
-        resource_type = resource_map[alert_type]
+        alert_type = random.choice(ALERT_TYPES)
+        resource_type = ALERT_RESOURCES[alert_type]
         severity = random.choice(["Critical", "Warning", "Info"])
         status = random.choice(["Active", "Acknowledged", "Resolved"])
         
         # Only add alerts that match the filters
         if severity in severity_filter and status in status_filter and resource_type in resource_filter:
-            timestamp = datetime.datetime.now() - datetime.timedelta(
+            timestamp = now - datetime.timedelta(
                 hours=random.randint(0, 48),
                 minutes=random.randint(0, 59)
             )
             
-            server = random.choice(servers)
+            server = random.choice(SERVERS)
             
             alert_data.append({
                 "Timestamp": timestamp,
@@ -499,7 +513,7 @@ with tab3:
         st.download_button(
             label="Export Alerts to CSV",
             data=alert_df.to_csv(index=False).encode("utf-8"),
-            file_name=f"performance_alerts_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            file_name=f"performance_alerts_{now.strftime('%Y%m%d_%H%M%S')}.csv",
             mime="text/csv"
         )
     else:
@@ -509,40 +523,32 @@ with tab3:
     st.subheader("Alert Trend Analysis")
     
     # Create sample alert trend data (past 7 days)
-    dates = [datetime.datetime.now() - datetime.timedelta(days=i) for i in range(7)]
-    dates.reverse()  # Oldest to newest
+    dates = pd.date_range(end=now, periods=7, freq='D')  # Oldest to newest
     
     critical_counts = [random.randint(0, 5) for _ in range(7)]
     warning_counts = [random.randint(3, 12) for _ in range(7)]
     info_counts = [random.randint(5, 20) for _ in range(7)]
     
-    trend_df = pd.DataFrame({
-        "Date": dates,
-        "Critical": critical_counts,
-        "Warning": warning_counts,
-        "Info": info_counts
-    })
-    
     # Create the stacked bar chart
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
-        x=trend_df["Date"],
-        y=trend_df["Critical"],
+        x=dates,
+        y=critical_counts,
         name="Critical",
         marker_color="red"
     ))
     
     fig.add_trace(go.Bar(
-        x=trend_df["Date"],
-        y=trend_df["Warning"],
+        x=dates,
+        y=warning_counts,
         name="Warning",
         marker_color="orange"
     ))
     
     fig.add_trace(go.Bar(
-        x=trend_df["Date"],
-        y=trend_df["Info"],
+        x=dates,
+        y=info_counts,
         name="Info",
         marker_color="blue"
     ))
@@ -558,4 +564,4 @@ with tab3:
 
 # Footer
 st.divider()
-st.caption("© 2025 - nSocCSP | System Performance Module | Last updated: " + datetime.datetime.now().strftime("%Y-%m-%d %H:%M"))
+st.caption("© 2025 - nSocCSP | System Performance Module | Last updated: " + now.strftime("%Y-%m-%d %H:%M"))
@@ -1,12 +1,14 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 import networkx as nx
 import datetime
 import time
 import random
-from utils import load_image, create_network_graph, get_random_ip, get_random_mac
+import heapq
+from utils import load_image, create_network_graph, network_graph_traces, get_random_ips, get_random_mac
 from data.mock_generator import generate_topology_changes
 
 # Set page configuration
@@ -20,6 +22,182 @@ st.set_page_config(
 st.title("🌐 Network Topology")
 st.subheader("Interactive visualization of your Layer 2 network topology with real-time updates")
 
+# Cell styles for the change and vulnerability tables, looked up per column
+CHANGE_COLORS = {
+    'Device Added': 'background-color: rgba(0, 128, 0, 0.2)',
+    'Device Removed': 'background-color: rgba(255, 0, 0, 0.2)',
+    'Link Added': 'background-color: rgba(0, 0, 255, 0.2)',
+    'Link Removed': 'background-color: rgba(255, 165, 0, 0.2)',
+    'Status Change': 'background-color: rgba(128, 0, 128, 0.2)'
+}
+
+SEVERITY_COLORS = {
+    'Critical': 'background-color: red; color: white',
+    'High': 'background-color: orange; color: white',
+    'Medium': 'background-color: yellow'
+}
+
+# Palette shared by the distribution pie charts
+PLASMA = list(px.colors.sequential.Plasma)
+
+@st.cache_data(show_spinner=False)
+def cached_diameter(num_nodes, num_edges):
+    """
+    Compute the exact diameter of the diagram graph. The diagram has at most
+    a few dozen nodes, so the all-pairs BFS is cheap, and it runs once per
+    (size, density).
+    
+    Returns:
+        int: The diameter, or None if the graph is disconnected
+    """
+    nodes, edges = create_network_graph(num_nodes=num_nodes, num_edges=num_edges)[:2]
+    G = nx.Graph()
+    G.add_nodes_from(nodes.tolist())
+    G.add_edges_from(edges.tolist())
+    try:
+        return nx.diameter(G)
+    except nx.NetworkXError:
+        return None
+
+@st.cache_data(ttl="60s", show_spinner=False)
+def cached_topology_changes(num_changes):
+    """
+    Generate the sample topology changes shared by reruns within a minute.
+    
+    Returns:
+        DataFrame: Changes sorted newest first, with categorical change_type
+        and device_type columns and a derived date column
+    """
+    changes_df = pd.DataFrame(generate_topology_changes(num_changes)).sort_values('timestamp', ascending=False)
+    changes_df['change_type'] = changes_df['change_type'].astype('category')
+    changes_df['device_type'] = changes_df['device_type'].astype('category')
+    changes_df['date'] = changes_df['timestamp'].dt.date
+    return changes_df
+
+@st.cache_data(show_spinner=False)
+def cached_filtered_changes(changes_df, change_types, device_types):
+    """
+    Filter topology changes by change and device type.
+    
+    Args:
+        changes_df: Changes from cached_topology_changes; hashed into the cache
+            key so the filter always describes the frame shown alongside it
+        change_types: Tuple of change types to keep
+        device_types: Tuple of device types to keep
+        
+    Returns:
+        DataFrame: The matching changes
+    """
+    return changes_df[
+        changes_df['change_type'].isin(change_types) & 
+        changes_df['device_type'].isin(device_types)
+    ]
+
+@st.cache_data(show_spinner=False)
+def cached_analysis_graph(size):
+    """Build the scale-free analysis network for a given size."""
+    return nx.barabasi_albert_graph(size, 3, seed=42)
+
+@st.cache_data(show_spinner=False)
+def cached_analysis_metrics(size):
+    """
+    Compute the summary metrics of the analysis network.
+    
+    Degree and density both follow from the edge count, and the clustering
+    coefficient is estimated from 500 sampled nodes.
+    
+    Args:
+        size: Size of the analysis network
+        
+    Returns:
+        dict: avg_degree, density and avg_clustering
+    """
+    G_analysis = cached_analysis_graph(size)
+    degree_sum = 2 * G_analysis.number_of_edges()
+    return {
+        'avg_degree': degree_sum / size,
+        'density': degree_sum / (size * (size - 1)),
+        'avg_clustering': nx.approximation.average_clustering(G_analysis, trials=500, seed=0)
+    }
+
+@st.cache_data(show_spinner=False)
+def cached_top_betweenness(size, top_n=10):
+    """
+    Rank the analysis network's nodes by betweenness centrality.
+    
+    Centrality is estimated from a sample of at most 20 source nodes, which
+    costs O(k*E) instead of the O(V*E) of exact Brandes.
+    
+    Args:
+        size: Size of the analysis network
+        top_n: Number of nodes to return
+        
+    Returns:
+        List of (node, centrality) tuples, highest centrality first
+    """
+    G_analysis = cached_analysis_graph(size)
+    betweenness = nx.betweenness_centrality(G_analysis, k=min(20, size), seed=0, normalized=True)
+    return heapq.nlargest(top_n, betweenness.items(), key=lambda x: x[1])
+
+@st.cache_data(show_spinner=False)
+def cached_analysis_tables(size):
+    """
+    Build the critical node and vulnerability tables for the analysis network.
+    
+    Every column is drawn as a whole array from a seeded generator, so the
+    tables only change with the network size.
+    
+    Args:
+        size: Size of the analysis network
+        
+    Returns:
+        tuple: (critical_nodes_df, vuln_df)
+    """
+    rng = np.random.default_rng(42)
+    
+    # Get top 10 nodes by (sampled) betweenness centrality
+    top_nodes = cached_top_betweenness(size)
+    num_nodes = len(top_nodes)
+    
+    critical_nodes_df = pd.DataFrame({
+        'Node ID': [n[0] for n in top_nodes],
+        'Device Type': rng.choice(['router', 'switch', 'server'], size=num_nodes),
+        'Betweenness Centrality': np.round([n[1] for n in top_nodes], 4),
+        'IP Address': get_random_ips(num_nodes, rng),
+        'Status': rng.choice(['online', 'online', 'online', 'warning'], size=num_nodes)
+    })
+    
+    # Generate synthetic vulnerability data
+    vulnerability_types = [
+        "Single Point of Failure",
+        "Bottleneck Link",
+        "High Load Node",
+        "Redundancy Issue",
+        "Connectivity Risk"
+    ]
+    num_vulns = len(vulnerability_types)
+    
+    # The i-th vulnerability can be at most severity level i
+    severity_levels = np.array(['Critical', 'High', 'Medium'])
+    severity_idx = rng.integers(0, np.minimum(np.arange(num_vulns), 2) + 1)
+    
+    # Risk score ranges per severity: Critical 80-100, High 60-79, Medium 40-59
+    risk_low = np.array([80, 60, 40])[severity_idx]
+    risk_high = np.array([101, 80, 60])[severity_idx]
+    
+    remedies = rng.choice(['redundancy', 'load balancing', 'failover', 'monitoring'], size=num_vulns)
+    
+    vuln_df = pd.DataFrame({
+        'Vulnerability': vulnerability_types,
+        'Severity': severity_levels[severity_idx],
+        'Affected Nodes': rng.integers(1, 6, size=num_vulns),
+        'Affected Links': rng.integers(0, 4, size=num_vulns),
+        'Risk Score': rng.integers(risk_low, risk_high),
+        'Recommendation': [f"Implement {remedy} for affected components" for remedy in remedies]
+    })
+    
+    return critical_nodes_df, vuln_df
+
 # Create tabs for different views
 tab1, tab2, tab3 = st.tabs(["Network Diagram", "Topology Changes", "Topology Analysis"])
 
@@ -39,118 +217,79 @@ with tab1:
     with col3:
         view_type = st.selectbox("View Type", options=["Default", "By Device Type", "By Status"])
     
-    # Generate the network graph
-    G, pos, edge_x, edge_y, node_x, node_y, node_text, node_size, node_color = create_network_graph(
-        num_nodes=network_size,
-        num_edges=edge_count
-    )
-    
-    # Create the network diagram
-    fig = go.Figure()
-    
-    # Add edges
-    fig.add_trace(go.Scatter(
-        x=edge_x, y=edge_y,
-        line=dict(width=0.5, color='#888'),
-        hoverinfo='none',
-        mode='lines'
-    ))
-    
-    # Add nodes
-    if view_type == "Default":
-        fig.add_trace(go.Scatter(
-            x=node_x, y=node_y,
-            mode='markers',
-            hoverinfo='text',
-            text=node_text,
-            marker=dict(
-                color=node_color,
-                size=node_size,
-                line=dict(width=1, color='#333')
-            )
-        ))
-    elif view_type == "By Device Type":
-        # Group nodes by device type
-        type_groups = {}
-        for i, node in enumerate(G.nodes()):
-            node_type = G.nodes[node]['type']
-            if node_type not in type_groups:
-                type_groups[node_type] = {'x': [], 'y': [], 'text': [], 'size': []}
-            
-            type_groups[node_type]['x'].append(node_x[i])
-            type_groups[node_type]['y'].append(node_y[i])
-            type_groups[node_type]['text'].append(node_text[i])
-            type_groups[node_type]['size'].append(node_size[i])
+    # Generate the network graph and its ready-made traces
+    (nodes, edges, pos, edge_x, edge_y, node_x, node_y, node_text, node_size, node_color,
+     node_types, node_statuses) = create_network_graph(num_nodes=network_size, num_edges=edge_count)
+    edge_trace, node_trace = network_graph_traces(num_nodes=network_size, num_edges=edge_count)
+    
+    # Reuse the diagram figure across reruns; the edge trace only changes with the graph
+    graph_key = (network_size, edge_count)
+    fig = st.session_state.get("topo_fig")
+    if fig is None or st.session_state.get("topo_graph_key") != graph_key:
+        # Create the network diagram from the edges, drawn with WebGL so hover
+        # and pan cost doesn't grow with the edge count
+        fig = go.Figure(data=[edge_trace])
         
-        # Color mapping for device types
-        type_colors = {
-            'server': 'blue',
-            'router': 'red',
-            'switch': 'green',
-            'client': 'purple'
-        }
+        fig.update_layout(
+            title='Network Topology Map',
+            hovermode='closest',
+            margin=dict(b=20, l=5, r=5, t=40),
+            xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+            yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+            height=600,
+            uirevision='topo'
+        )
         
-        # Add a trace for each device type
-        for node_type, data in type_groups.items():
-            fig.add_trace(go.Scatter(
-                x=data['x'], y=data['y'],
-                mode='markers',
-                name=node_type.capitalize(),
-                hoverinfo='text',
-                text=data['text'],
-                marker=dict(
-                    color=type_colors.get(node_type, 'gray'),
-                    size=data['size'],
-                    line=dict(width=1, color='#333')
-                )
-            ))
-    else:  # By Status
-        # Group nodes by status
-        status_groups = {}
-        for i, node in enumerate(G.nodes()):
-            node_status = G.nodes[node]['status']
-            if node_status not in status_groups:
-                status_groups[node_status] = {'x': [], 'y': [], 'text': [], 'size': []}
-            
-            status_groups[node_status]['x'].append(node_x[i])
-            status_groups[node_status]['y'].append(node_y[i])
-            status_groups[node_status]['text'].append(node_text[i])
-            status_groups[node_status]['size'].append(node_size[i])
+        st.session_state.topo_fig = fig
+        st.session_state.topo_graph_key = graph_key
+        st.session_state.topo_view_type = None
+    
+    # Only the node traces depend on the view type
+    if st.session_state.topo_view_type != view_type:
+        # Replace the node traces, keeping the edge trace
+        fig.data = fig.data[:1]
         
-        # Color mapping for status
-        status_colors = {
-            'online': 'green',
-            'warning': 'orange',
-            'offline': 'red'
-        }
+        if view_type == "Default":
+            fig.add_trace(node_trace)
+        else:
+            if view_type == "By Device Type":
+                # Group nodes by device type
+                node_groups = node_types
+                group_colors = {
+                    'server': 'blue',
+                    'router': 'red',
+                    'switch': 'green',
+                    'client': 'purple'
+                }
+            else:  # By Status
+                # Group nodes by status
+                node_groups = node_statuses
+                group_colors = {
+                    'online': 'green',
+                    'warning': 'orange',
+                    'offline': 'red'
+                }
+            
+            # Add a trace for each group, selecting its nodes with a boolean mask
+            for group in np.unique(node_groups):
+                mask = node_groups == group
+                fig.add_trace(go.Scattergl(
+                    x=node_x[mask], y=node_y[mask],
+                    mode='markers',
+                    name=group.capitalize(),
+                    hoverinfo='text',
+                    text=node_text[mask],
+                    marker=dict(
+                        color=group_colors.get(group, 'gray'),
+                        size=node_size[mask],
+                        line=dict(width=1, color='#333')
+                    )
+                ))
         
-        # Add a trace for each status
-        for status, data in status_groups.items():
-            fig.add_trace(go.Scatter(
-                x=data['x'], y=data['y'],
-                mode='markers',
-                name=status.capitalize(),
-                hoverinfo='text',
-                text=data['text'],
-                marker=dict(
-                    color=status_colors.get(status, 'gray'),
-                    size=data['size'],
-                    line=dict(width=1, color='#333')
-                )
-            ))
-    
-    # Update the layout
-    fig.update_layout(
-        title='Network Topology Map',
-        showlegend=(view_type != "Default"),
-        hovermode='closest',
-        margin=dict(b=20, l=5, r=5, t=40),
-        xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-        height=600
-    )
+        fig.update_layout(showlegend=(view_type != "Default"))
+        st.session_state.topo_view_type = view_type
     
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, key="topo_chart")
     
     # Network statistics
     st.subheader("Network Statistics")
@@ -169,26 +308,18 @@ with tab1:
         st.metric(label="Avg. Connections Per Device", value=avg_connections)
         
     with col4:
-        # Calculate network diameter (longest shortest path)
-        try:
-            diameter = nx.diameter(G)
+        # Estimate network diameter (longest shortest path)
+        diameter = cached_diameter(network_size, edge_count)
+        if diameter is not None:
             st.metric(label="Network Diameter", value=diameter)
-        except nx.NetworkXError:
+        else:
             st.metric(label="Network Diameter", value="N/A (Disconnected)")
     
     # Network details
     st.subheader("Network Details")
     
     # Count devices by type
-    type_counts = {}
-    for node in G.nodes():
-        node_type = G.nodes[node]['type']
-        type_counts[node_type] = type_counts.get(node_type, 0) + 1
-    
-    type_df = pd.DataFrame({
-        'Device Type': list(type_counts.keys()),
-        'Count': list(type_counts.values())
-    })
+    type_df = pd.Series(node_types).value_counts().rename_axis('Device Type').reset_index(name='Count')
     
     col1, col2 = st.columns(2)
     
@@ -199,22 +330,14 @@ with tab1:
             values='Count',
             names='Device Type',
             title='Device Distribution by Type',
-            color_discrete_sequence=px.colors.sequential.Plasma
+            color_discrete_sequence=PLASMA
         )
         
         st.plotly_chart(fig, use_container_width=True)
         
     with col2:
         # Status distribution
-        status_counts = {}
-        for node in G.nodes():
-            node_status = G.nodes[node]['status']
-            status_counts[node_status] = status_counts.get(node_status, 0) + 1
-        
-        status_df = pd.DataFrame({
-            'Status': list(status_counts.keys()),
-            'Count': list(status_counts.values())
-        })
+        status_df = pd.Series(node_statuses).value_counts().rename_axis('Status').reset_index(name='Count')
         
         fig = px.pie(
             status_df,
@@ -231,8 +354,7 @@ with tab2:
     st.subheader("Recent Topology Changes")
     
     # Generate sample topology changes
-    changes = generate_topology_changes(20)
-    changes_df = pd.DataFrame(changes).sort_values('timestamp', ascending=False)
+    changes_df = cached_topology_changes(20)
     
     # Filter options
     col1, col2 = st.columns(2)
@@ -252,31 +374,14 @@ with tab2:
         )
     
     # Apply filters
-    filtered_df = changes_df[
-        changes_df['change_type'].isin(change_type_filter) & 
-        changes_df['device_type'].isin(device_type_filter)
-    ]
+    filtered_df = cached_filtered_changes(changes_df, tuple(sorted(change_type_filter)), tuple(sorted(device_type_filter)))
     
     # Format the DataFrame for display
     display_df = filtered_df[['timestamp', 'change_type', 'device_id', 'device_type', 'details']]
     
-    # Add styling to the dataframe
-    def highlight_change_type(val):
-        if val == 'Device Added':
-            return 'background-color: rgba(0, 128, 0, 0.2)'
-        elif val == 'Device Removed':
-            return 'background-color: rgba(255, 0, 0, 0.2)'
-        elif val == 'Link Added':
-            return 'background-color: rgba(0, 0, 255, 0.2)'
-        elif val == 'Link Removed':
-            return 'background-color: rgba(255, 165, 0, 0.2)'
-        elif val == 'Status Change':
-            return 'background-color: rgba(128, 0, 128, 0.2)'
-        return ''
-    
-    # Apply the styling
-    styled_df = display_df.style.map(
-        highlight_change_type, 
+    # Style the change type column in one pass with a dict lookup
+    styled_df = display_df.style.apply(
+        lambda col: col.map(CHANGE_COLORS).fillna(''),
         subset=['change_type']
     )
     
@@ -285,30 +390,17 @@ with tab2:
     # Change visualization
     st.subheader("Topology Change Trends")
     
-    # Group changes by type and date
-    changes_df['date'] = pd.to_datetime(changes_df['timestamp']).dt.date
-    
-    # Count changes by type and date
-    change_counts = changes_df.groupby(['date', 'change_type']).size().reset_index(name='count')
-    
-    # Pivot the data for visualization
-    pivot_df = change_counts.pivot(index='date', columns='change_type', values='count').fillna(0)
-    pivot_df = pivot_df.reset_index()
+    # Count changes by type and date, kept in long form for plotting
+    change_counts = changes_df.groupby(['date', 'change_type'], observed=True).size().reset_index(name='count')
     
     # Create a stacked bar chart
-    fig = go.Figure()
-    
-    for change_type in pivot_df.columns[1:]:
-        fig.add_trace(go.Bar(
-            x=pivot_df['date'],
-            y=pivot_df[change_type],
-            name=change_type
-        ))
-    
-    fig.update_layout(
+    fig = px.bar(
+        change_counts,
+        x='date',
+        y='count',
+        color='change_type',
         title='Topology Changes Over Time',
-        xaxis_title='Date',
-        yaxis_title='Number of Changes',
+        labels={'date': 'Date', 'count': 'Number of Changes', 'change_type': 'Change Type'},
         barmode='stack'
     )
     
@@ -321,7 +413,7 @@ with tab2:
     
     with col1:
         # Impact by device type
-        impact_by_device = changes_df.groupby('device_type').size().reset_index(name='count')
+        impact_by_device = changes_df.groupby('device_type', observed=True).size().reset_index(name='count')
         
         fig = px.bar(
             impact_by_device,
@@ -344,7 +436,7 @@ with tab2:
             values='Count',
             names='Change Type',
             title='Distribution of Change Types',
-            color_discrete_sequence=px.colors.sequential.Plasma
+            color_discrete_sequence=PLASMA
         )
         
         st.plotly_chart(fig, use_container_width=True)
@@ -353,17 +445,14 @@ with tab3:
     # Topology Analysis
     st.subheader("Network Topology Analysis")
     
-    # Generate a random network for analysis
-    analysis_size = random.randint(50, 100)
-    G_analysis = nx.barabasi_albert_graph(analysis_size, 3)  # Scale-free network
+    # Pick the size of the random scale-free network used for analysis once per session
+    analysis_size = st.session_state.setdefault("analysis_size", random.randint(50, 100))
     
     # Calculate network metrics
-    avg_degree = sum(dict(G_analysis.degree()).values()) / analysis_size
-    density = nx.density(G_analysis)
-    try:
-        avg_clustering = nx.average_clustering(G_analysis)
-    except:
-        avg_clustering = 0
+    analysis_metrics = cached_analysis_metrics(analysis_size)
+    avg_degree = analysis_metrics['avg_degree']
+    density = analysis_metrics['density']
+    avg_clustering = analysis_metrics['avg_clustering']
     
     # Display metrics
     st.markdown("### Network Metrics")
@@ -385,24 +474,8 @@ with tab3:
     # Critical nodes (high betweenness centrality)
     st.markdown("### Critical Nodes Analysis")
     
-    # Calculate betweenness centrality
-    betweenness = nx.betweenness_centrality(G_analysis)
-    
-    # Get top 10 nodes by betweenness
-    top_nodes = sorted(betweenness.items(), key=lambda x: x[1], reverse=True)[:10]
-    
-    # Create a DataFrame
-    node_ids = [n[0] for n in top_nodes]
-    centrality = [round(n[1], 4) for n in top_nodes]
-    node_types = [random.choice(['router', 'switch', 'server']) for _ in range(10)]
-    
-    critical_nodes_df = pd.DataFrame({
-        'Node ID': node_ids,
-        'Device Type': node_types,
-        'Betweenness Centrality': centrality,
-        'IP Address': [get_random_ip() for _ in range(10)],
-        'Status': [random.choice(['online', 'online', 'online', 'warning']) for _ in range(10)]
-    })
+    # Build the critical node and vulnerability tables
+    critical_nodes_df, vuln_df = cached_analysis_tables(analysis_size)
     
     st.dataframe(critical_nodes_df, use_container_width=True)
     
@@ -421,56 +494,9 @@ with tab3:
     # Vulnerability analysis
     st.markdown("### Network Vulnerability Analysis")
     
-    # Generate synthetic vulnerability data
-    vulnerability_types = [
-        "Single Point of Failure",
-        "Bottleneck Link",
-        "High Load Node",
-        "Redundancy Issue",
-        "Connectivity Risk"
-    ]
-    
-    severity_levels = ['Critical', 'High', 'Medium']
-    
-    vuln_data = []
-    for i in range(5):
-        vuln_type = vulnerability_types[i]
-        severity = severity_levels[random.randint(0, min(i, 2))]
-        
-        affected_nodes = random.randint(1, 5)
-        affected_links = random.randint(0, 3)
-        
-        risk_score = 0
-        if severity == 'Critical':
-            risk_score = random.randint(80, 100)
-        elif severity == 'High':
-            risk_score = random.randint(60, 79)
-        else:
-            risk_score = random.randint(40, 59)
-        
-        vuln_data.append({
-            'Vulnerability': vuln_type,
-            'Severity': severity,
-            'Affected Nodes': affected_nodes,
-            'Affected Links': affected_links,
-            'Risk Score': risk_score,
-            'Recommendation': f"Implement {random.choice(['redundancy', 'load balancing', 'failover', 'monitoring'])} for affected components"
-        })
-    
-    vuln_df = pd.DataFrame(vuln_data)
-    
-    # Apply styling to the dataframe
-    def highlight_severity(val):
-        if val == 'Critical':
-            return 'background-color: red; color: white'
-        elif val == 'High':
-            return 'background-color: orange; color: white'
-        else:
-            return 'background-color: yellow'
-    
-    # Apply the styling
-    styled_vuln_df = vuln_df.style.map(
-        highlight_severity, 
+    # Style the severity column in one pass with a dict lookup
+    styled_vuln_df = vuln_df.style.apply(
+        lambda col: col.map(SEVERITY_COLORS).fillna(''),
         subset=['Severity']
     )
     
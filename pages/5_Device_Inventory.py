@@ -1,11 +1,12 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 import datetime
 import time
-import random
-from utils import load_image, get_random_ip, get_random_mac
+import zlib
+from utils import load_image
 from data.mock_generator import generate_device_inventory
 
 # Set page configuration
@@ -58,39 +59,348 @@ with discovery_tab1:
             except Exception as e:
                 st.error(f"Discovery failed: {str(e)}")
 
-# Create tabs for different views
-tab1, tab2, tab3 = st.tabs(["Device List", "Inventory Analysis", "Compliance Status"])
+# String dtype for the inventory's text columns, searched with Arrow string kernels
+ARROW_STRING = pd.StringDtype("pyarrow")
 
-with tab1:
-    # Device Inventory List
-    st.subheader("Network Device Inventory")
+# Palette shared by the distribution pie charts
+PLASMA = list(px.colors.sequential.Plasma)
+
+# Colors used for device statuses in the details panel and status chart
+STATUS_COLORS = {
+    'online': 'green',
+    'warning': 'orange',
+    'offline': 'red',
+    'maintenance': 'blue'
+}
+
+# Status and compliance labels rendered in the tables in place of cell styling
+STATUS_LABELS = {
+    'online': '🟢 online',
+    'warning': '🟠 warning',
+    'offline': '🔴 offline',
+    'maintenance': '🔵 maintenance'
+}
+
+COMPLIANCE_LABELS = {
+    'Compliant': '✅ Compliant',
+    'Non-Compliant': '❌ Non-Compliant'
+}
+
+@st.cache_data(show_spinner=False)
+def cached_device_inventory(num_devices):
+    """
+    Generate the sample device inventory once per process, shared by every session.
+    
+    No TTL: the summary and compliance caches below are keyed on num_devices
+    alone and must keep describing this same inventory.
+    
+    Args:
+        num_devices: Number of devices to generate
+        
+    Returns:
+        DataFrame: Device inventory indexed by device_id, with a random
+        age_months column, the low-cardinality columns stored as categoricals
+        and the remaining text columns as Arrow-backed strings
+    """
+    devices_df = pd.DataFrame(generate_device_inventory(num_devices))
+    for col in ['device_type', 'status', 'network', 'manufacturer', 'location']:
+        devices_df[col] = devices_df[col].astype('category')
+    for col in ['device_id', 'device_name', 'model', 'ip_address', 'mac_address', 'os_version', 'last_updated']:
+        devices_df[col] = devices_df[col].astype(ARROW_STRING)
+    
+    # Index by device ID for direct lookups of the selected device
+    devices_df = devices_df.set_index('device_id', drop=False)
+    devices_df['age_months'] = np.random.default_rng().integers(1, 61, len(devices_df))
+    return devices_df
+
+@st.cache_data(show_spinner=False)
+def cached_inventory_summary(num_devices):
+    """
+    Collect the distinct values and value counts of the inventory's categorical columns.
+    
+    Args:
+        num_devices: Number of devices in the inventory
+        
+    Returns:
+        tuple: (uniques, counts) dicts keyed by column name, holding the sorted
+        distinct values and the value_counts Series respectively
+    """
+    devices_df = cached_device_inventory(num_devices)
+    columns = ['device_type', 'status', 'network', 'manufacturer', 'location', 'os_version']
+    uniques = {col: sorted(devices_df[col].dropna().unique().tolist()) for col in columns}
+    counts = {col: devices_df[col].value_counts() for col in columns}
+    return uniques, counts
+
+@st.cache_data(show_spinner=False)
+def cached_compliance_scores(num_devices, compliance_categories, seed=42):
+    """
+    Score every device in the cached inventory against each compliance category.
+    
+    Args:
+        num_devices: Number of devices in the inventory
+        compliance_categories: Tuple of compliance category names
+        seed: Seed for the score generator, so scores are stable across reruns
+        
+    Returns:
+        DataFrame: One row per device with a score per category and the overall score
+    """
+    devices_df = cached_device_inventory(num_devices)
+    rng = np.random.default_rng(seed)
+    
+    # Base score range on device status (online devices are more likely to be compliant)
+    status = devices_df['status'].to_numpy()
+    conditions = [status == 'online', status == 'warning', status == 'maintenance']
+    low = np.select(conditions, [80, 60, 50], default=0)
+    high = np.select(conditions, [101, 91, 96], default=71)  # offline: 0-70
+    
+    # Generate scores for every device and category in one draw
+    scores = rng.integers(low[:, None], high[:, None], size=(len(devices_df), len(compliance_categories)))
+    
+    compliance_df = devices_df[['device_id', 'device_name', 'device_type', 'status']].rename(columns={
+        'device_id': 'Device ID',
+        'device_name': 'Device Name',
+        'device_type': 'Device Type',
+        'status': 'Status'
+    }).assign(**{category: scores[:, i] for i, category in enumerate(compliance_categories)}).reset_index(drop=True)
+    
+    # Calculate overall compliance score
+    compliance_df['Overall Score'] = scores.mean(axis=1).round().astype(int)
+    
+    return compliance_df
+
+@st.cache_data(show_spinner=False)
+def cached_pie_figure(labels, values, title, color_map=None):
+    """
+    Build a pie chart from precomputed counts.
+    
+    Args:
+        labels: Slice labels
+        values: Slice values
+        title: Chart title
+        color_map: Optional dict of label to color; the Plasma sequence is used otherwise
+        
+    Returns:
+        go.Figure: The pie chart
+    """
+    if color_map:
+        colors = [color_map.get(label) for label in labels]
+    else:
+        colors = [PLASMA[i % len(PLASMA)] for i in range(len(labels))]
+    
+    return go.Figure(
+        go.Pie(labels=labels, values=values, marker=dict(colors=colors)),
+        layout=dict(title=title)
+    )
+
+@st.cache_data(show_spinner=False)
+def cached_bar_figure(x, y, title, x_title, y_title, colorscale='Viridis'):
+    """
+    Build a bar chart from precomputed values, colored by bar height.
+    
+    Args:
+        x: Bar categories
+        y: Bar values
+        title: Chart title
+        x_title: X axis title
+        y_title: Y axis and color bar title
+        colorscale: Continuous color scale for the bars
+        
+    Returns:
+        go.Figure: The bar chart
+    """
+    return go.Figure(
+        go.Bar(
+            x=x,
+            y=y,
+            marker=dict(color=y, colorscale=colorscale, showscale=True, colorbar=dict(title=y_title))
+        ),
+        layout=dict(title=title, xaxis_title=x_title, yaxis_title=y_title)
+    )
+
+@st.cache_data(show_spinner=False)
+def cached_gauge_figure(value, threshold):
+    """
+    Build the overall compliance rate gauge.
+    
+    Args:
+        value: Compliance percentage shown on the gauge
+        threshold: Compliance threshold marked on the gauge
+        
+    Returns:
+        go.Figure: The gauge chart
+    """
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=value,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Overall Compliance Rate"},
+        gauge={
+            'axis': {'range': [0, 100]},
+            'bar': {'color': "green"},
+            'steps': [
+                {'range': [0, 50], 'color': "red"},
+                {'range': [50, 70], 'color': "orange"},
+                {'range': [70, 100], 'color': "lightgreen"}
+            ],
+            'threshold': {
+                'line': {'color': "black", 'width': 4},
+                'thickness': 0.75,
+                'value': threshold
+            }
+        }
+    ))
+    
+    fig.update_layout(height=300)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def cached_csv_bytes(df):
+    """Encode a table as UTF-8 CSV for the export buttons."""
+    return df.to_csv(index=False).encode('utf-8')
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_device_activity(device_id, device_name):
+    """
+    Generate the sample uptime, performance chart and recent events for a device.
+    
+    Args:
+        device_id: ID of the selected device
+        device_name: Name of the selected device, used in the chart title
+        
+    Returns:
+        tuple: (uptime, perf_fig, event_df), with uptime as (days, hours, minutes)
+    """
+    # Seed from the device ID so each device gets its own stable history
+    rng = np.random.default_rng(zlib.crc32(device_id.encode()))
+    
+    # Uptime calculation (random for demonstration)
+    uptime = tuple(int(value) for value in rng.integers([1, 0, 0], [366, 24, 60]))
+    
+    # Generate some random performance data for demonstration
+    timestamps = pd.date_range(start=datetime.datetime.now() - datetime.timedelta(hours=24), 
+                              end=datetime.datetime.now(), 
+                              freq='h')
+    
+    perf_df = pd.DataFrame({
+        'Timestamp': timestamps,
+        'CPU Usage (%)': rng.integers(10, 91, len(timestamps)),
+        'Memory Usage (%)': rng.integers(20, 81, len(timestamps))
+    })
+    
+    perf_fig = go.Figure()
+    
+    perf_fig.add_trace(go.Scatter(
+        x=perf_df['Timestamp'],
+        y=perf_df['CPU Usage (%)'],
+        mode='lines',
+        name='CPU Usage (%)',
+        line=dict(color='blue', width=2)
+    ))
+    
+    perf_fig.add_trace(go.Scatter(
+        x=perf_df['Timestamp'],
+        y=perf_df['Memory Usage (%)'],
+        mode='lines',
+        name='Memory Usage (%)',
+        line=dict(color='green', width=2)
+    ))
+    
+    perf_fig.update_layout(
+        title=f'Performance Metrics for {device_name} (Last 24 Hours)',
+        xaxis_title='Time',
+        yaxis_title='Usage (%)',
+        hovermode='x unified'
+    )
+    
+    # Generate some random events for demonstration, drawing each column at once
+    event_types = [
+        "Login Success", 
+        "Configuration Change", 
+        "Interface Status Change", 
+        "System Restart", 
+        "Security Alert"
+    ]
+    num_events = 5
+    
+    offsets = pd.to_timedelta(
+        rng.integers(0, 25, num_events) * 3600 + rng.integers(0, 60, num_events) * 60,
+        unit='s'
+    )
+    event_times = pd.Timestamp.now() - offsets
+    types = rng.choice(event_types, size=num_events)
     
-    # Generate device inventory data
-    devices = generate_device_inventory(50)
-    devices_df = pd.DataFrame(devices)
+    # Source IPs in the same ranges as get_random_ip
+    octets = np.column_stack([
+        rng.integers(10, 193, num_events),
+        rng.integers(0, 256, (num_events, 2)),
+        rng.integers(1, 255, num_events)
+    ])
+    ips = ['.'.join(map(str, row)) for row in octets]
+    ports = [
+        f"GigabitEthernet{slot}/{port}"
+        for slot, port in zip(rng.integers(0, 3, num_events), rng.integers(0, 25, num_events))
+    ]
+    link_states = rng.choice(["up", "down"], size=num_events)
+    
+    descriptions = np.select(
+        [
+            types == "Login Success",
+            types == "Configuration Change",
+            types == "Interface Status Change",
+            types == "System Restart"
+        ],
+        [
+            [f"User 'admin' logged in from {ip}" for ip in ips],
+            ["Configuration changed by user 'admin'"] * num_events,
+            [f"Interface {port} changed to {state}" for port, state in zip(ports, link_states)],
+            ["System restarted due to scheduled maintenance"] * num_events
+        ],
+        default=[f"Unauthorized access attempt from {ip}" for ip in ips]  # Security Alert
+    )
+    
+    # Sort events by timestamp (most recent first)
+    event_df = pd.DataFrame({
+        "Timestamp": event_times,
+        "Event Type": types,
+        "Description": descriptions
+    }).sort_values("Timestamp", ascending=False)
+    
+    return uptime, perf_fig, event_df
+
+# Generate device inventory data
+devices_df = cached_device_inventory(50)
+inventory_uniques, inventory_counts = cached_inventory_summary(50)
+
+@st.fragment
+def device_list_view():
+    """
+    Render the filterable device table and the selected device's details.
     
+    Runs as a fragment, so filtering, searching and selecting a device only
+    rerun this view instead of rebuilding the analysis and compliance charts.
+    """
     # Filter options
     col1, col2, col3 = st.columns(3)
     
     with col1:
         device_type_filter = st.multiselect(
             "Filter by Device Type",
-            options=sorted(list(devices_df['device_type'].unique())),
-            default=sorted(list(devices_df['device_type'].unique()))
+            options=inventory_uniques['device_type'],
+            default=inventory_uniques['device_type']
         )
         
     with col2:
         status_filter = st.multiselect(
             "Filter by Status",
-            options=sorted(list(devices_df['status'].unique())),
-            default=sorted(list(devices_df['status'].unique()))
+            options=inventory_uniques['status'],
+            default=inventory_uniques['status']
         )
         
     with col3:
         network_filter = st.multiselect(
             "Filter by Network",
-            options=sorted(list(devices_df['network'].unique())),
-            default=sorted(list(devices_df['network'].unique()))
+            options=inventory_uniques['network'],
+            default=inventory_uniques['network']
         )
     
     # Add search box
@@ -104,45 +414,31 @@ with tab1:
     ]
     
     if search_query:
-        # Check if the query is in any of the string columns
-        query_mask = filtered_df.apply(
-            lambda row: any(
-                str(search_query).lower() in str(cell).lower() 
-                for cell in row
-            ),
-            axis=1
-        )
+        # Check if the query is in any of the columns, lowercasing each column once
+        query = search_query.lower()
+        lowered = filtered_df.drop(columns='age_months').astype(ARROW_STRING).apply(lambda col: col.str.lower())
+        query_mask = np.logical_or.reduce([
+            lowered[col].str.contains(query, regex=False, na=False).to_numpy()
+            for col in lowered.columns
+        ])
         filtered_df = filtered_df[query_mask]
     
     # Display the filtered devices table
     if not filtered_df.empty:
-        # Format the DataFrame for display
-        display_df = filtered_df.copy()
-        
-        # Add styling to the dataframe
-        def highlight_status(val):
-            if val == 'online':
-                return 'background-color: green; color: white'
-            elif val == 'warning':
-                return 'background-color: orange; color: white'
-            elif val == 'offline':
-                return 'background-color: red; color: white'
-            elif val == 'maintenance':
-                return 'background-color: blue; color: white'
-            return ''
-        
-        # Apply the styling
-        styled_df = display_df.style.map(
-            highlight_status, 
-            subset=['status']
+        # Format the DataFrame for display, leaving out the age used by the analysis tab
+        display_df = filtered_df.drop(columns='age_months').reset_index(drop=True)
+        
+        # Prefix the status with a colored marker instead of styling each cell
+        st.dataframe(
+            display_df.assign(status=display_df['status'].map(STATUS_LABELS)),
+            use_container_width=True,
+            column_config={"status": st.column_config.TextColumn("status")}
         )
         
-        st.dataframe(styled_df, use_container_width=True)
-        
         # Export options
         st.download_button(
             label="Export to CSV",
-            data=display_df.to_csv(index=False).encode('utf-8'),
+            data=cached_csv_bytes(display_df),
             file_name=f"device_inventory_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
             mime="text/csv"
         )
@@ -152,21 +448,21 @@ with tab1:
     # Device details section
     st.subheader("Device Details")
     
-    # Allow user to select a device to view details
-    device_ids = list(devices_df['device_id'])
-    device_names = list(devices_df['device_name'])
-    
-    # Create a list of device options (ID + Name)
-    device_options = [f"{id} - {name}" for id, name in zip(device_ids, device_names)]
+    # Allow user to select a device to view details, listed as ID + Name
+    device_labels = devices_df['device_id'] + ' - ' + devices_df['device_name']
     
-    selected_device_option = st.selectbox("Select a device to view details", options=device_options)
+    selected_device_id = st.selectbox(
+        "Select a device to view details",
+        options=devices_df.index,
+        format_func=lambda device_id: device_labels[device_id]
+    )
     
-    if selected_device_option:
-        # Extract the device ID from the selected option
-        selected_device_id = selected_device_option.split(" - ")[0]
+    if selected_device_id:
+        # Look up the selected device by its ID
+        device_data = devices_df.loc[selected_device_id]
         
-        # Find the selected device in the DataFrame
-        device_data = devices_df[devices_df['device_id'] == selected_device_id].iloc[0]
+        # Sample activity for the device, shared by reruns within a minute
+        uptime, perf_fig, event_df = cached_device_activity(selected_device_id, device_data['device_name'])
         
         # Display device details
         col1, col2 = st.columns(2)
@@ -181,9 +477,7 @@ with tab1:
             st.markdown(f"**MAC Address:** {device_data['mac_address']}")
             
         with col2:
-            status_color = "green" if device_data['status'] == "online" else \
-                          "orange" if device_data['status'] == "warning" else \
-                          "red" if device_data['status'] == "offline" else "blue"
+            status_color = STATUS_COLORS.get(device_data['status'], 'blue')
             
             st.markdown(f"**Status:** <span style='color:{status_color};font-weight:bold'>{device_data['status'].upper()}</span>", unsafe_allow_html=True)
             st.markdown(f"**Network:** {device_data['network']}")
@@ -192,99 +486,203 @@ with tab1:
             st.markdown(f"**Last Updated:** {device_data['last_updated']}")
             
             # Uptime calculation (random for demonstration)
-            uptime_days = random.randint(1, 365)
-            uptime_hours = random.randint(0, 23)
-            uptime_minutes = random.randint(0, 59)
+            uptime_days, uptime_hours, uptime_minutes = uptime
             st.markdown(f"**Uptime:** {uptime_days}d {uptime_hours}h {uptime_minutes}m")
         
         # Performance metrics
         st.markdown("### Device Performance")
         
-        # Generate some random performance data for demonstration
-        timestamps = pd.date_range(start=datetime.datetime.now() - datetime.timedelta(hours=24), 
-                                  end=datetime.datetime.now(), 
-                                  freq='h')
-        
-        cpu_values = [random.randint(10, 90) for _ in range(len(timestamps))]
-        memory_values = [random.randint(20, 80) for _ in range(len(timestamps))]
-        
-        perf_df = pd.DataFrame({
-            'Timestamp': timestamps,
-            'CPU Usage (%)': cpu_values,
-            'Memory Usage (%)': memory_values
-        })
-        
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=perf_df['Timestamp'],
-            y=perf_df['CPU Usage (%)'],
-            mode='lines',
-            name='CPU Usage (%)',
-            line=dict(color='blue', width=2)
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=perf_df['Timestamp'],
-            y=perf_df['Memory Usage (%)'],
-            mode='lines',
-            name='Memory Usage (%)',
-            line=dict(color='green', width=2)
-        ))
-        
-        fig.update_layout(
-            title=f'Performance Metrics for {device_data["device_name"]} (Last 24 Hours)',
-            xaxis_title='Time',
-            yaxis_title='Usage (%)',
-            hovermode='x unified'
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(perf_fig, use_container_width=True)
         
         # Recent events
         st.markdown("### Recent Events")
         
-        # Generate some random events for demonstration
-        event_types = [
-            "Login Success", 
-            "Configuration Change", 
-            "Interface Status Change", 
-            "System Restart", 
-            "Security Alert"
-        ]
-        
-        event_data = []
-        for _ in range(5):
-            event_time = datetime.datetime.now() - datetime.timedelta(
-                hours=random.randint(0, 24),
-                minutes=random.randint(0, 59)
-            )
-            
-            event_type = random.choice(event_types)
-            
-            if event_type == "Login Success":
-                description = f"User 'admin' logged in from {get_random_ip()}"
-            elif event_type == "Configuration Change":
-                description = f"Configuration changed by user 'admin'"
-            elif event_type == "Interface Status Change":
-                port = f"GigabitEthernet{random.randint(0, 2)}/{random.randint(0, 24)}"
-                status = random.choice(["up", "down"])
-                description = f"Interface {port} changed to {status}"
-            elif event_type == "System Restart":
-                description = "System restarted due to scheduled maintenance"
-            else:  # Security Alert
-                description = f"Unauthorized access attempt from {get_random_ip()}"
-            
-            event_data.append({
-                "Timestamp": event_time,
-                "Event Type": event_type,
-                "Description": description
-            })
+        st.dataframe(event_df, use_container_width=True)
+
+@st.fragment
+def compliance_view():
+    """
+    Render the compliance summary, charts and per-device details.
+    
+    Runs as a fragment, so moving the threshold or changing the device type
+    filter only reruns this view.
+    """
+    # Add compliance data to devices
+    compliance_categories = [
+        "Security Patch Level",
+        "Configuration Compliance",
+        "Access Control",
+        "Encryption Standards",
+        "Authentication Methods"
+    ]
+    
+    # Generate compliance scores
+    compliance_df = cached_compliance_scores(50, tuple(compliance_categories))
+    
+    # Filter options
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        compliance_threshold = st.slider(
+            "Compliance Threshold (%)", 
+            min_value=0, 
+            max_value=100, 
+            value=70
+        )
+    
+    with col2:
+        device_type_filter = st.multiselect(
+            "Filter by Device Type",
+            options=inventory_uniques['device_type'],
+            default=inventory_uniques['device_type'],
+            key="compliance_device_type_filter"
+        )
+    
+    # Filter by selected device types and calculate compliance status
+    filtered_compliance = compliance_df[compliance_df['Device Type'].isin(device_type_filter)].copy()
+    
+    # Add compliance status based on threshold
+    filtered_compliance['Compliance Status'] = np.where(
+        filtered_compliance['Overall Score'].to_numpy() >= compliance_threshold,
+        "Compliant",
+        "Non-Compliant"
+    )
+    
+    # Display compliance status summary
+    total_devices = len(filtered_compliance)
+    compliant_devices = len(filtered_compliance[filtered_compliance['Compliance Status'] == "Compliant"])
+    non_compliant_devices = total_devices - compliant_devices
+    compliance_percentage = round((compliant_devices / total_devices) * 100, 1) if total_devices > 0 else 0
+    
+    st.markdown(f"### Compliance Summary (Threshold: {compliance_threshold}%)")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric(label="Total Devices", value=total_devices)
         
-        # Sort events by timestamp (most recent first)
-        event_df = pd.DataFrame(event_data).sort_values("Timestamp", ascending=False)
+    with col2:
+        st.metric(label="Compliant Devices", value=compliant_devices)
         
-        st.dataframe(event_df, use_container_width=True)
+    with col3:
+        st.metric(label="Overall Compliance", value=f"{compliance_percentage}%")
+    
+    # Compliance gauge
+    fig = cached_gauge_figure(compliance_percentage, compliance_threshold)
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Compliance by category
+    st.subheader("Compliance by Category")
+    
+    # Calculate average compliance score for each category
+    category_scores = {
+        category: round(filtered_compliance[category].mean(), 1)
+        for category in compliance_categories
+    }
+    
+    category_df = pd.DataFrame({
+        'Category': list(category_scores.keys()),
+        'Average Score': list(category_scores.values())
+    })
+    
+    fig = px.bar(
+        category_df,
+        x='Category',
+        y='Average Score',
+        title='Average Compliance Score by Category',
+        color='Average Score',
+        color_continuous_scale='RdYlGn',
+        range_color=[0, 100]
+    )
+    
+    # Add threshold line
+    fig.add_hline(
+        y=compliance_threshold,
+        line_dash="dash",
+        line_color="red",
+        annotation_text=f"Threshold ({compliance_threshold}%)",
+        annotation_position="bottom right"
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Compliance details table
+    st.subheader("Device Compliance Details")
+    
+    # Format table for display
+    display_columns = ['Device ID', 'Device Name', 'Device Type', 'Status'] + \
+                      compliance_categories + ['Overall Score', 'Compliance Status']
+    
+    display_compliance = filtered_compliance[display_columns].sort_values('Overall Score', ascending=False)
+    
+    # Render scores as progress bars and label the status, without per-cell styling
+    score_config = {
+        column: st.column_config.ProgressColumn(column, min_value=0, max_value=100, format="%d")
+        for column in compliance_categories + ['Overall Score']
+    }
+    
+    st.dataframe(
+        display_compliance.assign(**{
+            'Compliance Status': display_compliance['Compliance Status'].map(COMPLIANCE_LABELS)
+        }),
+        use_container_width=True,
+        column_config=score_config
+    )
+    
+    # Export options
+    st.download_button(
+        label="Export Compliance Report to CSV",
+        data=cached_csv_bytes(display_compliance),
+        file_name=f"compliance_report_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+        mime="text/csv"
+    )
+    
+    # Non-compliant devices focus
+    st.subheader("Focus on Non-Compliant Devices")
+    
+    non_compliant = display_compliance[display_compliance['Compliance Status'] == "Non-Compliant"]
+    
+    if not non_compliant.empty:
+        # Group by device type
+        non_compliant_by_type = non_compliant.groupby('Device Type', observed=True).size()
+        
+        fig = cached_pie_figure(
+            non_compliant_by_type.index.tolist(),
+            non_compliant_by_type.tolist(),
+            'Non-Compliant Devices by Type'
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Find the most common compliance issues: count devices that fail each category
+        issue_counts = (non_compliant[compliance_categories].to_numpy() < compliance_threshold).sum(axis=0)
+        
+        issue_df = pd.DataFrame({
+            'Compliance Category': compliance_categories,
+            'Non-Compliant Count': issue_counts
+        }).sort_values('Non-Compliant Count', ascending=False)
+        
+        fig = cached_bar_figure(
+            issue_df['Compliance Category'].tolist(),
+            issue_df['Non-Compliant Count'].tolist(),
+            'Most Common Compliance Issues',
+            'Compliance Category',
+            'Non-Compliant Count',
+            colorscale='Reds'
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.success("All devices meet the compliance threshold!")
+
+# Create tabs for different views
+tab1, tab2, tab3 = st.tabs(["Device List", "Inventory Analysis", "Compliance Status"])
+
+with tab1:
+    # Device Inventory List
+    st.subheader("Network Device Inventory")
+    
+    device_list_view()
 
 with tab2:
     # Inventory Analysis
@@ -292,74 +690,54 @@ with tab2:
     
     # Generate stats from the inventory data
     if 'devices_df' in locals():
-        # Device Type Distribution
-        device_type_counts = devices_df['device_type'].value_counts().reset_index()
-        device_type_counts.columns = ['Device Type', 'Count']
-        
-        # Status Distribution
-        status_counts = devices_df['status'].value_counts().reset_index()
-        status_counts.columns = ['Status', 'Count']
-        
-        # Manufacturer Distribution
-        manufacturer_counts = devices_df['manufacturer'].value_counts().nlargest(10).reset_index()
-        manufacturer_counts.columns = ['Manufacturer', 'Count']
-        
-        # Network Distribution
-        network_counts = devices_df['network'].value_counts().reset_index()
-        network_counts.columns = ['Network', 'Count']
+        # Device Type, Status, Manufacturer and Network Distributions
+        device_type_counts = inventory_counts['device_type']
+        status_counts = inventory_counts['status']
+        manufacturer_counts = inventory_counts['manufacturer'].nlargest(10)
+        network_counts = inventory_counts['network']
         
         # Visualize the distributions
         col1, col2 = st.columns(2)
         
         with col1:
             # Device Type Distribution
-            fig = px.pie(
-                device_type_counts,
-                values='Count',
-                names='Device Type',
-                title='Device Type Distribution',
-                color_discrete_sequence=px.colors.sequential.Plasma
+            fig = cached_pie_figure(
+                device_type_counts.index.tolist(),
+                device_type_counts.tolist(),
+                'Device Type Distribution'
             )
             
             st.plotly_chart(fig, use_container_width=True)
             
             # Manufacturer Distribution
-            fig = px.bar(
-                manufacturer_counts,
-                x='Manufacturer',
-                y='Count',
-                title='Top 10 Manufacturers',
-                color='Count',
-                color_continuous_scale='Viridis'
+            fig = cached_bar_figure(
+                manufacturer_counts.index.tolist(),
+                manufacturer_counts.tolist(),
+                'Top 10 Manufacturers',
+                'Manufacturer',
+                'Count'
             )
             
             st.plotly_chart(fig, use_container_width=True)
             
         with col2:
             # Status Distribution
-            fig = px.pie(
-                status_counts,
-                values='Count',
-                names='Status',
-                title='Device Status Distribution',
-                color_discrete_map={
-                    'online': 'green',
-                    'warning': 'orange',
-                    'offline': 'red',
-                    'maintenance': 'blue'
-                }
+            fig = cached_pie_figure(
+                status_counts.index.tolist(),
+                status_counts.tolist(),
+                'Device Status Distribution',
+                color_map=STATUS_COLORS
             )
             
             st.plotly_chart(fig, use_container_width=True)
             
             # Network Distribution
-            fig = px.bar(
-                network_counts,
-                x='Network',
-                y='Count',
-                title='Device Distribution by Network',
-                color='Count',
-                color_continuous_scale='Viridis'
+            fig = cached_bar_figure(
+                network_counts.index.tolist(),
+                network_counts.tolist(),
+                'Device Distribution by Network',
+                'Network',
+                'Count'
             )
             
             st.plotly_chart(fig, use_container_width=True)
@@ -368,16 +746,14 @@ with tab2:
         st.subheader("OS/Firmware Version Analysis")
         
         # Extract OS/Firmware versions
-        os_counts = devices_df['os_version'].value_counts().nlargest(10).reset_index()
-        os_counts.columns = ['OS/Firmware Version', 'Count']
-        
-        fig = px.bar(
-            os_counts,
-            x='OS/Firmware Version',
-            y='Count',
-            title='Top 10 OS/Firmware Versions',
-            color='Count',
-            color_continuous_scale='Viridis'
+        os_counts = inventory_counts['os_version'].nlargest(10)
+        
+        fig = cached_bar_figure(
+            os_counts.index.tolist(),
+            os_counts.tolist(),
+            'Top 10 OS/Firmware Versions',
+            'OS/Firmware Version',
+            'Count'
         )
         
         st.plotly_chart(fig, use_container_width=True)
@@ -385,20 +761,16 @@ with tab2:
         # Age Analysis
         st.subheader("Device Age Analysis")
         
-        # Add random age data for demonstration
-        devices_df['age_months'] = [random.randint(1, 60) for _ in range(len(devices_df))]
-        
         # Group by type and calculate average age
-        age_by_type = devices_df.groupby('device_type')['age_months'].mean().reset_index()
-        age_by_type.columns = ['Device Type', 'Average Age (Months)']
-        
-        fig = px.bar(
-            age_by_type,
-            x='Device Type',
-            y='Average Age (Months)',
-            title='Average Device Age by Type',
-            color='Average Age (Months)',
-            color_continuous_scale='RdYlGn_r'  # Reversed green-yellow-red scale
+        age_by_type = devices_df.groupby('device_type', observed=True)['age_months'].mean()
+        
+        fig = cached_bar_figure(
+            age_by_type.index.tolist(),
+            age_by_type.tolist(),
+            'Average Device Age by Type',
+            'Device Type',
+            'Average Age (Months)',
+            colorscale='RdYlGn_r'  # Reversed green-yellow-red scale
         )
         
         st.plotly_chart(fig, use_container_width=True)
@@ -406,15 +778,12 @@ with tab2:
         # Location Distribution
         st.subheader("Device Location Distribution")
         
-        location_counts = devices_df['location'].value_counts().reset_index()
-        location_counts.columns = ['Location', 'Count']
+        location_counts = inventory_counts['location']
         
-        fig = px.pie(
-            location_counts,
-            values='Count',
-            names='Location',
-            title='Device Distribution by Location',
-            color_discrete_sequence=px.colors.sequential.Plasma
+        fig = cached_pie_figure(
+            location_counts.index.tolist(),
+            location_counts.tolist(),
+            'Device Distribution by Location'
         )
         
         st.plotly_chart(fig, use_container_width=True)
@@ -427,245 +796,7 @@ with tab3:
     
     # Create compliance data
     if 'devices_df' in locals():
-        # Add compliance data to devices
-        compliance_categories = [
-            "Security Patch Level",
-            "Configuration Compliance",
-            "Access Control",
-            "Encryption Standards",
-            "Authentication Methods"
-        ]
-        
-        # Generate compliance scores
-        compliance_data = []
-        for _, device in devices_df.iterrows():
-            device_compliance = {
-                "Device ID": device['device_id'],
-                "Device Name": device['device_name'],
-                "Device Type": device['device_type'],
-                "Status": device['status']
-            }
-            
-            # Generate scores for each compliance category
-            for category in compliance_categories:
-                # Base score on device status (online devices are more likely to be compliant)
-                if device['status'] == 'online':
-                    score = random.randint(80, 100)
-                elif device['status'] == 'warning':
-                    score = random.randint(60, 90)
-                elif device['status'] == 'maintenance':
-                    score = random.randint(50, 95)
-                else:  # offline
-                    score = random.randint(0, 70)
-                
-                device_compliance[category] = score
-            
-            # Calculate overall compliance score
-            device_compliance["Overall Score"] = round(
-                sum(device_compliance[cat] for cat in compliance_categories) / len(compliance_categories)
-            )
-            
-            compliance_data.append(device_compliance)
-        
-        compliance_df = pd.DataFrame(compliance_data)
-        
-        # Filter options
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            compliance_threshold = st.slider(
-                "Compliance Threshold (%)", 
-                min_value=0, 
-                max_value=100, 
-                value=70
-            )
-        
-        with col2:
-            device_type_filter = st.multiselect(
-                "Filter by Device Type",
-                options=sorted(list(compliance_df['Device Type'].unique())),
-                default=sorted(list(compliance_df['Device Type'].unique())),
-                key="compliance_device_type_filter"
-            )
-        
-        # Filter by selected device types and calculate compliance status
-        filtered_compliance = compliance_df[compliance_df['Device Type'].isin(device_type_filter)].copy()
-        
-        # Add compliance status based on threshold
-        filtered_compliance['Compliance Status'] = filtered_compliance['Overall Score'].apply(
-            lambda x: "Compliant" if x >= compliance_threshold else "Non-Compliant"
-        )
-        
-        # Display compliance status summary
-        total_devices = len(filtered_compliance)
-        compliant_devices = len(filtered_compliance[filtered_compliance['Compliance Status'] == "Compliant"])
-        non_compliant_devices = total_devices - compliant_devices
-        compliance_percentage = round((compliant_devices / total_devices) * 100, 1) if total_devices > 0 else 0
-        
-        st.markdown(f"### Compliance Summary (Threshold: {compliance_threshold}%)")
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric(label="Total Devices", value=total_devices)
-            
-        with col2:
-            st.metric(label="Compliant Devices", value=compliant_devices)
-            
-        with col3:
-            st.metric(label="Overall Compliance", value=f"{compliance_percentage}%")
-        
-        # Compliance gauge
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=compliance_percentage,
-            domain={'x': [0, 1], 'y': [0, 1]},
-            title={'text': "Overall Compliance Rate"},
-            gauge={
-                'axis': {'range': [0, 100]},
-                'bar': {'color': "green"},
-                'steps': [
-                    {'range': [0, 50], 'color': "red"},
-                    {'range': [50, 70], 'color': "orange"},
-                    {'range': [70, 100], 'color': "lightgreen"}
-                ],
-                'threshold': {
-                    'line': {'color': "black", 'width': 4},
-                    'thickness': 0.75,
-                    'value': compliance_threshold
-                }
-            }
-        ))
-        
-        fig.update_layout(height=300)
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Compliance by category
-        st.subheader("Compliance by Category")
-        
-        # Calculate average compliance score for each category
-        category_scores = {
-            category: round(filtered_compliance[category].mean(), 1)
-            for category in compliance_categories
-        }
-        
-        category_df = pd.DataFrame({
-            'Category': list(category_scores.keys()),
-            'Average Score': list(category_scores.values())
-        })
-        
-        fig = px.bar(
-            category_df,
-            x='Category',
-            y='Average Score',
-            title='Average Compliance Score by Category',
-            color='Average Score',
-            color_continuous_scale='RdYlGn',
-            range_color=[0, 100]
-        )
-        
-        # Add threshold line
-        fig.add_hline(
-            y=compliance_threshold,
-            line_dash="dash",
-            line_color="red",
-            annotation_text=f"Threshold ({compliance_threshold}%)",
-            annotation_position="bottom right"
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Compliance details table
-        st.subheader("Device Compliance Details")
-        
-        # Format table for display
-        display_columns = ['Device ID', 'Device Name', 'Device Type', 'Status'] + \
-                          compliance_categories + ['Overall Score', 'Compliance Status']
-        
-        display_compliance = filtered_compliance[display_columns].sort_values('Overall Score', ascending=False)
-        
-        # Apply styling to the dataframe
-        def highlight_compliance(val):
-            if val == "Compliant":
-                return 'background-color: green; color: white'
-            else:
-                return 'background-color: red; color: white'
-        
-        def highlight_score(val):
-            if isinstance(val, (int, float)):
-                if val >= 90:
-                    return 'background-color: rgba(0, 128, 0, 0.2)'
-                elif val >= 70:
-                    return 'background-color: rgba(255, 255, 0, 0.2)'
-                elif val >= 50:
-                    return 'background-color: rgba(255, 165, 0, 0.2)'
-                else:
-                    return 'background-color: rgba(255, 0, 0, 0.2)'
-            return ''
-        
-        # Apply the styling
-        styled_compliance = display_compliance.style.map(
-            highlight_compliance, 
-            subset=['Compliance Status']
-        ).map(
-            highlight_score,
-            subset=compliance_categories + ['Overall Score']
-        )
-        
-        st.dataframe(styled_compliance, use_container_width=True)
-        
-        # Export options
-        st.download_button(
-            label="Export Compliance Report to CSV",
-            data=display_compliance.to_csv(index=False).encode('utf-8'),
-            file_name=f"compliance_report_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            mime="text/csv"
-        )
-        
-        # Non-compliant devices focus
-        st.subheader("Focus on Non-Compliant Devices")
-        
-        non_compliant = display_compliance[display_compliance['Compliance Status'] == "Non-Compliant"]
-        
-        if not non_compliant.empty:
-            # Group by device type
-            non_compliant_by_type = non_compliant.groupby('Device Type').size().reset_index()
-            non_compliant_by_type.columns = ['Device Type', 'Count']
-            
-            fig = px.pie(
-                non_compliant_by_type,
-                values='Count',
-                names='Device Type',
-                title='Non-Compliant Devices by Type',
-                color_discrete_sequence=px.colors.sequential.Plasma
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Find the most common compliance issues
-            issue_counts = {}
-            for category in compliance_categories:
-                # Count devices that fail this category
-                count = len(non_compliant[non_compliant[category] < compliance_threshold])
-                issue_counts[category] = count
-            
-            issue_df = pd.DataFrame({
-                'Compliance Category': list(issue_counts.keys()),
-                'Non-Compliant Count': list(issue_counts.values())
-            }).sort_values('Non-Compliant Count', ascending=False)
-            
-            fig = px.bar(
-                issue_df,
-                x='Compliance Category',
-                y='Non-Compliant Count',
-                title='Most Common Compliance Issues',
-                color='Non-Compliant Count',
-                color_continuous_scale='Reds'
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.success("All devices meet the compliance threshold!")
+        compliance_view()
     else:
         st.warning("No inventory data available for compliance analysis.")
 
@@ -1,15 +1,17 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 import datetime
+import time
 import random
-import nmap
+import pickle
+import bisect
 import io
-import base64
-from scapy.all import IP, TCP, ICMP, UDP, rdpcap
-from sqlalchemy import text
+import dpkt
+from collections import Counter
+from sqlalchemy import Boolean, DateTime, Integer, String, Text, bindparam, text
 import textwrap
+import uuid
 from database.db_utils import get_session
 from database.models import SecurityEvent, AlertSeverity
 
@@ -27,111 +29,352 @@ st.subheader("Manage and respond to security incidents")
 # Incident Management Tabs
 tabs = st.tabs(["Active Incidents", "Incident Details", "Playbooks", "Forensics", "Real-time Response"])
 
+# Severity and status labels rendered in the incident table in place of cell styling
+SEVERITY_LABELS = {
+    "Critical": "🔴 Critical",
+    "High": "🟠 High",
+    "Medium": "🟡 Medium",
+    "Low": "🟢 Low"
+}
+
+INCIDENT_STATUS_LABELS = {
+    "New": "🔴 New",
+    "In Progress": "🟠 In Progress",
+    "Contained": "🔵 Contained",
+    "Resolved": "🟢 Resolved",
+    "Closed": "⚪ Closed"
+}
+
+# Newest security events fetched per page load (served by ix_security_events_timestamp)
+EVENT_FETCH_LIMIT = 500
+
+# Compact dtypes for the static demo tables
+ARROW_STRING = pd.StringDtype("pyarrow")
+DEMO_ID_COLUMNS = {"PID", "Event ID"}
+
+# Most markers drawn per activity timeline trace before it is downsampled
+TIMELINE_MAX_POINTS = 2000
+
+# Badge colors for the incident details header
+SEVERITY_COLORS = {
+    "critical": "red",
+    "high": "orange",
+    "medium": "yellow",
+    "low": "green"
+}
+
+INCIDENT_STATUS_COLORS = {
+    "New": "red",
+    "In Progress": "orange",
+    "Contained": "blue",
+    "Resolved": "green",
+    "Closed": "gray"
+}
+
 # Helper functions
 def get_incident_status_color(status):
-    colors = {
-        "New": "red",
-        "In Progress": "orange",
-        "Contained": "blue",
-        "Resolved": "green",
-        "Closed": "gray"
-    }
-    return colors.get(status, "gray")
+    return INCIDENT_STATUS_COLORS.get(status, "gray")
 
-def time_since(timestamp):
-    now = datetime.datetime.now()
-    delta = now - timestamp
-    
-    if delta.days > 0:
-        return f"{delta.days} days ago"
-    elif delta.seconds >= 3600:
-        return f"{delta.seconds // 3600} hours ago"
-    elif delta.seconds >= 60:
-        return f"{delta.seconds // 60} minutes ago"
-    else:
-        return f"{delta.seconds} seconds ago"
+def time_since(timestamps):
+    """
+    Format how long ago each timestamp was, relative to a single "now".
+    
+    Args:
+        timestamps: Series of datetimes
+        
+    Returns:
+        ndarray: Strings such as "3 hours ago"
+    """
+    secs = (pd.Timestamp.now() - pd.to_datetime(timestamps)).dt.total_seconds().to_numpy()
+    days, secs_of_day = np.divmod(secs, 86400)
+    days = days.astype(int)
+    secs_of_day = secs_of_day.astype(int)
+    
+    return np.select(
+        [days > 0, secs_of_day >= 3600, secs_of_day >= 60],
+        [
+            np.char.add(days.astype(str), " days ago"),
+            np.char.add((secs_of_day // 3600).astype(str), " hours ago"),
+            np.char.add((secs_of_day // 60).astype(str), " minutes ago")
+        ],
+        default=np.char.add(secs_of_day.astype(str), " seconds ago")
+    )
 
-def get_security_events():
-    # Get data from the database
+# Security events joined with device names, with typed result columns; the database
+# fills in severity and device name defaults so no NULLs reach Python
+SECURITY_EVENTS_SQL = """
+    SELECT 
+        se.id, 
+        se.timestamp, 
+        se.event_type, 
+        se.source_ip, 
+        se.destination_ip,
+        se.description, 
+        LOWER(COALESCE(CAST(se.severity AS TEXT), 'unknown')) AS severity, 
+        se.is_resolved,
+        COALESCE(nd.device_name, 'Unknown Device') AS device_name
+    FROM security_events se
+    LEFT JOIN network_devices nd ON se.device_id = nd.id
+    {where_clause}
+    ORDER BY se.timestamp DESC
+    {limit_clause}
+"""
+
+SECURITY_EVENT_COLUMNS = {
+    "id": Integer,
+    "timestamp": DateTime,
+    "event_type": String,
+    "source_ip": String,
+    "destination_ip": String,
+    "description": Text,
+    "severity": String,
+    "is_resolved": Boolean,
+    "device_name": String
+}
+
+# Statements are built once per script run instead of inside every fetch
+RECENT_EVENTS_STMT = text(
+    SECURITY_EVENTS_SQL.format(where_clause="", limit_clause="LIMIT :limit")
+).columns(**SECURITY_EVENT_COLUMNS)
+
+EVENTS_BY_ID_STMT = text(
+    SECURITY_EVENTS_SQL.format(where_clause="WHERE se.id IN :ids", limit_clause="")
+).bindparams(bindparam("ids", expanding=True)).columns(**SECURITY_EVENT_COLUMNS)
+
+def query_security_events(statement, params):
+    """
+    Run a security events statement.
+    
+    Args:
+        statement: One of the prebuilt security event statements
+        params: Bound parameters for the statement
+        
+    Returns:
+        DataFrame: One row per event, newest first
+    """
     session = get_session()
     try:
-        query = text("""
-            SELECT 
-                se.id, 
-                se.timestamp, 
-                se.event_type, 
-                se.source_ip, 
-                se.destination_ip,
-                se.description, 
-                se.severity, 
-                se.is_resolved,
-                nd.device_name
-            FROM security_events se
-            LEFT JOIN network_devices nd ON se.device_id = nd.id
-            ORDER BY se.timestamp DESC
-        """)
+        result = session.execute(statement, params)
+        return pd.DataFrame(result.mappings().all(), columns=list(result.keys()))
+    finally:
+        session.close()
+
+# Cache the security events query so reruns and the details tab share one fetch
+@st.cache_data(ttl=30, show_spinner=False)
+def cached_security_events(limit=EVENT_FETCH_LIMIT):
+    """
+    Fetch the newest security events joined with their device names.
+    
+    Args:
+        limit: Maximum number of events to fetch
         
-        result = session.execute(query)
+    Returns:
+        DataFrame: One row per event, newest first
+    """
+    return query_security_events(RECENT_EVENTS_STMT, {"limit": limit})
+
+# Cache related-event lookups per incident, fetching only the rows it references
+@st.cache_data(ttl=30, show_spinner=False)
+def cached_events_by_ids(event_ids):
+    """
+    Fetch the given security events joined with their device names.
+    
+    Args:
+        event_ids: Tuple of security event IDs
         
-        events = []
-        for row in result:
-            # Convert to a dictionary for easier handling
-            event = {
-                "id": row[0],
-                "timestamp": row[1],
-                "event_type": row[2],
-                "source_ip": row[3],
-                "destination_ip": row[4],
-                "description": row[5],
-                "severity": row[6].lower() if row[6] else "unknown",
-                "is_resolved": row[7],
-                "device_name": row[8] if row[8] else "Unknown Device"
-            }
-            events.append(event)
-            
-        return events
+    Returns:
+        DataFrame: Matching events, newest first
+    """
+    return query_security_events(EVENTS_BY_ID_STMT, {"ids": list(event_ids)})
+
+def get_security_events():
+    # Get data from the database (errors are not cached, so the next rerun retries)
+    try:
+        return cached_security_events().to_dict("records")
     except Exception as e:
         st.error(f"Error retrieving security events: {str(e)}")
         return []
-    finally:
-        session.close()
 
-# Load sample incident data or create if not exists
-if 'incidents' not in st.session_state:
-    # Create some sample incidents based on security events
-    events = get_security_events()
+def get_events_by_ids(event_ids):
+    # Get only the referenced events from the database
+    if not event_ids:
+        return []
+    try:
+        return cached_events_by_ids(tuple(sorted(event_ids))).to_dict("records")
+    except Exception as e:
+        st.error(f"Error retrieving related events: {str(e)}")
+        return []
+
+# Cache the incident table per incidents version; every change bumps the version
+@st.cache_data(show_spinner=False, max_entries=50)
+def cached_incident_table(version, _incidents):
+    """
+    Build the incident summary table.
+    
+    Args:
+        version: Token identifying the current state of the session's incidents
+        _incidents: Incident dictionaries (excluded from the cache key)
+        
+    Returns:
+        DataFrame: One row per incident
+    """
+    return pd.DataFrame([
+        {
+            "ID": i["id"],
+            "Title": i["title"],
+            "Type": i["type"],
+            "Severity": i["severity"].capitalize(),
+            "Status": i["status"],
+            "Detected": i["detected"],
+            "Assigned To": i["assigned_to"]
+        } for i in _incidents
+    ])
+
+def bump_incidents_version():
+    # A fresh random token keeps sessions from sharing cached incident tables
+    st.session_state.incidents_version = uuid.uuid4().hex
+
+def add_incident_entry(entries, entry):
+    # Timelines and notes are kept newest-first so the details tab can render them
+    # without sorting; sample timelines can hold future-dated entries, so insert in order
+    bisect.insort_left(entries, entry, key=lambda e: -e["timestamp"].timestamp())
+
+# IP protocol numbers shown by name in capture summaries
+IP_PROTOCOL_NAMES = {
+    1: "ICMP",
+    6: "TCP",
+    17: "UDP",
+    58: "ICMP"
+}
+
+# First bytes of a PCAPNG file (section header block type)
+PCAPNG_MAGIC = b"\x0a\x0d\x0d\x0a"
+
+# Cache capture summaries per upload so reruns don't re-parse the file
+@st.cache_data(show_spinner=False, max_entries=5)
+def cached_pcap_summary(pcap_bytes, deep_dissection=False):
+    """
+    Summarize a PCAP/PCAPNG capture in a single streaming pass.
+    
+    Args:
+        pcap_bytes: Raw bytes of the uploaded capture
+        deep_dissection: Decode with scapy's full dissectors instead of dpkt
+        
+    Returns:
+        DataFrame: Packet and byte counts per protocol
+    """
+    packet_counts = Counter()
+    byte_counts = Counter()
+    
+    if deep_dissection:
+        # scapy loads every protocol dissector on import, so only pull it in when asked
+        from scapy.all import IP, TCP, ICMP, UDP, PcapReader
+        
+        # Read one packet at a time rather than loading a full PacketList
+        with PcapReader(io.BytesIO(pcap_bytes)) as reader:
+            for pkt in reader:
+                if TCP in pkt:
+                    proto = "TCP"
+                elif UDP in pkt:
+                    proto = "UDP"
+                elif ICMP in pkt:
+                    proto = "ICMP"
+                elif IP in pkt:
+                    proto = "IP"
+                else:
+                    proto = "Other"
+                packet_counts[proto] += 1
+                byte_counts[proto] += len(pkt)
+    else:
+        # dpkt only unpacks the headers we ask for, which is much cheaper than scapy
+        capture = io.BytesIO(pcap_bytes)
+        if pcap_bytes[:4] == PCAPNG_MAGIC:
+            reader = dpkt.pcapng.Reader(capture)
+        else:
+            reader = dpkt.pcap.Reader(capture)
+        
+        for _, frame in reader:
+            try:
+                packet = dpkt.ethernet.Ethernet(frame).data
+            except dpkt.UnpackError:
+                packet = None
+            if isinstance(packet, (dpkt.ip.IP, dpkt.ip6.IP6)):
+                proto = IP_PROTOCOL_NAMES.get(packet.p, "IP")
+            else:
+                proto = "Other"
+            packet_counts[proto] += 1
+            byte_counts[proto] += len(frame)
+    
+    return pd.DataFrame({
+        "type": list(packet_counts),
+        "packets": list(packet_counts.values()),
+        "bytes": [byte_counts[proto] for proto in packet_counts]
+    })
+
+# Build the synthetic incident corpus once and share it across sessions, pre-pickled
+# so each session's private copy is a single pickle.loads instead of a deepcopy
+@st.cache_resource(show_spinner=False)
+def cached_sample_incidents(event_rows):
+    """
+    Build sample incidents from the most recent high and critical security events.
+    
+    Args:
+        event_rows: Tuple of (id, severity, timestamp, device_name, event_type,
+            description, source_ip) tuples
+            
+    Returns:
+        bytes: Pickled incident dictionaries, with "updated" stored as an age
+            (timedelta) that each session resolves against its own clock
+    """
+    # Seed locally so the shared corpus is deterministic
+    rng = np.random.default_rng(42)
     
     incidents = []
     incident_types = ["Malware", "Unauthorized Access", "Data Breach", "DoS Attack", "Phishing"]
     statuses = ["New", "In Progress", "Contained", "Resolved", "Closed"]
     weights = [0.3, 0.3, 0.2, 0.1, 0.1]  # More likely to be new or in progress
+    root_causes = ["Outdated software", "Weak credentials", "Misconfiguration", "Zero-day vulnerability"]
+    
+    # Draw every random field for the batch up front, one array per field
+    n = len(event_rows)
+    incident_numbers = rng.integers(10000, 100000, size=n).tolist()
+    incident_statuses = rng.choice(statuses, size=n, p=weights).tolist()
+    incident_type_draws = rng.choice(incident_types, size=n).tolist()
+    updated_hours = rng.integers(0, 25, size=n).tolist()
+    assignee_numbers = rng.integers(1, 6, size=n).tolist()
+    assignment_minutes = rng.integers(5, 31, size=n).tolist()
+    investigation_minutes = rng.integers(15, 61, size=n).tolist()
+    containment_hours = rng.integers(1, 5, size=n).tolist()
+    resolution_hours = rng.integers(2, 9, size=n).tolist()
+    root_cause_draws = rng.choice(root_causes, size=n).tolist()
+    closure_days = rng.integers(1, 4, size=n).tolist()
     
     # Create incidents from the most severe security events
-    for i, event in enumerate(events[:10]):  # Take top 10 events
-        severity = event["severity"].lower()
+    for k, (event_id, severity, timestamp, device_name, event_type, description, source_ip) in enumerate(event_rows):
+        severity = severity.lower()
         if severity in ["high", "critical"]:
-            incident_id = f"INC-{random.randint(10000, 99999)}"
+            incident_id = f"INC-{incident_numbers[k]}"
             
             # Make most incidents new or in progress for demo
-            status = random.choices(statuses, weights=weights)[0]
+            status = incident_statuses[k]
             
             # Create an incident record
             incident = {
                 "id": incident_id,
-                "title": f"{event['event_type']} - {event['device_name']}",
-                "type": random.choice(incident_types),
+                "title": f"{event_type} - {device_name}",
+                "type": incident_type_draws[k],
                 "severity": severity,
                 "status": status,
-                "detected": event["timestamp"],
-                "updated": datetime.datetime.now() - datetime.timedelta(hours=random.randint(0, 24)),
-                "affected_systems": [event["device_name"]],
-                "source_ip": event["source_ip"],
-                "description": event["description"],
-                "assigned_to": f"user{random.randint(1, 5)}@example.com",
-                "related_events": [event["id"]],
+                "detected": timestamp,
+                "updated": datetime.timedelta(hours=updated_hours[k]),
+                "affected_systems": [device_name],
+                "source_ip": source_ip,
+                "description": description,
+                "assigned_to": f"user{assignee_numbers[k]}@example.com",
+                "related_events": [event_id],
                 "timeline": [
                     {
-                        "timestamp": event["timestamp"],
+                        "timestamp": timestamp,
                         "action": "Incident detected",
                         "user": "system"
                     }
@@ -142,7 +385,7 @@ if 'incidents' not in st.session_state:
             # Add some timeline entries for older incidents
             if status != "New":
                 # Add assignment
-                assignment_time = event["timestamp"] + datetime.timedelta(minutes=random.randint(5, 30))
+                assignment_time = timestamp + datetime.timedelta(minutes=assignment_minutes[k])
                 incident["timeline"].append({
                     "timestamp": assignment_time,
                     "action": f"Incident assigned to {incident['assigned_to']}",
@@ -151,7 +394,7 @@ if 'incidents' not in st.session_state:
                 
                 # Add investigation
                 if status not in ["New"]:
-                    investigation_time = assignment_time + datetime.timedelta(minutes=random.randint(15, 60))
+                    investigation_time = assignment_time + datetime.timedelta(minutes=investigation_minutes[k])
                     incident["timeline"].append({
                         "timestamp": investigation_time,
                         "action": "Investigation started",
@@ -160,7 +403,7 @@ if 'incidents' not in st.session_state:
                 
                 # Add containment
                 if status in ["Contained", "Resolved", "Closed"]:
-                    containment_time = investigation_time + datetime.timedelta(hours=random.randint(1, 4))
+                    containment_time = investigation_time + datetime.timedelta(hours=containment_hours[k])
                     incident["timeline"].append({
                         "timestamp": containment_time,
                         "action": "Threat contained",
@@ -169,7 +412,7 @@ if 'incidents' not in st.session_state:
                 
                 # Add resolution
                 if status in ["Resolved", "Closed"]:
-                    resolution_time = containment_time + datetime.timedelta(hours=random.randint(2, 8))
+                    resolution_time = containment_time + datetime.timedelta(hours=resolution_hours[k])
                     incident["timeline"].append({
                         "timestamp": resolution_time,
                         "action": "Incident resolved",
@@ -180,20 +423,362 @@ if 'incidents' not in st.session_state:
                     incident["notes"].append({
                         "timestamp": resolution_time - datetime.timedelta(minutes=30),
                         "user": incident['assigned_to'],
-                        "text": f"Root cause identified: {random.choice(['Outdated software', 'Weak credentials', 'Misconfiguration', 'Zero-day vulnerability'])}"
+                        "text": f"Root cause identified: {root_cause_draws[k]}"
                     })
                 
                 # Add closure
                 if status == "Closed":
-                    closure_time = resolution_time + datetime.timedelta(days=random.randint(1, 3))
+                    closure_time = resolution_time + datetime.timedelta(days=closure_days[k])
                     incident["timeline"].append({
                         "timestamp": closure_time,
                         "action": "Incident closed",
                         "user": "supervisor@example.com"
                     })
             
+            # Store the timeline newest-first, the order new entries are added in
+            incident["timeline"].reverse()
             incidents.append(incident)
     
+    return pickle.dumps(incidents, protocol=pickle.HIGHEST_PROTOCOL)
+
+def typed_demo_table(rows, category_columns=()):
+    """
+    Build a static demo table with compact column dtypes.
+    
+    Args:
+        rows: List of row dicts
+        category_columns: Low-cardinality columns to store as categoricals
+        
+    Returns:
+        DataFrame: ID columns as int32, category_columns as categoricals and
+        the remaining text columns as Arrow-backed strings
+    """
+    demo_df = pd.DataFrame(rows)
+    for col in demo_df.columns:
+        if col in DEMO_ID_COLUMNS:
+            demo_df[col] = demo_df[col].astype("int32")
+        elif col in category_columns:
+            demo_df[col] = demo_df[col].astype("category")
+        elif pd.api.types.is_object_dtype(demo_df[col]) or pd.api.types.is_string_dtype(demo_df[col]):
+            demo_df[col] = demo_df[col].astype(ARROW_STRING)
+    return demo_df
+
+# Static demo tables for the forensics and response tools, built once per process
+@st.cache_data(show_spinner=False)
+def cached_memory_processes():
+    """
+    Build the sample process list recovered from a memory dump.
+    
+    Returns:
+        DataFrame: Static demo rows
+    """
+    processes = [
+        {"PID": 4, "Name": "System", "Path": "N/A", "Started": "System startup", "User": "SYSTEM"},
+        {"PID": 504, "Name": "lsass.exe", "Path": "C:\\Windows\\System32\\", "Started": "System startup", "User": "SYSTEM"},
+        {"PID": 324, "Name": "svchost.exe", "Path": "C:\\Windows\\System32\\", "Started": "System startup", "User": "SYSTEM"},
+        {"PID": 1876, "Name": "explorer.exe", "Path": "C:\\Windows\\", "Started": "User login", "User": "user1"},
+        {"PID": 2456, "Name": "chrome.exe", "Path": "C:\\Program Files\\Google\\Chrome\\", "Started": "10:15:34", "User": "user1"},
+        {"PID": 3012, "Name": "malware.exe", "Path": "C:\\Temp\\", "Started": "10:32:12", "User": "user1"}
+    ]
+    
+    return typed_demo_table(processes, ("Started", "User"))
+
+@st.cache_data(show_spinner=False)
+def cached_memory_connections():
+    """
+    Build the sample network connections recovered from a memory dump.
+    
+    Returns:
+        DataFrame: Static demo rows
+    """
+    connections = [
+        {"Local Address": "192.168.1.100:3389", "Remote Address": "192.168.1.200:52134", "State": "ESTABLISHED", "PID": 504, "Process": "lsass.exe"},
+        {"Local Address": "192.168.1.100:445", "Remote Address": "192.168.1.50:60123", "State": "ESTABLISHED", "PID": 4, "Process": "System"},
+        {"Local Address": "192.168.1.100:50123", "Remote Address": "8.8.8.8:53", "State": "ESTABLISHED", "PID": 2456, "Process": "chrome.exe"},
+        {"Local Address": "192.168.1.100:50124", "Remote Address": "209.85.167.188:443", "State": "ESTABLISHED", "PID": 2456, "Process": "chrome.exe"},
+        {"Local Address": "192.168.1.100:50125", "Remote Address": "185.159.131.12:443", "State": "ESTABLISHED", "PID": 3012, "Process": "malware.exe"}
+    ]
+    
+    return typed_demo_table(connections, ("State", "Process"))
+
+@st.cache_data(show_spinner=False)
+def cached_log_entries():
+    """
+    Build the sample Windows event log entries for the log analysis demo.
+    
+    Returns:
+        DataFrame: Static demo rows
+    """
+    log_entries = [
+        {"Timestamp": "2023-04-15 08:32:45", "Event ID": 4625, "Type": "Authentication Failure", "User": "admin", "Source": "192.168.1.50", "Description": "Failed login attempt"},
+        {"Timestamp": "2023-04-15 08:33:12", "Event ID": 4625, "Type": "Authentication Failure", "User": "admin", "Source": "192.168.1.50", "Description": "Failed login attempt"},
+        {"Timestamp": "2023-04-15 08:33:45", "Event ID": 4625, "Type": "Authentication Failure", "User": "admin", "Source": "192.168.1.50", "Description": "Failed login attempt"},
+        {"Timestamp": "2023-04-15 08:34:23", "Event ID": 4624, "Type": "Authentication Success", "User": "admin", "Source": "192.168.1.50", "Description": "Successful login"},
+        {"Timestamp": "2023-04-15 08:35:11", "Event ID": 4672, "Type": "Privilege Assignment", "User": "admin", "Source": "192.168.1.50", "Description": "Administrator privileges assigned"},
+        {"Timestamp": "2023-04-15 08:36:45", "Event ID": 7045, "Type": "Service Installation", "User": "admin", "Source": "SYSTEM", "Description": "New service installed: RemoteAccess"}
+    ]
+    
+    return typed_demo_table(log_entries, ("Type", "User", "Source"))
+
+def downsample_timeline(timestamps, max_points=TIMELINE_MAX_POINTS):
+    """
+    Pick the rows of a timeline trace to draw, capped at max_points.
+    
+    Each trace sits on a single category, so the markers only vary in time:
+    the time span is split into max_points // 2 equal buckets and the first
+    and last event of every bucket are kept, preserving bursts and gaps.
+    
+    Args:
+        timestamps: Series of event times for one trace
+        max_points: Most rows to keep
+        
+    Returns:
+        ndarray: Positional indices of the rows to draw
+    """
+    if len(timestamps) <= max_points:
+        return np.arange(len(timestamps))
+    
+    # Bucket the time-sorted events by equal-width time ranges
+    times = timestamps.to_numpy(dtype="datetime64[ns]").astype(np.int64)
+    order = np.argsort(times, kind="stable")
+    sorted_times = times[order]
+    num_buckets = max_points // 2
+    edges = np.linspace(sorted_times[0], sorted_times[-1], num_buckets + 1)
+    buckets = np.clip(np.searchsorted(edges, sorted_times, side="right") - 1, 0, num_buckets - 1)
+    
+    # Keep the first and last event of each non-empty bucket
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:] - 1, len(buckets) - 1]
+    return order[np.union1d(starts, ends)]
+
+# Cache the log activity timeline, drawn as WebGL markers (one trace per event type)
+@st.cache_data(show_spinner=False)
+def cached_log_timeline_figure():
+    """
+    Build the activity timeline for the sample log entries.
+    
+    Returns:
+        go.Figure: Event markers by time and type, downsampled per type
+        once a type has more than TIMELINE_MAX_POINTS events
+    """
+    import plotly.graph_objects as go
+    import plotly.io as pio
+    
+    # Serialize with orjson, as utils does for the other pages
+    pio.json.config.default_engine = "orjson"
+    
+    log_df = cached_log_entries()
+    timestamps = pd.to_datetime(log_df["Timestamp"])
+    fig = go.Figure()
+    for event_type, rows in log_df.groupby("Type", sort=False, observed=True).groups.items():
+        rows = rows[downsample_timeline(timestamps[rows])]
+        fig.add_trace(go.Scattergl(
+            x=timestamps[rows],
+            y=log_df.loc[rows, "Type"],
+            mode="markers",
+            marker=dict(size=12),
+            name=event_type,
+            customdata=log_df.loc[rows, ["User", "Source", "Description"]].to_numpy(),
+            hovertemplate="%{x}<br>User=%{customdata[0]}<br>Source=%{customdata[1]}<br>%{customdata[2]}<extra></extra>"
+        ))
+    fig.update_layout(xaxis_title="Timestamp", yaxis_title="Type", legend_title_text="Type")
+    return fig
+
+@st.cache_data(show_spinner=False)
+def cached_disk_files():
+    """
+    Build the sample file system listing for the disk forensics demo.
+    
+    Returns:
+        DataFrame: Static demo rows
+    """
+    files = [
+        {"Path": "C:\\Windows\\System32\\cmd.exe", "Size": "219 KB", "Created": "2023-01-15 08:32:45", "Modified": "2023-01-15 08:32:45", "Accessed": "2023-04-15 08:36:12", "Owner": "SYSTEM"},
+        {"Path": "C:\\Windows\\System32\\rundll32.exe", "Size": "33 KB", "Created": "2023-01-15 08:32:45", "Modified": "2023-01-15 08:32:45", "Accessed": "2023-04-15 08:35:42", "Owner": "SYSTEM"},
+        {"Path": "C:\\Temp\\data.zip", "Size": "4.2 MB", "Created": "2023-04-15 08:40:12", "Modified": "2023-04-15 08:40:12", "Accessed": "2023-04-15 08:40:12", "Owner": "admin"},
+        {"Path": "C:\\Temp\\exfil.ps1", "Size": "2.3 KB", "Created": "2023-04-15 08:38:45", "Modified": "2023-04-15 08:38:45", "Accessed": "2023-04-15 08:42:10", "Owner": "admin"}
+    ]
+    
+    return typed_demo_table(files, ("Owner",))
+
+@st.cache_data(show_spinner=False)
+def cached_deleted_files():
+    """
+    Build the sample recovered deleted files for the disk forensics demo.
+    
+    Returns:
+        DataFrame: Static demo rows
+    """
+    deleted_files = [
+        {"Path": "C:\\Temp\\passwords.txt", "Size": "1.2 KB", "Deleted": "2023-04-15 08:42:30", "Recovery Status": "Complete"},
+        {"Path": "C:\\Temp\\connections.log", "Size": "5.6 KB", "Deleted": "2023-04-15 08:42:35", "Recovery Status": "Complete"},
+        {"Path": "C:\\Temp\\target-list.csv", "Size": "8.9 KB", "Deleted": "2023-04-15 08:42:40", "Recovery Status": "Partial"},
+    ]
+    
+    return typed_demo_table(deleted_files, ("Recovery Status",))
+
+@st.cache_data(show_spinner=False)
+def cached_remote_processes():
+    """
+    Build the sample running processes for the remote process analysis demo.
+    
+    Returns:
+        DataFrame: Static demo rows
+    """
+    processes = [
+        {"PID": 4, "Name": "System", "Memory": "88 KB", "CPU": "0.1%", "User": "SYSTEM", "Command Line": "N/A"},
+        {"PID": 504, "Name": "lsass.exe", "Memory": "16 MB", "CPU": "0.2%", "User": "SYSTEM", "Command Line": "C:\\Windows\\System32\\lsass.exe"},
+        {"PID": 324, "Name": "svchost.exe", "Memory": "24 MB", "CPU": "0.5%", "User": "SYSTEM", "Command Line": "C:\\Windows\\System32\\svchost.exe -k LocalService"},
+        {"PID": 1876, "Name": "explorer.exe", "Memory": "48 MB", "CPU": "1.2%", "User": "user1", "Command Line": "C:\\Windows\\explorer.exe"},
+        {"PID": 2456, "Name": "chrome.exe", "Memory": "286 MB", "CPU": "5.6%", "User": "user1", "Command Line": "C:\\Program Files\\Google\\Chrome\\chrome.exe --type=renderer"},
+        {"PID": 3012, "Name": "suspicious.exe", "Memory": "2 MB", "CPU": "3.2%", "User": "user1", "Command Line": "C:\\Temp\\suspicious.exe -h 192.168.1.100 -p 8080"}
+    ]
+    
+    return typed_demo_table(processes, ("Name", "User"))
+
+# Cache the host discovery results for an hour of scans
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_discovered_hosts():
+    """
+    Generate the sample hosts found by the host discovery demo.
+    
+    Returns:
+        DataFrame: One row per discovered host
+    """
+    hosts = []
+    for i in range(1, 6):
+        hosts.append({
+            "IP Address": f"192.168.1.{random.randint(1, 254)}",
+            "Status": "Up",
+            "Hostname": f"host-{random.randint(1, 100)}",
+            "MAC Address": f"00:1A:2B:{random.randint(10, 99)}:{random.randint(10, 99)}:{random.randint(10, 99)}",
+            "MAC Vendor": random.choice(["Cisco", "Dell", "HP", "Intel"])
+        })
+    
+    return typed_demo_table(hosts, ("Status", "MAC Vendor"))
+
+# Cache the PID lookup so process actions don't rescan the process table
+@st.cache_data(show_spinner=False)
+def cached_processes_by_pid():
+    """
+    Index the sample remote processes by PID.
+    
+    Returns:
+        dict: Process record keyed by PID
+    """
+    processes_df = cached_remote_processes()
+    return {process["PID"]: process for process in processes_df.to_dict("records")}
+
+# Cache the quarantine log per option selection for a minute of reruns
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_quarantine_log(quarantine_options):
+    """
+    Build the quarantine action log for the selected options.
+    
+    Args:
+        quarantine_options: Tuple of applied quarantine options
+        
+    Returns:
+        DataFrame: One row per quarantine action
+    """
+    # Read the clock once and offset every entry from it
+    now = datetime.datetime.now()
+    fmt = "%Y-%m-%d %H:%M:%S"
+    log_entries = [
+        {"Timestamp": now.strftime(fmt), "Action": "Quarantine initiated", "Status": "Success", "Details": "Quarantine command issued"},
+        {"Timestamp": (now + datetime.timedelta(seconds=2)).strftime(fmt), "Action": "Network isolation", "Status": "Success", "Details": "All non-management traffic blocked"}
+    ]
+    
+    log_entries += [
+        {
+            "Timestamp": (now + datetime.timedelta(seconds=3+i)).strftime(fmt),
+            "Action": option,
+            "Status": "Success",
+            "Details": f"Successfully applied {option}"
+        }
+        for i, option in enumerate(quarantine_options)
+        if option != "Block Network Access"  # Already included above
+    ]
+    
+    return pd.DataFrame(log_entries)
+
+# Cache the footer timestamp; it only shows minutes
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_footer_timestamp():
+    """
+    Format the footer's last-updated time.
+    
+    Returns:
+        str: Current time as YYYY-MM-DD HH:MM
+    """
+    return datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+
+def simulate_capture_packets(num_packets):
+    """
+    Generate mock captured packets, drawing every field as a numpy column.
+    
+    Args:
+        num_packets: Number of packets to generate
+        
+    Returns:
+        DataFrame: One row per packet in capture order
+    """
+    rng = np.random.default_rng()
+    protocol_names = ["TCP", "UDP", "HTTP", "DNS", "ICMP"]
+    protocols = rng.choice(protocol_names, size=num_packets)
+    src_ports = pd.Series(rng.integers(49152, 65536, size=num_packets)).astype(str)
+    
+    # Build each protocol's info text for every row, then keep the one matching the row's protocol
+    tcp_info = (
+        "TCP " + src_ports + " → " + pd.Series(rng.choice([80, 443, 22, 3389], size=num_packets)).astype(str)
+        + " [" + rng.choice(["SYN", "SYN+ACK", "ACK", "FIN", "RST"], size=num_packets) + "] Seq=1 Win=64240 Len=0"
+    )
+    udp_info = (
+        "UDP " + src_ports + " → " + pd.Series(rng.choice([53, 161, 123, 5353], size=num_packets)).astype(str)
+        + " Len=" + pd.Series(rng.integers(50, 501, size=num_packets)).astype(str)
+    )
+    http_info = (
+        pd.Series(rng.choice(["GET", "POST", "PUT", "DELETE"], size=num_packets)) + " "
+        + rng.choice(["/index.html", "/api/v1/users", "/login", "/images/logo.png"], size=num_packets) + " HTTP/1.1"
+    )
+    dns_info = (
+        "DNS Query " + pd.Series(rng.choice(["A", "AAAA", "MX", "CNAME", "TXT"], size=num_packets)) + " "
+        + rng.choice(["example.com", "google.com", "microsoft.com", "aws.amazon.com"], size=num_packets)
+    )
+    icmp_info = (
+        "ICMP " + pd.Series(rng.choice(["Echo reply", "Echo request"], size=num_packets))
+        + " id=" + pd.Series(rng.integers(1, 65536, size=num_packets)).astype(str)
+        + ", seq=" + pd.Series(rng.integers(1, 101, size=num_packets)).astype(str)
+    )
+    
+    return pd.DataFrame({
+        "No.": np.arange(1, num_packets + 1),
+        "Time": np.char.mod("%.6f", np.arange(num_packets) * 0.12),
+        "Source": np.char.add("192.168.1.", rng.integers(1, 255, size=num_packets).astype(str)),
+        "Destination": np.char.add("192.168.2.", rng.integers(1, 255, size=num_packets).astype(str)),
+        "Protocol": pd.Categorical(protocols, categories=protocol_names),
+        "Length": rng.integers(64, 1501, size=num_packets),
+        "Info": np.select(
+            [protocols == "TCP", protocols == "UDP", protocols == "HTTP", protocols == "DNS"],
+            [tcp_info, udp_info, http_info, dns_info],
+            default=icmp_info
+        )
+    })
+
+# Load sample incident data or create if not exists
+if 'incidents' not in st.session_state:
+    # Create some sample incidents based on the top 10 security events
+    event_rows = tuple(
+        (e["id"], e["severity"], e["timestamp"], e["device_name"], e["event_type"], e["description"], e["source_ip"])
+        for e in get_security_events()[:10]
+    )
+    incidents = pickle.loads(cached_sample_incidents(event_rows))
+    
+    # The shared corpus outlives any one session, so anchor update times to now here
+    now = datetime.datetime.now()
+    for incident in incidents:
+        incident["updated"] = now - incident["updated"]
+    
     if not incidents:
         # Create at least one sample incident if no events were suitable
         incidents = [{
@@ -220,16 +805,35 @@ if 'incidents' not in st.session_state:
         }]
     
     st.session_state.incidents = incidents
+    # Index the same incident dicts by ID; updates mutate them in place, so both stay in sync
+    st.session_state.incidents_by_id = {i["id"]: i for i in incidents}
+    bump_incidents_version()
 
 # ACTIVE INCIDENTS TAB
-with tabs[0]:
+@st.fragment
+def active_incidents_view():
+    """
+    Render the incident metrics, filters and incident table.
+    
+    Runs as a fragment, so changing filters or the selected incident only
+    reruns this view instead of the whole page.
+    """
     st.markdown("### Incident Summary")
     
-    # Create incident metrics
+    # Build the incident table once per change; metrics and filters work on its columns
     incidents = st.session_state.incidents
-    total_incidents = len(incidents)
-    open_incidents = len([i for i in incidents if i["status"] not in ["Resolved", "Closed"]])
-    critical_incidents = len([i for i in incidents if i["severity"] == "critical" and i["status"] not in ["Resolved", "Closed"]])
+    all_incidents_df = cached_incident_table(st.session_state.incidents_version, incidents)
+    all_incidents_df.insert(
+        all_incidents_df.columns.get_loc("Detected") + 1,
+        "Age",
+        time_since(all_incidents_df["Detected"])
+    )
+    
+    # Create incident metrics
+    is_open = ~all_incidents_df["Status"].isin(["Resolved", "Closed"])
+    total_incidents = len(all_incidents_df)
+    open_incidents = int(is_open.sum())
+    critical_incidents = int((is_open & (all_incidents_df["Severity"] == "Critical")).sum())
     
     # Display metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -267,55 +871,31 @@ with tabs[0]:
             key="incident_type_filter"
         )
     
-    # Filter incidents
-    filtered_incidents = incidents
+    # Filter incidents with one combined boolean mask
+    mask = np.ones(len(all_incidents_df), dtype=bool)
     if status_filter:
-        filtered_incidents = [i for i in filtered_incidents if i["status"] in status_filter]
+        mask &= all_incidents_df["Status"].isin(status_filter).to_numpy()
     if severity_filter:
-        filtered_incidents = [i for i in filtered_incidents if i["severity"].capitalize() in severity_filter]
+        mask &= all_incidents_df["Severity"].isin(severity_filter).to_numpy()
     if type_filter:
-        filtered_incidents = [i for i in filtered_incidents if i["type"] in type_filter]
+        mask &= all_incidents_df["Type"].isin(type_filter).to_numpy()
+    incident_df = all_incidents_df[mask].reset_index(drop=True)
     
     # Create incident table
-    if filtered_incidents:
-        incident_df = pd.DataFrame([
-            {
-                "ID": i["id"],
-                "Title": i["title"],
-                "Type": i["type"],
-                "Severity": i["severity"].capitalize(),
-                "Status": i["status"],
-                "Detected": i["detected"],
-                "Age": time_since(i["detected"]),
-                "Assigned To": i["assigned_to"]
-            } for i in filtered_incidents
-        ])
-        
-        # Style the dataframe
-        def highlight_severity(val):
-            if val == "Critical":
-                return 'background-color: red; color: white'
-            elif val == "High":
-                return 'background-color: orange; color: white'
-            elif val == "Medium":
-                return 'background-color: yellow; color: black'
-            else:
-                return 'background-color: green; color: white'
-        
-        def highlight_status(val):
-            color = get_incident_status_color(val)
-            return f'background-color: {color}; color: white'
-        
-        styled_df = incident_df.style.map(
-            highlight_severity, 
-            subset=['Severity']
-        ).map(
-            highlight_status,
-            subset=['Status']
+    if not incident_df.empty:
+        # Label severity and status with a vectorized lookup instead of a per-cell Styler
+        st.dataframe(
+            incident_df.assign(
+                Severity=incident_df["Severity"].map(SEVERITY_LABELS).fillna(incident_df["Severity"]),
+                Status=incident_df["Status"].map(INCIDENT_STATUS_LABELS).fillna(incident_df["Status"])
+            ),
+            use_container_width=True,
+            column_config={
+                "Severity": st.column_config.TextColumn("Severity"),
+                "Status": st.column_config.TextColumn("Status")
+            }
         )
         
-        st.dataframe(styled_df, use_container_width=True)
-        
         # Create a selection box for incident details
         selected_incident_id = st.selectbox(
             "Select an incident to view details",
@@ -329,19 +909,29 @@ with tabs[0]:
     else:
         st.info("No incidents match the selected filters.")
 
+with tabs[0]:
+    active_incidents_view()
+
 # INCIDENT DETAILS TAB
-with tabs[1]:
+@st.fragment
+def incident_details_view():
+    """
+    Render the selected incident's details, timeline, notes and evidence.
+    
+    Runs as a fragment, so updating the incident or adding a note only reruns
+    this view instead of the events query and the rest of the page.
+    """
     # Show incident details if one is selected
     if hasattr(st.session_state, 'active_incident') and st.session_state.active_incident:
         incident_id = st.session_state.active_incident
-        incident = next((i for i in st.session_state.incidents if i["id"] == incident_id), None)
+        incident = st.session_state.incidents_by_id.get(incident_id)
         
         if incident:
             # Header with key details
             st.markdown(f"### {incident['title']} ({incident['id']})")
             
             status_color = get_incident_status_color(incident["status"])
-            severity_color = "red" if incident["severity"] == "critical" else "orange" if incident["severity"] == "high" else "yellow" if incident["severity"] == "medium" else "green"
+            severity_color = SEVERITY_COLORS.get(incident["severity"], "green")
             
             st.markdown(f"""
             <div style="display: flex; gap: 10px; margin-bottom: 20px;">
@@ -377,26 +967,34 @@ with tabs[1]:
                     old_status = incident["status"]
                     if new_status != old_status:
                         # Add to timeline
-                        incident["timeline"].append({
+                        add_incident_entry(incident["timeline"], {
                             "timestamp": datetime.datetime.now(),
                             "action": f"Status changed from {old_status} to {new_status}",
                             "user": "current_user@example.com"
                         })
                         incident["status"] = new_status
                         incident["updated"] = datetime.datetime.now()
+                        bump_incidents_version()
+                        
+                        # Resolving an incident changes the event picture, so refetch
+                        if new_status == "Resolved":
+                            cached_security_events.clear()
+                            cached_events_by_ids.clear()
                     
                     old_assignee = incident["assigned_to"]
                     if new_assignee != old_assignee:
                         # Add to timeline
-                        incident["timeline"].append({
+                        add_incident_entry(incident["timeline"], {
                             "timestamp": datetime.datetime.now(),
                             "action": f"Reassigned from {old_assignee} to {new_assignee}",
                             "user": "current_user@example.com"
                         })
                         incident["assigned_to"] = new_assignee
                         incident["updated"] = datetime.datetime.now()
+                        bump_incidents_version()
                     
                     st.success("Incident updated successfully")
+                    st.rerun()
             
             with col2:
                 st.markdown("#### Description")
@@ -407,12 +1005,13 @@ with tabs[1]:
                 
                 if st.button("Add Note"):
                     if new_note:
-                        incident["notes"].append({
+                        add_incident_entry(incident["notes"], {
                             "timestamp": datetime.datetime.now(),
                             "user": "current_user@example.com",
                             "text": new_note
                         })
                         incident["updated"] = datetime.datetime.now()
+                        bump_incidents_version()
                         st.success("Note added successfully")
                         st.rerun()
                     else:
@@ -421,16 +1020,13 @@ with tabs[1]:
             # Timeline and activity
             st.markdown("#### Timeline")
             
-            # Sort timeline events by timestamp
-            timeline_events = sorted(incident["timeline"], key=lambda x: x["timestamp"], reverse=True)
-            
             # Create a dataframe for the timeline
             timeline_df = pd.DataFrame([
                 {
                     "Time": event["timestamp"].strftime("%Y-%m-%d %H:%M:%S"),
                     "User": event["user"],
                     "Action": event["action"]
-                } for event in timeline_events
+                } for event in incident["timeline"]
             ])
             
             st.dataframe(timeline_df, use_container_width=True)
@@ -438,9 +1034,7 @@ with tabs[1]:
             # Notes section
             if incident["notes"]:
                 st.markdown("#### Notes")
-                notes = sorted(incident["notes"], key=lambda x: x["timestamp"], reverse=True)
-                
-                for note in notes:
+                for note in incident["notes"]:
                     st.markdown(f"""
                     <div style="border-left: 3px solid #ccc; padding-left: 10px; margin-bottom: 10px;">
                         <p style="margin-bottom: 5px;"><strong>{note["user"]}</strong> - {note["timestamp"].strftime("%Y-%m-%d %H:%M:%S")}</p>
@@ -450,8 +1044,7 @@ with tabs[1]:
             
             # Related events
             st.markdown("#### Related Security Events")
-            events = get_security_events()
-            related_events = [e for e in events if e["id"] in incident["related_events"]]
+            related_events = get_events_by_ids(incident["related_events"])
             
             if related_events:
                 related_df = pd.DataFrame([
@@ -487,6 +1080,9 @@ with tabs[1]:
     else:
         st.info("Select an incident from the Active Incidents tab to view details.")
 
+with tabs[1]:
+    incident_details_view()
+
 # PLAYBOOKS TAB
 with tabs[2]:
     st.markdown("### Incident Response Playbooks")
@@ -564,33 +1160,45 @@ with tabs[3]:
     if selected_tool == "Network Packet Analysis":
         st.markdown("#### Network Packet Analysis")
         
-        st.file_uploader("Upload PCAP File", type=["pcap", "pcapng"], key="pcap_upload")
+        pcap_file = st.file_uploader("Upload PCAP File", type=["pcap", "pcapng"], key="pcap_upload")
+        
+        # Analyze an uploaded capture
+        deep_dissection = st.checkbox(
+            "Deep dissection (scapy)",
+            value=False,
+            help="Decode every layer with scapy; slower than the default header-only parser"
+        )
+        if pcap_file is not None and st.button("Analyze Uploaded Capture"):
+            try:
+                capture_summary = cached_pcap_summary(pcap_file.getvalue(), deep_dissection)
+            except Exception as e:
+                st.error(f"Error reading capture: {str(e)}")
+            else:
+                st.markdown("#### Capture Summary")
+                st.metric("Total Packets", int(capture_summary["packets"].sum()))
+                st.dataframe(capture_summary, use_container_width=True)
+                
+                st.markdown("#### Packet Type Distribution")
+                st.bar_chart(capture_summary.set_index("type")["packets"])
         
         # Sample PCAP analysis (simulated since we can't read uploaded files directly)
         if st.button("Analyze Sample Data"):
             st.info("Simulating packet analysis on sample PCAP data")
             
-            # Simulated packet data
+            # Simulated packet data, drawn column by column (newest packet first, 5 minutes apart)
             packet_types = ["TCP", "UDP", "ICMP", "HTTP", "DNS", "HTTPS"]
-            timestamps = [datetime.datetime.now() - datetime.timedelta(minutes=i*5) for i in range(20)]
-            
-            packets = []
-            for i in range(20):
-                packet_type = random.choice(packet_types)
-                src_ip = f"192.168.1.{random.randint(1, 254)}"
-                dst_ip = f"192.168.2.{random.randint(1, 254)}"
-                
-                packet = {
-                    "timestamp": timestamps[i],
-                    "type": packet_type,
-                    "src_ip": src_ip,
-                    "dst_ip": dst_ip,
-                    "size": random.randint(64, 1500),
-                    "info": f"Sample {packet_type} packet"
-                }
-                packets.append(packet)
+            num_packets = 20
+            rng = np.random.default_rng()
+            sample_types = rng.choice(packet_types, size=num_packets)
             
-            packets_df = pd.DataFrame(packets)
+            packets_df = pd.DataFrame({
+                "timestamp": pd.date_range(end=pd.Timestamp.now(), periods=num_packets, freq="5min")[::-1],
+                "type": pd.Categorical(sample_types, categories=packet_types),
+                "src_ip": np.char.add("192.168.1.", rng.integers(1, 255, size=num_packets).astype(str)),
+                "dst_ip": np.char.add("192.168.2.", rng.integers(1, 255, size=num_packets).astype(str)),
+                "size": rng.integers(64, 1501, size=num_packets),
+                "info": np.char.add(np.char.add("Sample ", sample_types), " packet")
+            })
             
             # Display packet summary
             st.markdown("#### Packet Summary")
@@ -598,8 +1206,7 @@ with tabs[3]:
             
             # Display packet type distribution
             st.markdown("#### Packet Type Distribution")
-            fig = px.pie(packets_df, names="type", title="Packet Types")
-            st.plotly_chart(fig, use_container_width=True)
+            st.bar_chart(packets_df["type"].value_counts())
             
             # Display communication graph
             st.markdown("#### Communication Graph")
@@ -628,16 +1235,7 @@ with tabs[3]:
             if "Process List" in selected_analysis:
                 st.markdown("#### Process List")
                 
-                processes = [
-                    {"PID": 4, "Name": "System", "Path": "N/A", "Started": "System startup", "User": "SYSTEM"},
-                    {"PID": 504, "Name": "lsass.exe", "Path": "C:\\Windows\\System32\\", "Started": "System startup", "User": "SYSTEM"},
-                    {"PID": 324, "Name": "svchost.exe", "Path": "C:\\Windows\\System32\\", "Started": "System startup", "User": "SYSTEM"},
-                    {"PID": 1876, "Name": "explorer.exe", "Path": "C:\\Windows\\", "Started": "User login", "User": "user1"},
-                    {"PID": 2456, "Name": "chrome.exe", "Path": "C:\\Program Files\\Google\\Chrome\\", "Started": "10:15:34", "User": "user1"},
-                    {"PID": 3012, "Name": "malware.exe", "Path": "C:\\Temp\\", "Started": "10:32:12", "User": "user1"}
-                ]
-                
-                processes_df = pd.DataFrame(processes)
+                processes_df = cached_memory_processes()
                 st.dataframe(processes_df, use_container_width=True)
                 
                 # Highlight suspicious process
@@ -647,15 +1245,7 @@ with tabs[3]:
             if "Network Connections" in selected_analysis:
                 st.markdown("#### Active Network Connections")
                 
-                connections = [
-                    {"Local Address": "192.168.1.100:3389", "Remote Address": "192.168.1.200:52134", "State": "ESTABLISHED", "PID": 504, "Process": "lsass.exe"},
-                    {"Local Address": "192.168.1.100:445", "Remote Address": "192.168.1.50:60123", "State": "ESTABLISHED", "PID": 4, "Process": "System"},
-                    {"Local Address": "192.168.1.100:50123", "Remote Address": "8.8.8.8:53", "State": "ESTABLISHED", "PID": 2456, "Process": "chrome.exe"},
-                    {"Local Address": "192.168.1.100:50124", "Remote Address": "209.85.167.188:443", "State": "ESTABLISHED", "PID": 2456, "Process": "chrome.exe"},
-                    {"Local Address": "192.168.1.100:50125", "Remote Address": "185.159.131.12:443", "State": "ESTABLISHED", "PID": 3012, "Process": "malware.exe"}
-                ]
-                
-                connections_df = pd.DataFrame(connections)
+                connections_df = cached_memory_connections()
                 st.dataframe(connections_df, use_container_width=True)
                 
                 # Highlight suspicious connection
@@ -685,16 +1275,7 @@ with tabs[3]:
             # Sample log entries
             st.markdown("#### Sample Log Analysis Results")
             
-            log_entries = [
-                {"Timestamp": "2023-04-15 08:32:45", "Event ID": 4625, "Type": "Authentication Failure", "User": "admin", "Source": "192.168.1.50", "Description": "Failed login attempt"},
-                {"Timestamp": "2023-04-15 08:33:12", "Event ID": 4625, "Type": "Authentication Failure", "User": "admin", "Source": "192.168.1.50", "Description": "Failed login attempt"},
-                {"Timestamp": "2023-04-15 08:33:45", "Event ID": 4625, "Type": "Authentication Failure", "User": "admin", "Source": "192.168.1.50", "Description": "Failed login attempt"},
-                {"Timestamp": "2023-04-15 08:34:23", "Event ID": 4624, "Type": "Authentication Success", "User": "admin", "Source": "192.168.1.50", "Description": "Successful login"},
-                {"Timestamp": "2023-04-15 08:35:11", "Event ID": 4672, "Type": "Privilege Assignment", "User": "admin", "Source": "192.168.1.50", "Description": "Administrator privileges assigned"},
-                {"Timestamp": "2023-04-15 08:36:45", "Event ID": 7045, "Type": "Service Installation", "User": "admin", "Source": "SYSTEM", "Description": "New service installed: RemoteAccess"}
-            ]
-            
-            log_df = pd.DataFrame(log_entries)
+            log_df = cached_log_entries()
             st.dataframe(log_df, use_container_width=True)
             
             # Identified alerts
@@ -703,17 +1284,10 @@ with tabs[3]:
             st.warning("Privilege escalation activity detected")
             st.warning("New service installation - potential persistence mechanism")
             
-            # Timeline
+            # Timeline; Plotly loads only once the chart is drawn
             st.markdown("#### Activity Timeline")
             
-            fig = px.timeline(
-                log_df, 
-                x_start="Timestamp", 
-                x_end="Timestamp", 
-                y="Type", 
-                color="Type",
-                hover_data=["User", "Source", "Description"]
-            )
+            fig = cached_log_timeline_figure()
             st.plotly_chart(fig, use_container_width=True)
     
     elif selected_tool == "Disk Forensics":
@@ -740,14 +1314,7 @@ with tabs[3]:
             if "File System Analysis" in selected_analysis:
                 st.markdown("#### File System Analysis Results")
                 
-                files = [
-                    {"Path": "C:\\Windows\\System32\\cmd.exe", "Size": "219 KB", "Created": "2023-01-15 08:32:45", "Modified": "2023-01-15 08:32:45", "Accessed": "2023-04-15 08:36:12", "Owner": "SYSTEM"},
-                    {"Path": "C:\\Windows\\System32\\rundll32.exe", "Size": "33 KB", "Created": "2023-01-15 08:32:45", "Modified": "2023-01-15 08:32:45", "Accessed": "2023-04-15 08:35:42", "Owner": "SYSTEM"},
-                    {"Path": "C:\\Temp\\data.zip", "Size": "4.2 MB", "Created": "2023-04-15 08:40:12", "Modified": "2023-04-15 08:40:12", "Accessed": "2023-04-15 08:40:12", "Owner": "admin"},
-                    {"Path": "C:\\Temp\\exfil.ps1", "Size": "2.3 KB", "Created": "2023-04-15 08:38:45", "Modified": "2023-04-15 08:38:45", "Accessed": "2023-04-15 08:42:10", "Owner": "admin"}
-                ]
-                
-                files_df = pd.DataFrame(files)
+                files_df = cached_disk_files()
                 st.dataframe(files_df, use_container_width=True)
                 
                 st.warning("Suspicious PowerShell script detected: C:\\Temp\\exfil.ps1")
@@ -755,18 +1322,54 @@ with tabs[3]:
             if "Deleted File Recovery" in selected_analysis:
                 st.markdown("#### Deleted File Recovery Results")
                 
-                deleted_files = [
-                    {"Path": "C:\\Temp\\passwords.txt", "Size": "1.2 KB", "Deleted": "2023-04-15 08:42:30", "Recovery Status": "Complete"},
-                    {"Path": "C:\\Temp\\connections.log", "Size": "5.6 KB", "Deleted": "2023-04-15 08:42:35", "Recovery Status": "Complete"},
-                    {"Path": "C:\\Temp\\target-list.csv", "Size": "8.9 KB", "Deleted": "2023-04-15 08:42:40", "Recovery Status": "Partial"},
-                ]
-                
-                deleted_df = pd.DataFrame(deleted_files)
+                deleted_df = cached_deleted_files()
                 st.dataframe(deleted_df, use_container_width=True)
                 
                 st.success("3 deleted files recovered")
 
 # REAL-TIME RESPONSE TAB
+@st.fragment
+def process_actions_view(process_ids):
+    """
+    Render the process selector and the kill, dump and analyze actions.
+    
+    Runs as a fragment, so choosing a process or clicking an action only
+    reruns this view instead of the whole page, and the results stay on
+    screen after the process list has been retrieved.
+    
+    Args:
+        process_ids: PIDs offered in the process selector
+    """
+    selected_pid = st.selectbox("Select process for action", options=process_ids)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if st.button("Kill Process"):
+            st.success(f"Process {selected_pid} terminated (demo)")
+    with col2:
+        if st.button("Dump Memory"):
+            st.success(f"Memory dump created for process {selected_pid} (demo)")
+    with col3:
+        if st.button("Analyze"):
+            st.info(f"Detailed analysis of process {selected_pid} (demo)")
+            
+            # Show some fake process details
+            st.markdown("#### Process Details")
+            
+            process = cached_processes_by_pid().get(selected_pid)
+            if process:
+                st.markdown(f"**Process Name:** {process['Name']}")
+                st.markdown(f"**PID:** {process['PID']}")
+                st.markdown(f"**User:** {process['User']}")
+                st.markdown(f"**Command Line:** {process['Command Line']}")
+                
+                if process["Name"] == "suspicious.exe":
+                    st.error("This process exhibits suspicious behavior:")
+                    st.markdown("- Connecting to external IP (192.168.1.100:8080)")
+                    st.markdown("- Not digitally signed")
+                    st.markdown("- Recently created executable")
+                    st.markdown("- Running from temporary directory")
+
 with tabs[4]:
     st.markdown("### Real-Time Response Tools")
     st.caption("Tools for live response to security incidents")
@@ -808,47 +1411,41 @@ with tabs[4]:
             if scan_type == "Host Discovery":
                 st.markdown("#### Host Discovery Results")
                 
-                hosts = []
-                for i in range(1, 6):
-                    hosts.append({
-                        "IP Address": f"192.168.1.{random.randint(1, 254)}",
-                        "Status": "Up",
-                        "Hostname": f"host-{random.randint(1, 100)}",
-                        "MAC Address": f"00:1A:2B:{random.randint(10, 99)}:{random.randint(10, 99)}:{random.randint(10, 99)}",
-                        "MAC Vendor": random.choice(["Cisco", "Dell", "HP", "Intel"])
-                    })
-                
-                hosts_df = pd.DataFrame(hosts)
+                hosts_df = cached_discovered_hosts()
                 st.dataframe(hosts_df, use_container_width=True)
                 
-                st.success(f"Found {len(hosts)} active hosts")
+                st.success(f"Found {len(hosts_df)} active hosts")
             
             elif scan_type == "Port Scanning":
                 st.markdown("#### Port Scan Results")
                 
-                ports = []
-                for host in ["192.168.1.100", "192.168.1.101"]:
-                    for port, service in [
-                        (21, "FTP"), 
-                        (22, "SSH"), 
-                        (80, "HTTP"), 
-                        (443, "HTTPS"), 
-                        (3389, "RDP")
-                    ]:
-                        if random.random() > 0.3:  # 70% chance of port being open
-                            ports.append({
-                                "Host": host,
-                                "Port": port,
-                                "Protocol": "tcp",
-                                "State": "open",
-                                "Service": service,
-                                "Version": f"{service} {random.randint(1, 9)}.{random.randint(0, 9)}"
-                            })
+                # Each host/port pair is open with a 70% chance; np.where gives the open pairs in host-major order
+                scan_hosts = np.array(["192.168.1.100", "192.168.1.101"])
+                scan_ports = np.array([21, 22, 80, 443, 3389])
+                scan_services = np.array(["FTP", "SSH", "HTTP", "HTTPS", "RDP"])
+                rng = np.random.default_rng()
+                open_mask = rng.random((len(scan_hosts), len(scan_ports))) > 0.3
+                host_idx, port_idx = np.where(open_mask)
+                num_open = len(host_idx)
+                open_services = scan_services[port_idx]
                 
-                ports_df = pd.DataFrame(ports)
+                versions = np.char.add(
+                    np.char.add(np.char.add(open_services, " "), rng.integers(1, 10, size=num_open).astype(str)),
+                    np.char.add(".", rng.integers(0, 10, size=num_open).astype(str))
+                )
+                
+                # Low-cardinality columns as categoricals over the full scan vocabulary
+                ports_df = pd.DataFrame({
+                    "Host": pd.Categorical(scan_hosts[host_idx], categories=scan_hosts),
+                    "Port": scan_ports[port_idx].astype("uint16"),
+                    "Protocol": pd.Categorical(np.full(num_open, "tcp")),
+                    "State": pd.Categorical(np.full(num_open, "open")),
+                    "Service": pd.Categorical(open_services, categories=scan_services),
+                    "Version": versions
+                })
                 st.dataframe(ports_df, use_container_width=True)
                 
-                st.success(f"Scan complete: found {len(ports)} open ports")
+                st.success(f"Scan complete: found {num_open} open ports")
     
     elif selected_response_tool == "Process Analysis":
         st.markdown("#### Remote Process Analysis")
@@ -858,51 +1455,14 @@ with tabs[4]:
         if st.button("Get Running Processes (Demo)"):
             st.info(f"Retrieving processes from {target_host} (demonstration)")
             
-            processes = [
-                {"PID": 4, "Name": "System", "Memory": "88 KB", "CPU": "0.1%", "User": "SYSTEM", "Command Line": "N/A"},
-                {"PID": 504, "Name": "lsass.exe", "Memory": "16 MB", "CPU": "0.2%", "User": "SYSTEM", "Command Line": "C:\\Windows\\System32\\lsass.exe"},
-                {"PID": 324, "Name": "svchost.exe", "Memory": "24 MB", "CPU": "0.5%", "User": "SYSTEM", "Command Line": "C:\\Windows\\System32\\svchost.exe -k LocalService"},
-                {"PID": 1876, "Name": "explorer.exe", "Memory": "48 MB", "CPU": "1.2%", "User": "user1", "Command Line": "C:\\Windows\\explorer.exe"},
-                {"PID": 2456, "Name": "chrome.exe", "Memory": "286 MB", "CPU": "5.6%", "User": "user1", "Command Line": "C:\\Program Files\\Google\\Chrome\\chrome.exe --type=renderer"},
-                {"PID": 3012, "Name": "suspicious.exe", "Memory": "2 MB", "CPU": "3.2%", "User": "user1", "Command Line": "C:\\Temp\\suspicious.exe -h 192.168.1.100 -p 8080"}
-            ]
-            
-            processes_df = pd.DataFrame(processes)
+            processes_df = cached_remote_processes()
             st.dataframe(processes_df, use_container_width=True)
             
             # Highlight suspicious process
             st.warning("Suspicious process detected: PID 3012 (suspicious.exe)")
             
             # Actions for selected process
-            selected_pid = st.selectbox("Select process for action", options=[p["PID"] for p in processes])
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                if st.button("Kill Process"):
-                    st.success(f"Process {selected_pid} terminated (demo)")
-            with col2:
-                if st.button("Dump Memory"):
-                    st.success(f"Memory dump created for process {selected_pid} (demo)")
-            with col3:
-                if st.button("Analyze"):
-                    st.info(f"Detailed analysis of process {selected_pid} (demo)")
-                    
-                    # Show some fake process details
-                    st.markdown("#### Process Details")
-                    
-                    process = next((p for p in processes if p["PID"] == selected_pid), None)
-                    if process:
-                        st.markdown(f"**Process Name:** {process['Name']}")
-                        st.markdown(f"**PID:** {process['PID']}")
-                        st.markdown(f"**User:** {process['User']}")
-                        st.markdown(f"**Command Line:** {process['Command Line']}")
-                        
-                        if process["Name"] == "suspicious.exe":
-                            st.error("This process exhibits suspicious behavior:")
-                            st.markdown("- Connecting to external IP (192.168.1.100:8080)")
-                            st.markdown("- Not digitally signed")
-                            st.markdown("- Recently created executable")
-                            st.markdown("- Running from temporary directory")
+            process_actions_view(processes_df["PID"].tolist())
     
     elif selected_response_tool == "Endpoint Quarantine":
         st.markdown("#### Endpoint Quarantine")
@@ -926,21 +1486,7 @@ with tabs[4]:
             # Sample quarantine log
             st.markdown("#### Quarantine Log")
             
-            log_entries = [
-                {"Timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "Action": "Quarantine initiated", "Status": "Success", "Details": "Quarantine command issued"},
-                {"Timestamp": (datetime.datetime.now() + datetime.timedelta(seconds=2)).strftime("%Y-%m-%d %H:%M:%S"), "Action": "Network isolation", "Status": "Success", "Details": "All non-management traffic blocked"}
-            ]
-            
-            for i, option in enumerate(quarantine_options):
-                if option != "Block Network Access":  # Already included above
-                    log_entries.append({
-                        "Timestamp": (datetime.datetime.now() + datetime.timedelta(seconds=3+i)).strftime("%Y-%m-%d %H:%M:%S"),
-                        "Action": option,
-                        "Status": "Success",
-                        "Details": f"Successfully applied {option}"
-                    })
-            
-            log_df = pd.DataFrame(log_entries)
+            log_df = cached_quarantine_log(tuple(quarantine_options))
             st.dataframe(log_df, use_container_width=True)
     
     elif selected_response_tool == "Traffic Capture":
@@ -980,67 +1526,27 @@ with tabs[4]:
             
             # Simulate a packet capture progress bar
             progress_bar = st.progress(0)
+            for step in range(1, 11):
+                progress_bar.progress(step * 10)
+                time.sleep(0.1)  # Simulate processing time
             
             # Mock packet data for display
-            packet_data = []
-            for i in range(10):
-                progress_bar.progress((i+1) * 10)
-                
-                protocol = random.choice(["TCP", "UDP", "HTTP", "DNS", "ICMP"])
-                src_ip = f"192.168.1.{random.randint(1, 254)}"
-                dst_ip = f"192.168.2.{random.randint(1, 254)}"
-                
-                # Generate packet details based on protocol
-                if protocol == "TCP":
-                    src_port = random.randint(49152, 65535)
-                    dst_port = random.choice([80, 443, 22, 3389])
-                    flags = random.choice(["SYN", "SYN+ACK", "ACK", "FIN", "RST"])
-                    info = f"TCP {src_port} → {dst_port} [{flags}] Seq=1 Win=64240 Len=0"
-                elif protocol == "UDP":
-                    src_port = random.randint(49152, 65535)
-                    dst_port = random.choice([53, 161, 123, 5353])
-                    info = f"UDP {src_port} → {dst_port} Len={random.randint(50, 500)}"
-                elif protocol == "HTTP":
-                    method = random.choice(["GET", "POST", "PUT", "DELETE"])
-                    resource = random.choice(["/index.html", "/api/v1/users", "/login", "/images/logo.png"])
-                    info = f"{method} {resource} HTTP/1.1"
-                elif protocol == "DNS":
-                    query_type = random.choice(["A", "AAAA", "MX", "CNAME", "TXT"])
-                    domain = random.choice(["example.com", "google.com", "microsoft.com", "aws.amazon.com"])
-                    info = f"DNS Query {query_type} {domain}"
-                else:  # ICMP
-                    icmp_type = random.choice([0, 8])
-                    type_name = "Echo reply" if icmp_type == 0 else "Echo request"
-                    info = f"ICMP {type_name} id={random.randint(1, 65535)}, seq={random.randint(1, 100)}"
-                
-                packet = {
-                    "No.": i+1,
-                    "Time": f"{i * 0.12:.6f}",
-                    "Source": src_ip,
-                    "Destination": dst_ip,
-                    "Protocol": protocol,
-                    "Length": random.randint(64, 1500),
-                    "Info": info
-                }
-                packet_data.append(packet)
-                
-                time.sleep(0.1)  # Simulate processing time
+            packets_df = simulate_capture_packets(10)
             
             # Display packet capture results
-            st.success(f"Captured {len(packet_data)} packets")
+            st.success(f"Captured {len(packets_df)} packets")
             
             # Display captured packets
-            packets_df = pd.DataFrame(packet_data)
             st.dataframe(packets_df, use_container_width=True)
             
             # Option to save capture
             st.download_button(
                 label="Save Capture (Demo)",
-                data=base64.b64encode(b"Mock PCAP data").decode(),
+                data=b"Mock PCAP data",
                 file_name="capture.pcap",
                 mime="application/octet-stream"
             )
 
 # Footer
 st.divider()
-st.caption("© 2025 - nSocCSP | Incident Response Module | Last updated: " + datetime.datetime.now().strftime("%Y-%m-%d %H:%M"))
\ No newline at end of file
+st.caption("© 2025 - nSocCSP | Incident Response Module | Last updated: " + cached_footer_timestamp())
\ No newline at end of file
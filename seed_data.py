@@ -2,9 +2,13 @@
 Script to seed the database with initial sample data.
 """
 
+import csv
 import datetime
+import enum
+import io
 import random
-from sqlalchemy import create_engine, text
+import numpy as np
+from sqlalchemy import create_engine, insert, text
 from sqlalchemy.orm import sessionmaker
 import os
 from data.mock_generator import (
@@ -22,8 +26,8 @@ from database.models import (
     SecurityEvent,
     NetworkTraffic,
     TopologyChange,
-    DeviceStatus,
-    AlertSeverity
+    STATUS_BY_VALUE,
+    SEVERITY_BY_VALUE
 )
 
 # Get database URL from environment variables
@@ -31,43 +35,72 @@ DATABASE_URL = os.environ.get('DATABASE_URL')
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is not set")
 
-# Create engine and session
+# Device columns copied as-is from generate_device_inventory()
+DEVICE_FIELDS = (
+    'device_id',
+    'device_name',
+    'device_type',
+    'manufacturer',
+    'model',
+    'ip_address',
+    'mac_address',
+    'os_version',
+    'network',
+    'location'
+)
+
+# Create engine and session; seeding runs as a single transaction, so skip autoflush
 engine = create_engine(DATABASE_URL)
-Session = sessionmaker(bind=engine)
+Session = sessionmaker(bind=engine, autoflush=False)
 session = Session()
 
+def bulk_load(model, rows):
+    """Bulk load rows with PostgreSQL COPY, falling back to a batched insert"""
+    if not rows:
+        return
+    
+    if engine.dialect.driver != 'psycopg2':
+        session.execute(insert(model), rows)
+        return
+    
+    # Stream the rows as CSV; enums are stored by name, and None becomes an unquoted NULL
+    columns = list(rows[0])
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        [value.name if isinstance(value, enum.Enum) else value for value in (row[column] for column in columns)]
+        for row in rows
+    )
+    buffer.seek(0)
+    
+    # COPY on the session's own connection so it commits with the rest of the seed
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {model.__tablename__} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+            buffer
+        )
+    finally:
+        cursor.close()
+
 def seed_devices(count=10):
     """Seed network devices"""
     print(f"Seeding {count} network devices...")
     
     devices = generate_device_inventory(count)
-    device_ids = []
+    last_updated = datetime.datetime.now()
     
-    for device_data in devices:
-        # Convert status to enum
-        status_str = device_data['status']
-        
-        # Create a device object
-        device = NetworkDevice(
-            device_id=device_data['device_id'],
-            device_name=device_data['device_name'],
-            device_type=device_data['device_type'],
-            manufacturer=device_data['manufacturer'],
-            model=device_data['model'],
-            ip_address=device_data['ip_address'],
-            mac_address=device_data['mac_address'],
-            os_version=device_data['os_version'],
-            status=DeviceStatus(status_str),
-            network=device_data['network'],
-            location=device_data['location'],
-            last_updated=datetime.datetime.now()
-        )
-        
-        session.add(device)
-        session.flush()  # Flush to get the ID
-        device_ids.append(device.id)
+    # Zip the generator's columns into rows; tolist() turns numpy scalars into plain Python values
+    columns = [np.asarray(devices[field]).tolist() for field in DEVICE_FIELDS]
+    statuses = [STATUS_BY_VALUE[status] for status in devices['status']]
+    rows = [
+        dict(zip(DEVICE_FIELDS, values), status=status, last_updated=last_updated)
+        for values, status in zip(zip(*columns), statuses)
+    ]
+    
+    # Insert all devices in one batch, returning the new IDs in row order
+    stmt = insert(NetworkDevice).returning(NetworkDevice.id, sort_by_parameter_order=True)
+    device_ids = list(session.scalars(stmt, rows))
     
-    session.commit()
     print(f"Added {len(device_ids)} devices")
     return device_ids
 
@@ -77,56 +110,46 @@ def seed_security_events(count=20, device_ids=None):
     
     events = generate_security_events(count)
     
-    for event_data in events:
-        # Link to a random device if available
-        device_id = None
-        if device_ids:
-            device_id = random.choice(device_ids)
-            
-        # Convert severity to enum and make it lowercase to match the enum values
-        severity_str = event_data['severity']
-        
-        # Handle the timestamp (it's already a datetime object)
-        timestamp = event_data['timestamp']
-        
-        # Create an event object
-        event = SecurityEvent(
-            device_id=device_id,
-            timestamp=timestamp,
-            event_type=event_data['event_type'],
-            source_ip=event_data['source_ip'],
-            destination_ip=event_data.get('destination_ip'),
-            description=event_data['description'],
-            severity=AlertSeverity(severity_str.lower()),
-            is_resolved=event_data.get('is_resolved', False)
-        )
-        
-        session.add(event)
+    rows = [
+        {
+            # Link to a random device if available
+            'device_id': random.choice(device_ids) if device_ids else None,
+            'timestamp': event_data['timestamp'],
+            'event_type': event_data['event_type'],
+            'source_ip': event_data['source_ip'],
+            'destination_ip': event_data.get('destination_ip'),
+            'description': event_data['description'],
+            # Convert severity to enum and make it lowercase to match the enum values
+            'severity': SEVERITY_BY_VALUE[event_data['severity'].lower()],
+            'is_resolved': event_data.get('is_resolved', False)
+        }
+        for event_data in events
+    ]
     
-    session.commit()
+    # Load all events in one COPY (or batched insert off PostgreSQL)
+    bulk_load(SecurityEvent, rows)
     print(f"Added {count} security events")
 
 def seed_performance_metrics(device_ids, points_per_device=24):
     """Seed device performance metrics"""
     print(f"Seeding performance metrics for {len(device_ids)} devices...")
     
-    for device_id in device_ids:
-        metrics = generate_system_metrics(points_per_device)
-        
-        for metric_data in metrics:
-            # Create a metric object
-            metric = DevicePerformanceMetric(
-                device_id=device_id,
-                timestamp=metric_data['timestamp'],
-                cpu_usage=metric_data['cpu_usage'],
-                memory_usage=metric_data['memory_usage'],
-                disk_io=metric_data['disk_io'],
-                network_throughput=metric_data['network_throughput']
-            )
-            
-            session.add(metric)
-    
-    session.commit()
+    rows = [
+        {
+            'device_id': device_id,
+            'timestamp': metric_data['timestamp'],
+            'cpu_usage': metric_data['cpu_usage'],
+            'memory_usage': metric_data['memory_usage'],
+            'disk_io': metric_data['disk_io'],
+            'network_throughput': metric_data['network_throughput']
+        }
+        for device_id in device_ids
+        for metric_data in generate_system_metrics(points_per_device)
+    ]
+    
+    # Insert all metrics in one batch
+    if rows:
+        session.execute(insert(DevicePerformanceMetric), rows)
     print(f"Added {len(device_ids) * points_per_device} performance metrics")
 
 def seed_network_traffic(count=100):
@@ -135,21 +158,21 @@ def seed_network_traffic(count=100):
     
     traffic_data = generate_network_traffic(hours=24, count=count)
     
-    for traffic in traffic_data:
-        # Create a traffic object
-        traffic_record = NetworkTraffic(
-            timestamp=traffic['timestamp'],
-            source_ip=traffic['source_ip'],
-            destination_ip=traffic['destination_ip'],
-            protocol=traffic['protocol'],
-            port=traffic['port'],
-            bytes_transferred=traffic['bytes_transferred'],
-            packet_count=random.randint(1, 100)
-        )
-        
-        session.add(traffic_record)
+    rows = [
+        {
+            'timestamp': traffic['timestamp'],
+            'source_ip': traffic['source_ip'],
+            'destination_ip': traffic['destination_ip'],
+            'protocol': traffic['protocol'],
+            'port': traffic['port'],
+            'bytes_transferred': traffic['bytes_transferred'],
+            'packet_count': random.randint(1, 100)
+        }
+        for traffic in traffic_data
+    ]
     
-    session.commit()
+    # Load all traffic records in one COPY (or batched insert off PostgreSQL)
+    bulk_load(NetworkTraffic, rows)
     print(f"Added {count} network traffic records")
 
 def seed_topology_changes(count=15):
@@ -158,26 +181,39 @@ def seed_topology_changes(count=15):
     
     changes = generate_topology_changes(count)
     
-    for change_data in changes:
-        # Create a topology change object
-        change = TopologyChange(
-            timestamp=change_data['timestamp'],
-            change_type=change_data['change_type'],
-            device_id=change_data['device_id'],
-            device_type=change_data['device_type'],
-            details=change_data['details']
+    rows = [
+        {
+            'timestamp': timestamp,
+            'change_type': change_type,
+            'device_id': device_id,
+            'device_type': device_type,
+            'details': details
+        }
+        for timestamp, change_type, device_id, device_type, details in zip(
+            changes['timestamp'].dt.to_pydatetime(),
+            changes['change_type'],
+            changes['device_id'],
+            changes['device_type'],
+            changes['details']
         )
-        
-        session.add(change)
+    ]
     
-    session.commit()
+    # Load all topology changes in one COPY (or batched insert off PostgreSQL)
+    bulk_load(TopologyChange, rows)
     print(f"Added {count} topology changes")
 
-def check_table_empty(table_name):
-    """Check if a table is empty"""
-    sql = text(f"SELECT COUNT(*) FROM {table_name}")
-    result = session.execute(sql).scalar()
-    return result == 0
+def check_tables_empty():
+    """Check which seeded tables are empty, in a single query"""
+    sql = text("""
+        SELECT
+            EXISTS(SELECT 1 FROM network_devices) AS devices,
+            EXISTS(SELECT 1 FROM security_events) AS events,
+            EXISTS(SELECT 1 FROM device_performance_metrics) AS metrics,
+            EXISTS(SELECT 1 FROM network_traffic) AS traffic,
+            EXISTS(SELECT 1 FROM topology_changes) AS topology
+    """)
+    row = session.execute(sql).one()
+    return tuple(not has_rows for has_rows in row)
 
 def seed_database():
     """Seed the entire database with sample data"""
@@ -185,11 +221,7 @@ def seed_database():
         print("Starting database seeding...")
         
         # Check if tables have data already
-        devices_empty = check_table_empty('network_devices')
-        events_empty = check_table_empty('security_events')
-        metrics_empty = check_table_empty('device_performance_metrics')
-        traffic_empty = check_table_empty('network_traffic')
-        topology_empty = check_table_empty('topology_changes')
+        devices_empty, events_empty, metrics_empty, traffic_empty, topology_empty = check_tables_empty()
         
         device_ids = []
         
@@ -232,6 +264,8 @@ def seed_database():
         else:
             print("Topology changes table already has data, skipping...")
         
+        # Commit every seeded table together
+        session.commit()
         print("Database seeding complete!")
     except Exception as e:
         session.rollback()
@@ -1,17 +1,40 @@
 import streamlit as st
 import datetime
 import time
-import random
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import networkx as nx
-from math import sin, cos, radians
+import numpy as np
+import math
+import plotly.io as pio
 import urllib.request
 import json
 
-# Cache the image loading to avoid repeated API calls
-@st.cache_data
+# Serialize figures with orjson, which encodes numpy arrays and datetimes natively
+pio.json.config.default_engine = "orjson"
+
+# Root of the random streams: every session spawns its own generator from it
+RNG_SEED_SEQUENCE = np.random.SeedSequence()
+MODULE_RNG = np.random.default_rng(RNG_SEED_SEQUENCE.spawn(1)[0])
+
+# Stock image URLs by query, looked up directly by load_image
+IMAGE_MAPPINGS = {
+    "network security monitoring": (
+        "https://pixabay.com/get/g861519ec27994fa594c974795bc00c023935c5b40e5bfc50a69a7020b9d0f653e03289d53c4e246f514b70a461f54c69a893b6e45b53de5fd6c7e9c293b7f6f9_1280.jpg",
+        "https://pixabay.com/get/gdc3a38e3e42ebbb448dae93ddf1f05b63207dedc48d5ed550ccd516910efd587354be4357d8493b117497d6181c803717a0296dbd96841e37c3c3c85fb43efba_1280.jpg",
+        "https://pixabay.com/get/gd342e4a5ac6a455f06ab4972d3da181c634e693e5f3c972e77bd7ef7b248ff769914a9863a6655f2a5658e68b73a510af90745430eca16b00e052805e7bc7e80_1280.jpg",
+        "https://pixabay.com/get/g3cd079ceb002f73c25904bc92b194bb2cb0c6aa56c6fbfe2bb89d74fc2ff33cc5e20228213fbdef1da92e3a91b1a28f678cad84e9023c4a62e35ad2606b0e5ed_1280.jpg"
+    ),
+    "cybersecurity dashboard": (
+        "https://pixabay.com/get/g209ee898a80ddd319d9ccd3ea90ff8ba28543689253df30a104d4137d0aa724efe8373ffa445c9d8aaf67b6133e7f38f3b4b6c9c6716e0393740310188a1bc24_1280.jpg",
+        "https://pixabay.com/get/ge61a6c24764c476a10be7374c8dd700be45b781dcfeafca30e2837158edb5d1eb42dee41c739a321a082a1785a257bbb1f1d674c9476866ca9d943f653edfad7_1280.jpg",
+        "https://pixabay.com/get/gffcf432348ae425f722cd706631e208603e086e513a500e6a091f2c56432b919f61400ab06cc304b682974b5c42c0357f3c176e2a9fe97e9ee986d9214d8ea7f_1280.jpg",
+        "https://pixabay.com/get/g95936f73f40fca3a3881844227ba724e12a5c56676df58121ff3526146cd1a5e91638b5d4117c340223a4442a013f313f2b54c9950371d8baebdbd2943a1d67e_1280.jpg"
+    ),
+    "network traffic visualization": (
+        "https://pixabay.com/get/g2a66addeba13910dc5f0306eedfcc9186f111ac20afee15dbdd635065f6fc06163166dd3232a6185e85fa134f66031f93aa4e5a1dd27f54c9dabd119d4d53973_1280.jpg",
+        "https://pixabay.com/get/gbc822417b24f8c3371a367dce165b7072391dc04073e7dadd2800f1810948387bc649bb0e93de667f9d3006417d80ca71f2219d08e10f00f80c94fcc066568d8_1280.jpg"
+    )
+}
+
 def load_image(query, index=0):
     """
     Load an image from the provided stock images.
@@ -22,29 +45,60 @@ def load_image(query, index=0):
     Returns:
         URL to the image if found, None otherwise
     """
-    image_mappings = {
-        "network security monitoring": [
-            "https://pixabay.com/get/g861519ec27994fa594c974795bc00c023935c5b40e5bfc50a69a7020b9d0f653e03289d53c4e246f514b70a461f54c69a893b6e45b53de5fd6c7e9c293b7f6f9_1280.jpg",
-            "https://pixabay.com/get/gdc3a38e3e42ebbb448dae93ddf1f05b63207dedc48d5ed550ccd516910efd587354be4357d8493b117497d6181c803717a0296dbd96841e37c3c3c85fb43efba_1280.jpg",
-            "https://pixabay.com/get/gd342e4a5ac6a455f06ab4972d3da181c634e693e5f3c972e77bd7ef7b248ff769914a9863a6655f2a5658e68b73a510af90745430eca16b00e052805e7bc7e80_1280.jpg",
-            "https://pixabay.com/get/g3cd079ceb002f73c25904bc92b194bb2cb0c6aa56c6fbfe2bb89d74fc2ff33cc5e20228213fbdef1da92e3a91b1a28f678cad84e9023c4a62e35ad2606b0e5ed_1280.jpg"
-        ],
-        "cybersecurity dashboard": [
-            "https://pixabay.com/get/g209ee898a80ddd319d9ccd3ea90ff8ba28543689253df30a104d4137d0aa724efe8373ffa445c9d8aaf67b6133e7f38f3b4b6c9c6716e0393740310188a1bc24_1280.jpg",
-            "https://pixabay.com/get/ge61a6c24764c476a10be7374c8dd700be45b781dcfeafca30e2837158edb5d1eb42dee41c739a321a082a1785a257bbb1f1d674c9476866ca9d943f653edfad7_1280.jpg",
-            "https://pixabay.com/get/gffcf432348ae425f722cd706631e208603e086e513a500e6a091f2c56432b919f61400ab06cc304b682974b5c42c0357f3c176e2a9fe97e9ee986d9214d8ea7f_1280.jpg",
-            "https://pixabay.com/get/g95936f73f40fca3a3881844227ba724e12a5c56676df58121ff3526146cd1a5e91638b5d4117c340223a4442a013f313f2b54c9950371d8baebdbd2943a1d67e_1280.jpg"
-        ],
-        "network traffic visualization": [
-            "https://pixabay.com/get/g2a66addeba13910dc5f0306eedfcc9186f111ac20afee15dbdd635065f6fc06163166dd3232a6185e85fa134f66031f93aa4e5a1dd27f54c9dabd119d4d53973_1280.jpg",
-            "https://pixabay.com/get/gbc822417b24f8c3371a367dce165b7072391dc04073e7dadd2800f1810948387bc649bb0e93de667f9d3006417d80ca71f2219d08e10f00f80c94fcc066568d8_1280.jpg"
-        ]
-    }
-    
-    if query in image_mappings and index < len(image_mappings[query]):
-        return image_mappings[query][index]
+    urls = IMAGE_MAPPINGS.get(query)
+    if urls and index < len(urls):
+        return urls[index]
     return None
 
+# Project phases as (weeks elapsed before the next phase, phase number, description,
+# first day of the phase, phase length in days); the last phase is ongoing
+PHASE_TABLE = (
+    (2, 1, "Inventory, topology, and documentation", 0, 14),
+    (6, 2, "SNMP/sFlow, alerting, STP tracking", 14, 28),
+    (10, 3, "VLAN correctness, rogue devices, loop control", 42, 28),
+    (float("inf"), 4, "Regular audits, updates, and optimizations", None, None)
+)
+
+# Cache the phase per project start and minute, so reruns skip the phase lookup
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_phase_snapshot(start_time, now_bucket):
+    """
+    Calculate the current phase and the progress within it.
+    
+    Args:
+        start_time: Project start time, in seconds since the epoch
+        now_bucket: Current time in whole minutes since the epoch
+        
+    Returns:
+        Tuple: (phase_number, phase_description, progress), with progress
+        from 0.0 to 1.0 (always 0.0 for the ongoing phase)
+    """
+    # Compress the timeline for demo purposes (1 day = 1 week)
+    elapsed_days = max(now_bucket * 60 - start_time, 0) / (60 * 60 * 24)
+    elapsed_weeks = int(elapsed_days)
+    
+    phase, description, start_day, length_days = next(
+        (phase, description, start_day, length_days)
+        for max_weeks, phase, description, start_day, length_days in PHASE_TABLE
+        if elapsed_weeks < max_weeks
+    )
+    progress = min((elapsed_days - start_day) / length_days, 1.0) if length_days else 0.0
+    return phase, description, progress
+
+def get_phase_snapshot():
+    """
+    Look up the cached phase snapshot for this session's project start time.
+    
+    Returns:
+        Tuple: (phase_number, phase_description, progress)
+    """
+    current_time = time.time()
+    # Use a "fixed" start time (app launch time in session state)
+    if 'project_start_time' not in st.session_state:
+        st.session_state.project_start_time = current_time
+    
+    return cached_phase_snapshot(st.session_state.project_start_time, int(current_time // 60))
+
 def get_current_phase():
     """
     Calculate the current phase based on the current date.
@@ -54,24 +108,8 @@ def get_current_phase():
     Returns:
         Tuple: (phase_number, phase_description)
     """
-    # For demonstration, we'll calculate phases relative to app run time
-    # In a real application, this would be based on actual project timeline
-    current_time = time.time()
-    # Use a "fixed" start time (app launch time in session state)
-    if 'project_start_time' not in st.session_state:
-        st.session_state.project_start_time = current_time
-        
-    # Compress the timeline for demo purposes (1 day = 1 week)
-    elapsed_weeks = int((current_time - st.session_state.project_start_time) / (60 * 60 * 24))
-    
-    if elapsed_weeks < 2:
-        return 1, "Inventory, topology, and documentation"
-    elif elapsed_weeks < 6:
-        return 2, "SNMP/sFlow, alerting, STP tracking"
-    elif elapsed_weeks < 10:
-        return 3, "VLAN correctness, rogue devices, loop control"
-    else:
-        return 4, "Regular audits, updates, and optimizations"
+    phase, description, _ = get_phase_snapshot()
+    return phase, description
 
 def get_phase_progress():
     """
@@ -80,120 +118,254 @@ def get_phase_progress():
     Returns:
         float: Progress percentage (0.0 to 1.0)
     """
-    current_time = time.time()
+    return get_phase_snapshot()[2]
+
+def sample_unique_edges(num_nodes, num_edges, rng):
+    """
+    Sample distinct undirected edges without self-loops.
     
-    if 'project_start_time' not in st.session_state:
-        st.session_state.project_start_time = current_time
+    Args:
+        num_nodes: Number of nodes to connect
+        num_edges: Number of edges to sample, capped at the complete graph
+        rng: numpy Generator to draw from
         
-    elapsed_days = (current_time - st.session_state.project_start_time) / (60 * 60 * 24)
-    current_phase, _ = get_current_phase()
-    
-    if current_phase == 1:
-        # Phase 1: Weeks 1-2 (days 0-14)
-        return min(elapsed_days / 14, 1.0)
-    elif current_phase == 2:
-        # Phase 2: Weeks 3-6 (days 14-42)
-        return min((elapsed_days - 14) / 28, 1.0)
-    elif current_phase == 3:
-        # Phase 3: Weeks 7-10 (days 42-70)
-        return min((elapsed_days - 42) / 28, 1.0)
-    else:
-        # Ongoing phase
-        return 0.0  # Continuous progress
+    Returns:
+        ndarray: (num_edges, 2) array of node pairs, smaller node first
+    """
+    max_edges = num_nodes * (num_nodes - 1) // 2
+    num_edges = min(num_edges, max_edges)
+    
+    # Dense graphs: pick pairs straight from the complete graph without replacement
+    if 2 * num_edges > max_edges:
+        pairs = np.column_stack(np.triu_indices(num_nodes, k=1))
+        return pairs[rng.choice(max_edges, size=num_edges, replace=False)]
+    
+    # Sparse graphs: oversample candidate pairs in batches, keeping distinct pairs in draw order
+    edges = np.empty((0, 2), dtype=np.int64)
+    while len(edges) < num_edges:
+        candidates = rng.integers(0, num_nodes, size=(2 * num_edges, 2))
+        candidates = np.sort(candidates[candidates[:, 0] != candidates[:, 1]], axis=1)
+        edges = np.concatenate((edges, candidates))
+        _, first_seen = np.unique(edges, axis=0, return_index=True)
+        edges = edges[np.sort(first_seen)]
+    return edges[:num_edges]
+
+# Node attribute vocabularies for create_network_graph, indexed by the drawn codes
+NODE_TYPES = np.array(['server', 'router', 'switch', 'client'])
+NODE_STATUSES = np.array(['online', 'warning', 'offline'])
+NODE_STATUS_WEIGHTS = [0.6, 0.2, 0.2]
+
+# Marker size per NODE_TYPES entry and color per NODE_STATUSES entry
+NODE_TYPE_SIZES = np.array([15, 12, 12, 8])
+NODE_STATUS_COLORS = np.array(['green', 'orange', 'red'])
 
-def create_network_graph(num_nodes=20, num_edges=30):
+# Cache the layout per node count; graphs of the same size share their coordinates
+@st.cache_data(show_spinner=False)
+def circle_layout(num_nodes, radius=5):
+    """
+    Place nodes evenly on a circle.
+    
+    This is closed-form and O(num_nodes); avoid swapping in a force-directed
+    layout (spring_layout, ForceAtlas2), which iterates over the whole graph
+    on every rebuild.
+    
+    Args:
+        num_nodes: Number of nodes to place
+        radius: Circle radius
+        
+    Returns:
+        ndarray: (num_nodes, 2) coordinates, row i holding node i
+    """
+    angles = np.linspace(0, 2 * np.pi, num_nodes, endpoint=False)
+    return np.column_stack((radius * np.cos(angles), radius * np.sin(angles)))
+
+# Cache the generated graphs; the seed makes each (num_nodes, num_edges, seed) reproducible
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False)
+def create_network_graph(num_nodes=20, num_edges=30, seed=0):
     """
     Create a random network graph for visualization.
     
     Args:
         num_nodes: Number of nodes in the graph
         num_edges: Number of edges to create
+        seed: Seed for the node attribute and edge draws
         
     Returns:
-        tuple: (G, pos, edge_x, edge_y, node_x, node_y, node_text, node_size)
+        tuple: (nodes, edges, pos, edge_x, edge_y, node_x, node_y, node_text, node_size,
+        node_color, node_types, node_statuses), with nodes the node IDs, edges an
+        (E, 2) array of node pairs, the edge coordinates (NaN-separated) and
+        per-node values as numpy arrays in node order
     """
-    # Create a graph
-    G = nx.Graph()
+    rng = np.random.default_rng(seed)
+    nodes = np.arange(num_nodes, dtype=np.int32)
     
-    # Add nodes
-    for i in range(num_nodes):
-        node_type = random.choice(['server', 'router', 'switch', 'client'])
-        node_status = random.choice(['online', 'online', 'online', 'warning', 'offline'])
-        G.add_node(i, type=node_type, status=node_status)
+    # Draw node attributes as uint8 codes into NODE_TYPES / NODE_STATUSES, row i holding node i
+    type_codes = rng.integers(0, len(NODE_TYPES), size=num_nodes, dtype=np.uint8)
+    status_codes = rng.choice(len(NODE_STATUSES), size=num_nodes, p=NODE_STATUS_WEIGHTS).astype(np.uint8)
+    node_types = NODE_TYPES[type_codes]
+    node_statuses = NODE_STATUSES[status_codes]
     
     # Add edges (connections)
-    while len(G.edges) < num_edges:
-        u = random.randint(0, num_nodes-1)
-        v = random.randint(0, num_nodes-1)
-        if u != v:
-            G.add_edge(u, v)
-    
-    # Create positions for nodes in a circle layout
-    pos = {}
-    radius = 5
-    for i in range(num_nodes):
-        angle = i * (360 / num_nodes)
-        pos[i] = (radius * cos(radians(angle)), radius * sin(radians(angle)))
-    
-    # Create edge traces
-    edge_x = []
-    edge_y = []
-    for edge in G.edges():
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-        edge_x.extend([x0, x1, None])
-        edge_y.extend([y0, y1, None])
+    edges = sample_unique_edges(num_nodes, num_edges, rng).astype(np.int32)
+    
+    # Node coordinates as an (N, 2) array, row i holding node i
+    coords = circle_layout(num_nodes)
+    pos = dict(enumerate(map(tuple, coords)))
+    
+    # Create edge traces: each edge is [start, end, NaN] so Plotly breaks the line between edges
+    segments = np.full((len(edges), 3, 2), np.nan)
+    segments[:, 0] = coords[edges[:, 0]]
+    segments[:, 1] = coords[edges[:, 1]]
+    edge_x = segments[:, :, 0].ravel()
+    edge_y = segments[:, :, 1].ravel()
     
     # Create node traces
-    node_x = []
-    node_y = []
-    node_text = []
-    node_size = []
-    node_color = []
-    
-    for node in G.nodes():
-        x, y = pos[node]
-        node_x.append(x)
-        node_y.append(y)
-        
-        node_type = G.nodes[node]['type']
-        node_status = G.nodes[node]['status']
-        
-        # Set node size based on type
-        if node_type == 'server':
-            size = 15
-        elif node_type in ['router', 'switch']:
-            size = 12
-        else:
-            size = 8
-        node_size.append(size)
-        
-        # Set node color based on status
-        if node_status == 'online':
-            color = 'green'
-        elif node_status == 'warning':
-            color = 'orange'
-        else:  # offline
-            color = 'red'
-        node_color.append(color)
+    node_x = coords[:, 0]
+    node_y = coords[:, 1]
+    
+    # Node sizes by type and colors by status, looked up from the drawn codes
+    node_size = NODE_TYPE_SIZES[type_codes]
+    node_color = NODE_STATUS_COLORS[status_codes]
+    
+    # Create node hover text, concatenated over the whole arrays
+    node_text = np.char.add(
+        np.char.add(np.char.add("ID: ", nodes.astype(str)), np.char.add("<br>Type: ", node_types)),
+        np.char.add("<br>Status: ", node_statuses)
+    )
+    
+    return (
+        nodes, edges, pos, edge_x, edge_y,
+        node_x, node_y, node_text, node_size, node_color,
+        node_types, node_statuses
+    )
+
+# Cache the diagram traces alongside the graph they are drawn from
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False)
+def network_graph_traces(num_nodes=20, num_edges=30, seed=0):
+    """
+    Build the WebGL edge and node traces for a create_network_graph graph.
+    
+    The traces are plain dicts, ready to pass to go.Figure or add_trace
+    without building graph_objs trace objects first.
+    
+    Args:
+        num_nodes: Number of nodes in the graph
+        num_edges: Number of edges to create
+        seed: Seed for the node attribute and edge draws
         
-        # Create node hover text
-        node_text.append(f"ID: {node}<br>Type: {node_type}<br>Status: {node_status}")
+    Returns:
+        tuple: (edge_trace, node_trace), with nodes colored by status and
+        sized by type
+    """
+    (_, _, _, edge_x, edge_y, node_x, node_y, node_text, node_size, node_color,
+     _, _) = create_network_graph(num_nodes=num_nodes, num_edges=num_edges, seed=seed)
     
-    return G, pos, edge_x, edge_y, node_x, node_y, node_text, node_size, node_color
+    edge_trace = dict(
+        type='scattergl',
+        x=edge_x, y=edge_y,
+        line=dict(width=0.5, color='#888'),
+        hoverinfo='none',
+        mode='lines'
+    )
+    node_trace = dict(
+        type='scattergl',
+        x=node_x, y=node_y,
+        mode='markers',
+        hoverinfo='text',
+        text=node_text,
+        marker=dict(
+            color=node_color,
+            size=node_size,
+            line=dict(width=1, color='#333')
+        )
+    )
+    return edge_trace, node_trace
+
+# Units used by format_size, one per factor of 1024
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 def format_size(size_bytes):
     """Format bytes to human-readable size"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} PB"
+    # Unit index from the magnitude: 10 bits per step of 1024
+    if isinstance(size_bytes, int):
+        idx = max(size_bytes.bit_length() - 1, 0) // 10 if size_bytes > 0 else 0
+    else:
+        idx = int(math.log2(size_bytes)) // 10 if size_bytes >= 1 else 0
+    idx = min(idx, len(SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {SIZE_UNITS[idx]}"
+
+def format_sizes(sizes):
+    """
+    Format an array of byte counts to human-readable sizes.
+    
+    Args:
+        sizes: Array-like of byte counts
+        
+    Returns:
+        ndarray: Formatted sizes, as format_size would give for each value
+    """
+    sizes = np.asarray(sizes, dtype=float)
+    idx = (np.log2(np.maximum(sizes, 1)) // 10).astype(int).clip(0, len(SIZE_UNITS) - 1)
+    return np.char.add(np.char.mod("%.1f ", sizes / np.exp2(idx * 10)), np.array(SIZE_UNITS)[idx])
+
+def get_rng():
+    """
+    Get the numpy random generator for the current Streamlit session.
+    
+    Each session gets its own PCG64 generator spawned from RNG_SEED_SEQUENCE,
+    so sessions never share RNG state; outside a Streamlit run (e.g. when
+    seeding the database) the module-level generator is used.
+    
+    Returns:
+        np.random.Generator: The session's generator
+    """
+    if not st.runtime.exists():
+        return MODULE_RNG
+    if 'rng' not in st.session_state:
+        st.session_state.rng = np.random.default_rng(RNG_SEED_SEQUENCE.spawn(1)[0])
+    return st.session_state.rng
 
-def get_random_ip():
+def get_random_ip(rng=None):
     """Generate a random IP address"""
-    return f"{random.randint(10, 192)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    rng = rng if rng is not None else get_rng()
+    octets = rng.integers((10, 0, 0, 1), (193, 256, 256, 255))
+    return '.'.join(map(str, octets.tolist()))
 
-def get_random_mac():
+def get_random_mac(rng=None):
     """Generate a random MAC address"""
-    return ":".join([f"{random.randint(0, 255):02x}" for _ in range(6)])
+    rng = rng if rng is not None else get_rng()
+    return ":".join(f"{b:02x}" for b in rng.integers(0, 256, 6).tolist())
+
+def get_random_ips(n, rng=None):
+    """
+    Generate random IP addresses in bulk, in the same ranges as get_random_ip.
+    
+    Args:
+        n: Number of addresses to generate
+        rng: Optional numpy Generator to draw from, defaulting to the session's
+        
+    Returns:
+        list: n IP address strings
+    """
+    rng = rng if rng is not None else get_rng()
+    octets = np.column_stack((
+        rng.integers(10, 193, n),
+        rng.integers(0, 256, (n, 2)),
+        rng.integers(1, 255, n)
+    ))
+    return ['.'.join(map(str, row)) for row in octets.tolist()]
+
+def get_random_macs(n, rng=None):
+    """
+    Generate random MAC addresses in bulk, in the same format as get_random_mac.
+    
+    Args:
+        n: Number of addresses to generate
+        rng: Optional numpy Generator to draw from, defaulting to the session's
+        
+    Returns:
+        list: n MAC address strings
+    """
+    rng = rng if rng is not None else get_rng()
+    mac_bytes = rng.integers(0, 256, (n, 6))
+    return [":".join(f"{b:02x}" for b in row) for row in mac_bytes.tolist()]
@@ -1,40 +1,175 @@
-import nmap
+import glob
+import io
+import os
 import subprocess
-import json
+import orjson
+import streamlit as st
+from lxml import etree
 from datetime import datetime
+from uuid import uuid4
 
+# nmap flag for each scan option, in the order they are passed to nmap
+NMAP_OPTION_FLAGS = {
+    "Host Discovery": '-sn',
+    "Port Scanning": '-sS',
+    "OS Detection": '-O',
+    "Service Detection": '-sV'
+}
+
+# Cache scan results per network and option set, since nmap runs take seconds to minutes;
+# pass options as a sorted tuple so reordered selections share a cache entry
+@st.cache_data(ttl=3600, max_entries=32, show_spinner="Running nmap...")
 def run_nmap_scan(network, options):
     """Run nmap scan with specified options"""
-    nm = nmap.PortScanner()
-    scan_args = ''
-    
-    if "Host Discovery" in options:
-        scan_args += ' -sn'
-    if "Port Scanning" in options:
-        scan_args += ' -sS'
-    if "OS Detection" in options:
-        scan_args += ' -O'
-    if "Service Detection" in options:
-        scan_args += ' -sV'
-        
-    results = nm.scan(hosts=network, arguments=scan_args)
+    scan_args = [flag for option, flag in NMAP_OPTION_FLAGS.items() if option in options]
+    
+    # Have nmap write its XML report to stdout and parse it host by host
+    cmd = ['nmap', '-oX', '-', *scan_args, network]
+    process = subprocess.run(cmd, capture_output=True)
+    if process.returncode != 0 or not process.stdout.strip():
+        raise RuntimeError(process.stderr.decode(errors='replace').strip() or f'nmap exited with status {process.returncode}')
+    
+    results = {'nmap': {'command_line': ' '.join(cmd), 'scaninfo': {}, 'scanstats': {}}, 'scan': {}}
+    for elem in parse_nmap_report(io.BytesIO(process.stdout)):
+        if elem.tag == 'host':
+            host = parse_nmap_host(elem)
+            address = host['addresses'].get('ipv4') or host['addresses'].get('ipv6')
+            results['scan'][address] = host
+        elif elem.tag == 'scaninfo':
+            results['nmap']['scaninfo'][elem.get('protocol')] = {
+                'method': elem.get('type', ''),
+                'services': elem.get('services', '')
+            }
+        elif elem.tag == 'finished':
+            results['nmap']['scanstats'].update(timestr=elem.get('timestr', ''), elapsed=elem.get('elapsed', ''))
+        elif elem.tag == 'hosts':
+            results['nmap']['scanstats'].update(
+                uphosts=elem.get('up', ''),
+                downhosts=elem.get('down', ''),
+                totalhosts=elem.get('total', '')
+            )
+        elem.clear(keep_tail=True)
     return results
 
-def run_tcpdump_scan(interface, duration=30):
-    """Run tcpdump capture"""
+def parse_nmap_report(xml_source):
+    """Stream the host, scaninfo and runstats elements of an nmap XML report; callers clear each one once read"""
+    for _, elem in etree.iterparse(xml_source, events=('end',), tag=('host', 'scaninfo', 'finished', 'hosts')):
+        yield elem
+
+def parse_nmap_host(elem):
+    """Convert an nmap XML host element to a dict shaped like python-nmap's host entries"""
+    status = elem.find('status')
+    host = {
+        'hostnames': [
+            {'name': hostname.get('name', ''), 'type': hostname.get('type', '')}
+            for hostname in elem.iterfind('hostnames/hostname')
+        ],
+        'addresses': {
+            address.get('addrtype'): address.get('addr')
+            for address in elem.iterfind('address')
+        },
+        'vendor': {
+            address.get('addr'): address.get('vendor')
+            for address in elem.iterfind('address')
+            if address.get('vendor')
+        },
+        'status': {
+            'state': status.get('state', '') if status is not None else '',
+            'reason': status.get('reason', '') if status is not None else ''
+        }
+    }
+    
+    # Ports grouped by protocol, e.g. host['tcp'][22]
+    for port in elem.iterfind('ports/port'):
+        state = port.find('state')
+        service = port.find('service')
+        service = service.attrib if service is not None else {}
+        host.setdefault(port.get('protocol'), {})[int(port.get('portid'))] = {
+            'state': state.get('state', '') if state is not None else '',
+            'reason': state.get('reason', '') if state is not None else '',
+            'name': service.get('name', ''),
+            'product': service.get('product', ''),
+            'version': service.get('version', ''),
+            'extrainfo': service.get('extrainfo', ''),
+            'conf': service.get('conf', '')
+        }
+    
+    osmatches = [
+        {'name': osmatch.get('name', ''), 'accuracy': osmatch.get('accuracy', '')}
+        for osmatch in elem.iterfind('os/osmatch')
+    ]
+    if osmatches:
+        host['osmatch'] = osmatches
+    
+    return host
+
+def start_tcpdump_scan(interface, duration=30):
+    """Start a tcpdump capture in the background, returning (process, pcap_path)"""
+    pcap_path = f'/tmp/capture_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pcap'
     cmd = [
         'sudo', 'tcpdump',
         '-i', interface,
         '-G', str(duration),
         '-W', '1',
-        '-w', f'/tmp/capture_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pcap'
+        '-w', pcap_path
     ]
     
-    process = subprocess.run(cmd, capture_output=True, text=True)
-    return process.stdout
+    # tcpdump writes packets straight to pcap_path; only its capture stats on stderr are kept
+    process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    return process, pcap_path
+
+def finish_tcpdump_scan(process, timeout=None):
+    """Wait for a tcpdump capture to end and return its capture stats"""
+    _, stderr = process.communicate(timeout=timeout)
+    return stderr
+
+def run_tcpdump_scan(interface, duration=30):
+    """Run tcpdump capture"""
+    process, _ = start_tcpdump_scan(interface, duration)
+    return finish_tcpdump_scan(process)
+
+def dump_scan_results(results):
+    """Serialize scan results to JSON bytes; port numbers are kept as (stringified) keys"""
+    return orjson.dumps(results, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+def load_scan_results(data):
+    """Deserialize scan results from JSON bytes or str"""
+    return orjson.loads(data)
+
+def start_tcpdump_rotation(interface, file_size_mb=100, file_count=10):
+    """Start one long-running tcpdump that rotates through file_count pcaps of file_size_mb each, returning (process, pcap_prefix)"""
+    # With -C, tcpdump appends the file number to the -w name (capture.pcap0, capture.pcap1, ...)
+    pcap_prefix = f'/tmp/audit_{uuid4().hex}.pcap'
+    cmd = [
+        'sudo', 'tcpdump',
+        '-i', interface,
+        '-C', str(file_size_mb),
+        '-W', str(file_count),
+        '-w', pcap_prefix
+    ]
+    
+    process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    return process, pcap_prefix
+
+def list_pcaps(pcap_prefix):
+    """List the rotated pcaps of a capture, newest first"""
+    return sorted(glob.glob(f'{glob.escape(pcap_prefix)}*'), key=os.path.getmtime, reverse=True)
+
+def list_firewall_ruleset():
+    """Return the nftables ruleset as parsed JSON, queried in-process when the libnftables bindings are installed"""
+    try:
+        from nftables import Nftables
+    except ImportError:
+        # Without the bindings, ask the nft CLI for the same JSON
+        process = subprocess.run(['sudo', 'nft', '-j', 'list', 'ruleset'], capture_output=True)
+        return orjson.loads(process.stdout) if process.returncode == 0 else None
+    
+    nft = Nftables()
+    rc, output, _ = nft.json_cmd({'nftables': [{'list': {'ruleset': None}}]})
+    return output if rc == 0 else None
 
 def check_firewall_rules():
     """Check firewall configuration"""
     cmd = ['sudo', 'iptables', '-L', '-n', '-v']
     process = subprocess.run(cmd, capture_output=True, text=True)
-    return process.stdout
\ No newline at end of file
+    return process.stdout